@@ -23,7 +23,7 @@ on some of the previous ones):
   - exceptions, type_definitions
   - utils
   - concepts <-> iterators  (circular dependency only inside methods, it should be safe)
-  - traits, visitors
+  - traits, visitors, memoization, serialization
   - codegen
 
 """
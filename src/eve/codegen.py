@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import collections.abc
 import contextlib
 import inspect
@@ -27,6 +28,7 @@ import os
 import re
 import string
 import sys
+import tempfile
 import textwrap
 import types
 import typing
@@ -34,6 +36,7 @@ from subprocess import PIPE, Popen, run
 
 import black
 import jinja2
+import jinja2.meta
 from mako import template as mako_tpl
 
 from . import exceptions, utils
@@ -44,6 +47,7 @@ from .typingx import (
     ClassVar,
     Collection,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Mapping,
@@ -52,6 +56,7 @@ from .typingx import (
     Sequence,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
@@ -59,10 +64,33 @@ from .visitors import NodeVisitor
 
 
 SourceFormatter = Callable[[str], str]
+BatchSourceFormatter = Callable[[Sequence[str]], List[str]]
 
 #: Global dict storing registered formatters.
 SOURCE_FORMATTERS: Dict[str, SourceFormatter] = {}
 
+#: Global dict storing formatters able to process several sources at once.
+BATCH_SOURCE_FORMATTERS: Dict[str, BatchSourceFormatter] = {}
+
+#: Global settings of the source code formatting functions:
+#:
+#:   - ``production``: skip formatting completely. Generated sources are
+#:     returned as they are, which is useful for runs where nobody reads them
+#:     (environment variable ``EVE_PRODUCTION``).
+#:   - ``cache_dir``: directory of the persistent cache of formatted sources.
+#:     If ``None``, formatted sources are only cached in memory (environment
+#:     variable ``EVE_FORMATTING_CACHE_DIR``).
+FORMATTING_SETTINGS: Dict[str, Any] = {
+    "production": os.getenv("EVE_PRODUCTION", "0").lower() in ("1", "true", "yes", "on"),
+    "cache_dir": os.getenv("EVE_FORMATTING_CACHE_DIR", None),
+}
+
+_FORMATTER_VERSIONS: Dict[str, str] = {}
+
+_MAX_CACHED_SOURCES = 256
+
+_formatted_sources_cache: collections.OrderedDict[str, str] = collections.OrderedDict()
+
 
 class FormatterNameError(exceptions.EveRuntimeError):
     """Run-time error registering a new source code formatter."""
@@ -88,8 +116,15 @@ class TemplateRenderingError(exceptions.EveRuntimeError):
     ...
 
 
-def register_formatter(language: str) -> Callable[[SourceFormatter], SourceFormatter]:
-    """Register source code formatters for specific languages (decorator)."""
+def register_formatter(
+    language: str, *, version: str = ""
+) -> Callable[[SourceFormatter], SourceFormatter]:
+    """Register source code formatters for specific languages (decorator).
+
+    The `version` string of the formatter is part of the keys of the
+    formatted sources cache, thus it should change with any change
+    of the formatted output.
+    """
 
     def _decorator(formatter: SourceFormatter) -> SourceFormatter:
         if language in SOURCE_FORMATTERS:
@@ -97,13 +132,37 @@ def register_formatter(language: str) -> Callable[[SourceFormatter], SourceForma
 
         assert callable(formatter)
         SOURCE_FORMATTERS[language] = formatter
+        _FORMATTER_VERSIONS[language] = version
+
+        return formatter
+
+    return _decorator
+
+
+def register_batch_formatter(
+    language: str,
+) -> Callable[[BatchSourceFormatter], BatchSourceFormatter]:
+    """Register formatters processing several sources at once for specific languages (decorator).
+
+    Batch formatters are optional and they are only used by :func:`format_sources`
+    if a single-source formatter for the same language has also been registered.
+    """
+
+    def _decorator(formatter: BatchSourceFormatter) -> BatchSourceFormatter:
+        if language in BATCH_SOURCE_FORMATTERS:
+            raise FormatterNameError(
+                f"Another batch formatter for language '{language}' already exists"
+            )
+
+        assert callable(formatter)
+        BATCH_SOURCE_FORMATTERS[language] = formatter
 
         return formatter
 
     return _decorator
 
 
-@register_formatter("python")
+@register_formatter("python", version=f"black-{black.__version__}")
 def format_python_source(
     source: str,
     *,
@@ -132,66 +191,203 @@ def format_python_source(
     return formatted_source
 
 
-def _get_clang_format() -> Optional[str]:
-    """Return the clang-format executable, or None if not available."""
+def _get_clang_format() -> Tuple[Optional[str], str]:
+    """Return the clang-format executable and its version, or None if not available."""
     executable = os.getenv("CLANG_FORMAT_EXECUTABLE", "clang-format")
     try:
         assert isinstance(executable, str)
-        if run([executable, "--version"], capture_output=True).returncode != 0:
-            return None
+        result = run([executable, "--version"], capture_output=True, encoding="utf8")
+        if result.returncode != 0:
+            return None, ""
     except Exception:
-        return None
+        return None, ""
 
-    return executable
+    return executable, result.stdout.strip()
 
 
-_CLANG_FORMAT_EXECUTABLE = _get_clang_format()
+_CLANG_FORMAT_EXECUTABLE, _CLANG_FORMAT_VERSION = _get_clang_format()
 
 
 if _CLANG_FORMAT_EXECUTABLE is not None:
 
-    @register_formatter("cpp")
-    def format_cpp_source(
-        source: str,
-        *,
-        style: Optional[str] = None,
-        fallback_style: Optional[str] = None,
-        sort_includes: bool = False,
-    ) -> str:
-        """Format C++ source code using clang-format."""
+    def _clang_format_args(
+        style: Optional[str], fallback_style: Optional[str], sort_includes: bool
+    ) -> List[str]:
         assert isinstance(_CLANG_FORMAT_EXECUTABLE, str)
         args = [_CLANG_FORMAT_EXECUTABLE]
         if style:
             args.append(f"--style={style}")
         if fallback_style:
-            args.append(f"--fallback-style={style}")
+            args.append(f"--fallback-style={fallback_style}")
         if sort_includes:
             args.append("--sort-includes")
 
+        return args
+
+    @register_formatter("cpp", version=_CLANG_FORMAT_VERSION)
+    def format_cpp_source(
+        source: str,
+        *,
+        style: Optional[str] = None,
+        fallback_style: Optional[str] = None,
+        sort_includes: bool = False,
+    ) -> str:
+        """Format C++ source code using clang-format."""
+        args = _clang_format_args(style, fallback_style, sort_includes)
         p = Popen(args, stdout=PIPE, stdin=PIPE, encoding="utf8")
         formatted_source, _ = p.communicate(input=source)
         assert isinstance(formatted_source, str)
 
         return formatted_source
 
+    @register_batch_formatter("cpp")
+    def format_cpp_sources(
+        sources: Sequence[str],
+        *,
+        style: Optional[str] = None,
+        fallback_style: Optional[str] = None,
+        sort_includes: bool = False,
+    ) -> List[str]:
+        """Format several C++ sources using a single clang-format process."""
+        if not style or len(sources) < 2:
+            # Without an explicit style, clang-format looks for style files
+            # next to the formatted files, so they can not be moved around
+            return [
+                format_cpp_source(
+                    source, style=style, fallback_style=fallback_style, sort_includes=sort_includes
+                )
+                for source in sources
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_names = [os.path.join(tmp_dir, f"source_{i}.cpp") for i in range(len(sources))]
+            for file_name, source in zip(file_names, sources):
+                with open(file_name, "w", encoding="utf8") as f:
+                    f.write(source)
+
+            args = _clang_format_args(style, fallback_style, sort_includes)
+            run([*args, "-i", *file_names], check=True, capture_output=True)
+
+            formatted_sources = []
+            for file_name in file_names:
+                with open(file_name, "r", encoding="utf8") as f:
+                    formatted_sources.append(f.read())
+
+        return formatted_sources
+
+
+def _formatting_cache_key(language: str, source: str, kwargs: Mapping[str, Any]) -> str:
+    options = sorted(
+        (key, sorted(value) if isinstance(value, (set, frozenset)) else value)
+        for key, value in kwargs.items()
+    )
+    return utils.shash(language, _FORMATTER_VERSIONS.get(language, ""), options, source)
+
+
+def _load_formatted_source(key: str) -> Optional[str]:
+    if key in _formatted_sources_cache:
+        _formatted_sources_cache.move_to_end(key)
+        return _formatted_sources_cache[key]
+
+    cache_dir = FORMATTING_SETTINGS["cache_dir"]
+    if cache_dir:
+        try:
+            with open(os.path.join(cache_dir, key[:2], key), "r", encoding="utf8") as f:
+                formatted_source = f.read()
+        except OSError:
+            return None
+        _store_formatted_source(key, formatted_source, persistent=False)
+        return formatted_source
+
+    return None
+
+
+def _store_formatted_source(key: str, formatted_source: str, *, persistent: bool = True) -> None:
+    _formatted_sources_cache[key] = formatted_source
+    _formatted_sources_cache.move_to_end(key)
+    while len(_formatted_sources_cache) > _MAX_CACHED_SOURCES:
+        _formatted_sources_cache.popitem(last=False)
+
+    cache_dir = FORMATTING_SETTINGS["cache_dir"]
+    if persistent and cache_dir:
+        # Write to a temporary file and rename it to avoid races between processes
+        with contextlib.suppress(OSError):
+            entry_dir = os.path.join(cache_dir, key[:2])
+            os.makedirs(entry_dir, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_dir, prefix=f".{key}", text=True)
+            with os.fdopen(fd, "w", encoding="utf8") as f:
+                f.write(formatted_source)
+            os.replace(tmp_name, os.path.join(entry_dir, key))
+
+
+def clear_formatting_cache() -> None:
+    """Clear the in-memory cache of formatted sources."""
+    _formatted_sources_cache.clear()
+
+
+@contextlib.contextmanager
+def formatting_settings(**settings: Any) -> Iterator[Dict[str, Any]]:
+    """Temporarily update the global :data:`FORMATTING_SETTINGS` (context manager)."""
+    if unknown := set(settings) - set(FORMATTING_SETTINGS):
+        raise TypeError(f"Unknown formatting settings: {unknown}")
+
+    previous = {**FORMATTING_SETTINGS}
+    FORMATTING_SETTINGS.update(settings)
+    try:
+        yield FORMATTING_SETTINGS
+    finally:
+        FORMATTING_SETTINGS.clear()
+        FORMATTING_SETTINGS.update(previous)
+
+
+def format_sources(
+    language: str, sources: Sequence[str], *, skip_errors: bool = True, **kwargs: Any
+) -> List[str]:
+    """Format several sources if a formatter exists for the specific language.
+
+    Formatted sources are cached by content (see :data:`FORMATTING_SETTINGS`)
+    and the remaining ones are formatted together if a batch formatter
+    exists for the language. Nothing is formatted in production mode.
+    """
+    if FORMATTING_SETTINGS["production"]:
+        return list(sources)
 
-def format_source(language: str, source: str, *, skip_errors: bool = True, **kwargs: Any) -> str:
-    """Format source code if a formatter exists for the specific language."""
     formatter = SOURCE_FORMATTERS.get(language, None)
     try:
-        if formatter:
-            return formatter(source, **kwargs)  # type: ignore # Callable does not support **kwargs
-        else:
+        if not formatter:
             raise FormattingError(f"Missing formatter for '{language}' language")
+
+        keys = [_formatting_cache_key(language, source, kwargs) for source in sources]
+        results = [_load_formatted_source(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            batch_formatter = BATCH_SOURCE_FORMATTERS.get(language, None)
+            if batch_formatter and len(missing) > 1:
+                # type ignore: Callable does not support **kwargs
+                formatted = batch_formatter([sources[i] for i in missing], **kwargs)  # type: ignore
+            else:
+                # type ignore: Callable does not support **kwargs
+                formatted = [formatter(sources[i], **kwargs) for i in missing]  # type: ignore
+            for i, formatted_source in zip(missing, formatted):
+                _store_formatted_source(keys[i], formatted_source)
+                results[i] = formatted_source
+
+        return typing.cast(List[str], results)
+
     except Exception as e:
         if skip_errors:
-            return source
+            return list(sources)
         else:
             raise FormattingError(
                 f"Something went wrong when trying to format '{language}' source code"
             ) from e
 
 
+def format_source(language: str, source: str, *, skip_errors: bool = True, **kwargs: Any) -> str:
+    """Format source code if a formatter exists for the specific language."""
+    return format_sources(language, [source], skip_errors=skip_errors, **kwargs)[0]
+
+
 class Name:
     """Text formatter with different case styles for symbol names in source code."""
 
@@ -408,13 +604,22 @@ class Template(Protocol):
 
 
 class BaseTemplate(Template):
-    """Helper class to add source location info of template definitions."""
+    """Helper class to add source location info of template definitions.
+
+    Template adapters should also set the ``referenced_names`` attribute
+    with the names of the placeholders used in the template definition,
+    which allows users (e.g. :class:`TemplatedGenerator`) to skip the
+    computation of unused values. ``None`` means that the referenced names
+    are unknown and all the available values should be passed at rendering.
+    """
 
     definition: Any
     definition_loc: Optional[Tuple[str, int]]
+    referenced_names: Optional[FrozenSet[str]]
 
     def __init__(self) -> None:
         self.definition_loc = None
+        self.referenced_names = None
         frame = inspect.currentframe()
         try:
             if frame is not None and frame.f_back is not None and frame.f_back.f_back is not None:
@@ -436,14 +641,21 @@ class FormatTemplate(BaseTemplate):
     """Template adapter to render regular strings as fully-featured f-strings."""
 
     definition: str
+    code: Optional[types.CodeType]
 
     def __init__(self, definition: str, **kwargs: Any) -> None:
         super().__init__()
         self.definition = f'(f"""{definition}""")'
+        try:
+            self.code = compile(self.definition, "<FormatTemplate>", "eval")
+            self.referenced_names = frozenset(_collect_code_names(self.code))
+        except SyntaxError:
+            # Definition errors are reported at rendering
+            self.code = None
 
     def render_values(self, **kwargs: Any) -> str:
         try:
-            result = eval(self.definition, {}, kwargs or {})
+            result = eval(self.code or self.definition, {}, kwargs or {})
             assert isinstance(result, str)
             return result
         except Exception as e:
@@ -466,6 +678,11 @@ class StringTemplate(BaseTemplate):
             definition = string.Template(definition)
         assert isinstance(definition, string.Template)
         self.definition = definition
+        self.referenced_names = frozenset(
+            match.group("named") or match.group("braced")
+            for match in definition.pattern.finditer(definition.template)
+            if match.group("named") or match.group("braced")
+        )
 
     def render_values(self, **kwargs: Any) -> str:
         try:
@@ -494,6 +711,9 @@ class JinjaTemplate(BaseTemplate):
         super().__init__()
         try:
             if isinstance(definition, str):
+                self.referenced_names = frozenset(
+                    jinja2.meta.find_undeclared_variables(self.__jinja_env__.parse(definition))
+                )
                 definition = self.__jinja_env__.from_string(definition)
             assert isinstance(definition, jinja2.Template)
             self.definition = definition
@@ -536,6 +756,7 @@ class MakoTemplate(BaseTemplate):
                 definition = mako_tpl.Template(definition)
             assert isinstance(definition, mako_tpl.Template)
             self.definition = definition
+            self.referenced_names = _collect_mako_names(definition)
         except Exception as e:
             message = "Error in MakoTemplate"
             if self.definition_loc:
@@ -563,6 +784,28 @@ class MakoTemplate(BaseTemplate):
             raise TemplateRenderingError(message, template=self) from e
 
 
+def _collect_code_names(code: types.CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _collect_code_names(const)
+
+
+_MAKO_CONTEXT_GET_RE = re.compile(r"context\.get\('(\w+)', UNDEFINED\)")
+_MAKO_DYNAMIC_ACCESS_RE = re.compile(r"\b(context|pageargs)\b")
+
+
+def _collect_mako_names(definition: mako_tpl.Template) -> Optional[FrozenSet[str]]:
+    # Mako compiles templates to Python modules which fetch all the undeclared
+    # identifiers with 'context.get()' calls, unless the context is used explicitly
+    try:
+        if _MAKO_DYNAMIC_ACCESS_RE.search(definition.source):
+            return None
+        return frozenset(_MAKO_CONTEXT_GET_RE.findall(definition.code))
+    except Exception:
+        return None
+
+
 class TemplatedGenerator(NodeVisitor):
     """A code generator visitor using :class:`TextTemplate`.
 
@@ -590,7 +833,9 @@ class TemplatedGenerator(NodeVisitor):
         steps 3 and 4 will be substituted by a call to the :meth:`self.generic_dump()`
         method.
 
-    The following keys are passed to template instances at rendering:
+    Template lookups are cached for each node class. The following keys are
+    passed to template instances at rendering (only the ones referenced in the
+    template definition, if the template provides this information):
 
         * ``**node_fields``: all the node children and implementation fields by name.
         * ``_impl``: a ``dict`` instance with the results of visiting all
@@ -613,6 +858,7 @@ class TemplatedGenerator(NodeVisitor):
     """
 
     __templates__: ClassVar[Mapping[str, Template]]
+    _template_lookup_cache: ClassVar[Dict[Type, Tuple[Optional[Template], Optional[str]]]]
 
     @classmethod
     def __init_subclass__(cls, *, inherit_templates: bool = True, **kwargs: Any) -> None:
@@ -638,6 +884,7 @@ class TemplatedGenerator(NodeVisitor):
         )
 
         cls.__templates__ = types.MappingProxyType(templates)
+        cls._template_lookup_cache = {}
 
     @typing.overload
     @classmethod
@@ -705,16 +952,25 @@ class TemplatedGenerator(NodeVisitor):
 
     def get_template(self, node: TreeNode) -> Tuple[Optional[Template], Optional[str]]:
         """Get a template for a node instance (see class documentation)."""
-        template: Optional[Template] = None
-        template_key = None
-        if isinstance(node, BaseNode):
+        if not isinstance(node, BaseNode):
+            return None, None
+
+        lookup_cache = type(self)._template_lookup_cache
+        result = lookup_cache.get(node.__class__, None)
+        if result is None:
+            template: Optional[Template] = None
+            template_key = None
             for node_class in node.__class__.__mro__:
                 template_key = node_class.__name__
                 template = self.__templates__.get(template_key, None)
                 if template is not None or node_class is Node:
                     break
+            result = lookup_cache[node.__class__] = (
+                template,
+                None if template is None else template_key,
+            )
 
-        return template, None if template is None else template_key
+        return result
 
     def render_template(
         self,
@@ -725,16 +981,39 @@ class TemplatedGenerator(NodeVisitor):
         **kwargs: Any,
     ) -> str:
         """Render a template using node instance data (see class documentation)."""
-        return template.render(
-            **transformed_children,
-            **transformed_impl_fields,
-            _children=transformed_children,
-            _impl=transformed_impl_fields,
-            _this_node=node,
-            _this_generator=self,
-            _this_module=sys.modules[type(self).__module__],
-            **kwargs,
-        )
+        referenced_names = getattr(template, "referenced_names", None)
+        if referenced_names is None:
+            return template.render(
+                **transformed_children,
+                **transformed_impl_fields,
+                _children=transformed_children,
+                _impl=transformed_impl_fields,
+                _this_node=node,
+                _this_generator=self,
+                _this_module=sys.modules[type(self).__module__],
+                **kwargs,
+            )
+
+        values: Dict[str, Any] = {}
+        for name in referenced_names:
+            if name in kwargs:
+                values[name] = kwargs[name]
+            elif name in transformed_children:
+                values[name] = transformed_children[name]
+            elif name in transformed_impl_fields:
+                values[name] = transformed_impl_fields[name]
+            elif name == "_children":
+                values[name] = transformed_children
+            elif name == "_impl":
+                values[name] = transformed_impl_fields
+            elif name == "_this_node":
+                values[name] = node
+            elif name == "_this_generator":
+                values[name] = self
+            elif name == "_this_module":
+                values[name] = sys.modules[type(self).__module__]
+
+        return template.render(values)
 
     def transform_children(self, node: Node, **kwargs: Any) -> Dict[str, Any]:
         return {key: self.visit(value, **kwargs) for key, value in node.iter_children()}
@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import collections.abc
 import functools
 
 import pydantic
@@ -123,6 +124,47 @@ CollectionNode = Union[List[LeafNode], Dict[Any, LeafNode], Set[LeafNode]]
 TreeNode = Union[AnyNode, CollectionNode]
 
 
+def structural_hash(value: Any, *, cached: bool = True) -> int:
+    """Compute a hash value of an Eve tree which only depends on its structure.
+
+    Nodes contribute their type and the structural hash of their children
+    (implementation fields are ignored), collections and pydantic models
+    contribute the structural hash of their items and any other value is
+    hashed with the builtin :func:`hash`. A :class:`TypeError` is raised
+    if the tree contains unhashable leaf values.
+
+    With ``cached=False``, the hash values cached on the nodes are ignored, so
+    the result is also valid for trees modified in place.
+
+    """
+    if isinstance(value, BaseNode):
+        if cached:
+            return hash(value)
+        return hash(
+            (
+                type(value),
+                *(structural_hash(item, cached=False) for item in value.iter_children_values()),
+            )
+        )
+    elif isinstance(value, (list, tuple)):
+        return hash((type(value), *(structural_hash(item, cached=cached) for item in value)))
+    elif isinstance(value, (set, frozenset)):
+        return hash(frozenset(structural_hash(item, cached=cached) for item in value))
+    elif isinstance(value, collections.abc.Mapping):
+        return hash(
+            frozenset((key, structural_hash(item, cached=cached)) for key, item in value.items())
+        )
+    elif isinstance(value, pydantic.BaseModel):
+        return hash(
+            (
+                type(value),
+                *(structural_hash(item, cached=cached) for item in value.__dict__.values()),
+            )
+        )
+
+    return hash(value)
+
+
 class NodeMetaclass(pydantic.main.ModelMetaclass):
     """Custom metaclass for Node classes.
 
@@ -181,11 +223,60 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
             not children nodes. They are intended to be defined by users when needed,
             typically to cache derived, non-essential information on the node.
 
+    Nodes are hashable and compared structurally: two nodes are equal if they
+    have the same type and equal children, and their hash value is computed
+    from the children values (see :func:`structural_hash`). The hash value is
+    cached on the node the first time it is computed and discarded on attribute
+    assignment. Note that in-place modifications of nested children are not
+    tracked, use :class:`eve.visitors.NodeMutator` (which takes care of it) or
+    call :meth:`reset_hash_cache` manually when mutating trees in place.
+
     """
 
+    __slots__ = ("__weakref__", "_node_hash_cache")
+
     __node_impl_fields__: ClassVar[NodeImplFieldMetadataDict]
     __node_children__: ClassVar[NodeChildrenMetadataDict]
 
+    def __hash__(self) -> int:
+        try:
+            return self._node_hash_cache
+        except AttributeError:
+            result = hash(
+                (type(self), *(structural_hash(value) for value in self.iter_children_values()))
+            )
+            object.__setattr__(self, "_node_hash_cache", result)
+            return result
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, BaseNode):
+            return super().__eq__(other)
+        if type(self) is not type(other):
+            return False
+        try:
+            if hash(self) != hash(other):
+                return False
+        except TypeError:
+            pass
+        return all(
+            value == other_value
+            for value, other_value in zip(self.iter_children_values(), other.iter_children_values())
+        )
+
+    @no_type_check
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self.reset_hash_cache()
+
+    def reset_hash_cache(self) -> None:
+        """Discard the cached hash value (only needed after in-place changes of children)."""
+        try:
+            object.__delattr__(self, "_node_hash_cache")
+        except AttributeError:
+            pass
+
     def iter_impl_fields(self) -> Generator[Tuple[str, Any], None, None]:
         for name in self.__node_impl_fields__.keys():
             yield name, getattr(self, name)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Memoization of tree analyses and hash-consing based on structural node hashes."""
+
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import copy
+import functools
+import weakref
+
+from . import concepts
+from .typingx import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+AnyFrozenNode = TypeVar("AnyFrozenNode", bound=concepts.FrozenNode)
+
+
+class AnalysisCache:
+    """Bounded LRU cache of analysis results.
+
+    Entries are keyed on the analysis function and the structural hash of the
+    call arguments (see :func:`eve.concepts.structural_hash`), computed without
+    the hash values cached on the nodes, so trees modified in place get a new
+    key and are analysed again. Since hash values may collide, the stored
+    arguments are also compared with the new ones before returning a cached
+    result.
+
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[Any, Tuple[Any, Any]] = collections.OrderedDict()
+
+    def lookup(self, key: Any, arguments: Any) -> Tuple[bool, Any]:
+        entry = self._entries.get(key, None)
+        if entry is not None and entry[0] == arguments:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+        self.misses += 1
+        return False, None
+
+    def store(self, key: Any, arguments: Any, result: Any) -> None:
+        self._entries[key] = (arguments, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries),
+        }
+
+
+_active_cache: contextvars.ContextVar[Optional[AnalysisCache]] = contextvars.ContextVar(
+    "active_analysis_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def analysis_scope(cache: Optional[AnalysisCache] = None) -> Iterator[AnalysisCache]:
+    """Memoize the analyses in `cache` (a new one by default) within the context.
+
+    Outside of any scope, memoized analyses without an explicit cache are not
+    memoized, so the analysed trees are only referenced while the scope is active.
+    """
+    cache = cache if cache is not None else AnalysisCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def memoized_analysis(
+    func: Optional[Callable[..., T]] = None,
+    *,
+    cache: Optional[AnalysisCache] = None,
+    copy_result: Optional[Callable[[T], T]] = copy.copy,
+) -> Any:
+    """Memoize an analysis function of IR (sub)trees.
+
+    Results are cached on (analysis, structural hash of the arguments), so
+    repeated analyses of unchanged (or structurally equal) trees are served
+    from the cache. Calls with unhashable arguments, or outside of an
+    :func:`analysis_scope` without an explicit cache, fall back to the
+    original function.
+
+    Precomputed results (e.g. results known to be preserved by a tree
+    transformation) can be stored with the ``seed(result, *args, **kwargs)``
+    attribute of the memoized function.
+
+    Arguments:
+        cache: :class:`AnalysisCache` instance to use. Defaults to the cache
+            of the active :func:`analysis_scope`.
+        copy_result: function used to copy the cached result before returning it,
+            to avoid sharing mutable results between callers. ``None`` means the
+            result is immutable and it is returned as is.
+
+    Examples:
+        >>> @memoized_analysis
+        ... def add_values(tree):
+        ...     print("Adding")
+        ...     return sum(leaf.value for leaf in tree)
+        ...
+        >>> from eve.concepts import Node
+        >>> class Leaf(Node):
+        ...     value: int
+        ...
+        >>> with analysis_scope():
+        ...     add_values([Leaf(value=1), Leaf(value=2)])
+        ...     add_values([Leaf(value=1), Leaf(value=2)])
+        Adding
+        3
+        3
+
+    """
+
+    def _decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def _memoized(*args: Any, **kwargs: Any) -> T:
+            active_cache = cache if cache is not None else _active_cache.get()
+            if active_cache is None or not active_cache.enabled:
+                return func(*args, **kwargs)
+
+            arguments = (args, kwargs)
+            try:
+                key = (func, concepts.structural_hash(arguments, cached=False))
+            except TypeError:
+                # Unhashable arguments
+                return func(*args, **kwargs)
+
+            found, result = active_cache.lookup(key, arguments)
+            if not found:
+                result = func(*args, **kwargs)
+                active_cache.store(key, arguments, result)
+
+            return copy_result(result) if copy_result is not None else result
+
+        def seed(result: T, *args: Any, **kwargs: Any) -> None:
+            active_cache = cache if cache is not None else _active_cache.get()
+            if active_cache is not None and active_cache.enabled:
+                arguments = (args, kwargs)
+                try:
+                    key = (func, concepts.structural_hash(arguments, cached=False))
+                except TypeError:
+                    return
+                active_cache.store(key, arguments, result)
+
+        _memoized.seed = seed  # type: ignore[attr-defined]
+
+        return _memoized
+
+    return _decorator(func) if func is not None else _decorator
+
+
+_interned_nodes: weakref.WeakValueDictionary[
+    Tuple[type, int], concepts.FrozenNode
+] = weakref.WeakValueDictionary()
+
+
+def hash_cons(node: AnyFrozenNode) -> AnyFrozenNode:
+    """Return a canonical instance for all the structurally equal immutable nodes.
+
+    Canonical instances are only kept alive while they are referenced from
+    somewhere else.
+    """
+    if node.__config__.allow_mutation:
+        raise TypeError(f"Only immutable nodes can be hash-consed (got '{type(node).__name__}').")
+
+    key = (type(node), hash(node))
+    canonical = _interned_nodes.setdefault(key, node)
+    return canonical if canonical == node else node  # type: ignore[return-value]
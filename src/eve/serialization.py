@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Compact binary serialization of IR trees.
+
+Trees are encoded as nested builtin containers and written with :mod:`marshal`.
+Node (and :class:`pydantic.BaseModel`) types are stored once in a type table
+together with their field names (derived from ``__node_children__`` and
+``__node_impl_fields__``), enumeration members are stored once in a constants
+table, and equal strings are interned, so repeated values are written as small
+back-references. Values shared by several nodes (e.g. the nodes referenced
+from symbol tables) are also written once and keep their identity when loaded.
+
+Nodes are loaded without running the pydantic validation and all their fields
+are marked as set (the order of node fields in ``__dict__`` is not preserved).
+Values of any other type are pickled.
+
+Only instances of importable types can be serialized.
+
+Examples:
+    >>> from eve.type_definitions import SourceLocation
+    >>> locations = [SourceLocation(line=1, column=1, source="a.py")] * 2
+    >>> loaded = loads(dumps(locations))
+    >>> loaded == locations and loaded[0] is loaded[1]
+    True
+
+"""
+
+
+from __future__ import annotations
+
+import enum
+import importlib
+import marshal
+import pickle
+
+import pydantic
+
+from . import concepts, exceptions
+from .typingx import IO, Any, Dict, List, Tuple
+
+
+#: Version of the binary format.
+FORMAT_VERSION = 1
+
+# Codes of encoded values. Encoded nodes and models start with their
+# (non-negative) index in the type table.
+_LIST, _TUPLE, _SET, _FROZENSET, _DICT, _CONST, _REF, _PICKLED = range(-1, -9, -1)
+
+_ATOMIC_TYPES = frozenset([bool, int, float, complex, bytes, type(None)])
+
+
+class SerializationError(exceptions.EveRuntimeError):
+    """Run-time error serializing or deserializing a tree."""
+
+    ...
+
+
+def _import_object(module: str, qualname: str) -> Any:
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _importable_name(cls: type) -> Tuple[str, str]:
+    try:
+        if _import_object(cls.__module__, cls.__qualname__) is cls:
+            return cls.__module__, cls.__qualname__
+    except Exception:
+        pass
+    raise SerializationError(f"Type '{cls}' cannot be serialized (it can not be imported).")
+
+
+def dumps(tree: Any) -> bytes:
+    """Serialize a tree (a node, or a collection of nodes and values) into bytes."""
+    type_table: List[Tuple[str, str]] = []
+    const_table: List[Tuple[str, str, str]] = []
+    schemas: Dict[type, Tuple[int, Tuple[str, ...], bool]] = {}
+    const_types = set()
+    consts: Dict[enum.Enum, Tuple[int, int]] = {}
+    strings: Dict[str, str] = {}
+    memo: Dict[int, int] = {}
+    atomic_types = _ATOMIC_TYPES
+
+    def _encode(value: Any) -> Any:
+        value_type = type(value)
+        schema = schemas.get(value_type, None)
+        if schema is not None:
+            key = id(value)
+            if key in memo:
+                return (_REF, memo[key])
+
+            # Atomic values are stored in a dict (created directly by marshal
+            # when loading) and the rest are stored after it as (name, value)
+            # pairs. The field order of nodes is not relevant (their fields are
+            # accessed by name), but models get placeholders in the dict to
+            # keep it, since their structural hash depends on it
+            type_index, field_names, keep_order = schema
+            fields = value.__dict__
+            atomic_fields = {}
+            encoded: List[Any] = [type_index, atomic_fields]
+            for name in field_names:
+                field = fields[name]
+                field_type = type(field)
+                if field_type is str:
+                    atomic_fields[name] = strings.setdefault(field, field)
+                elif field_type in atomic_types:
+                    atomic_fields[name] = field
+                else:
+                    if keep_order:
+                        atomic_fields[name] = None
+                    if field_type in const_types and field in consts:
+                        encoded += (name, consts[field])
+                    else:
+                        encoded += (name, _encode(field))
+            memo[key] = len(memo)
+            return tuple(encoded)
+
+        elif value_type is list or value_type is tuple:
+            items = []
+            for item in value:
+                item_type = type(item)
+                if item_type is str:
+                    item = strings.setdefault(item, item)
+                elif item_type not in atomic_types:
+                    item = _encode(item)
+                items.append(item)
+            return (_LIST if value_type is list else _TUPLE, items)
+
+        elif value_type is str:
+            return strings.setdefault(value, value)
+
+        elif value_type in atomic_types:
+            return value
+
+        elif value_type in const_types:
+            const = consts.get(value, None)
+            if const is None:
+                const = consts[value] = (_CONST, len(const_table))
+                const_table.append((*_importable_name(value_type), value.name))
+            return const
+
+        elif value_type is dict:
+            return (_DICT, [_encode(item) for pair in value.items() for item in pair])
+
+        elif value_type is set or value_type is frozenset:
+            return (_SET if value_type is set else _FROZENSET, [_encode(item) for item in value])
+
+        elif isinstance(value, pydantic.BaseModel):
+            is_node = isinstance(value, concepts.BaseNode)
+            if is_node:
+                field_names = (*value_type.__node_children__, *value_type.__node_impl_fields__)
+            else:
+                field_names = tuple(value_type.__fields__)
+            schemas[value_type] = (
+                len(type_table),
+                tuple(strings.setdefault(name, name) for name in field_names),
+                not is_node,
+            )
+            type_table.append(_importable_name(value_type))
+            return _encode(value)
+
+        elif isinstance(value, enum.Enum):
+            const_types.add(value_type)
+            return _encode(value)
+
+        else:
+            return (_PICKLED, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    body = _encode(tree)
+    return marshal.dumps((FORMAT_VERSION, tuple(type_table), tuple(const_table), body))
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize a tree serialized with :func:`dumps`."""
+    try:
+        version, type_table, const_table, body = marshal.loads(data)
+    except Exception as e:
+        raise SerializationError("Invalid serialized data.") from e
+    if version != FORMAT_VERSION:
+        raise SerializationError(
+            f"Unsupported serialization format version {version} (expected {FORMAT_VERSION})."
+        )
+
+    try:
+        types = [_import_object(module, qualname) for module, qualname in type_table]
+        consts = [
+            getattr(_import_object(module, qualname), name)
+            for module, qualname, name in const_table
+        ]
+    except Exception as e:
+        raise SerializationError("Serialized data references unknown types.") from e
+
+    memo: List[Any] = []
+    new_object = object.__new__
+    set_attribute = object.__setattr__
+    tuple_type = tuple
+
+    def _decode(value: tuple) -> Any:
+        code = value[0]
+        if code >= 0:
+            fields = value[1]
+            for i in range(2, len(value), 2):
+                item = value[i + 1]
+                fields[value[i]] = consts[item[1]] if item[0] == _CONST else _decode(item)
+            node = new_object(types[code])
+            set_attribute(node, "__dict__", fields)
+            set_attribute(node, "__fields_set__", set(fields))
+            memo.append(node)
+            return node
+
+        elif code == _LIST or code == _TUPLE:
+            items = value[1]
+            for i, item in enumerate(items):
+                if type(item) is tuple_type:
+                    items[i] = consts[item[1]] if item[0] == _CONST else _decode(item)
+            return items if code == _LIST else tuple(items)
+
+        elif code == _CONST:
+            return consts[value[1]]
+
+        elif code == _REF:
+            return memo[value[1]]
+
+        elif code == _DICT:
+            items = [_decode(item) if type(item) is tuple_type else item for item in value[1]]
+            return dict(zip(items[::2], items[1::2]))
+
+        elif code == _SET or code == _FROZENSET:
+            items = [_decode(item) if type(item) is tuple_type else item for item in value[1]]
+            return set(items) if code == _SET else frozenset(items)
+
+        elif code == _PICKLED:
+            return pickle.loads(value[1])
+
+        raise SerializationError(f"Invalid serialized data (unknown code {code}).")
+
+    return _decode(body) if type(body) is tuple else body
+
+
+def dump(tree: Any, file: IO[bytes]) -> None:
+    """Serialize a tree into a binary file object."""
+    file.write(dumps(tree))
+
+
+def load(file: IO[bytes]) -> Any:
+    """Deserialize a tree from a binary file object."""
+    return loads(file.read())
@@ -71,7 +71,8 @@ class NodeVisitor:
         3. ``self.generic_visit()``.
 
     This dispatching mechanism is implemented in the main :meth:`visit`
-    method and can be overriden in subclasses. Additionally, a class can
+    method (which caches the result of the search for each visitor and node
+    class pair) and can be overriden in subclasses. Additionally, a class can
     define a list of context handlers to be applied before the actual visit
     to customize the context. Each context receives the visitor instance,
     the node instance, and the keywords arguments of the call.
@@ -114,29 +115,43 @@ class NodeVisitor:
 
     contexts: ClassVar[Optional[Tuple[ContextCallable, ...]]] = None
 
+    #: Names of the visitor methods of the class for each node class (`None` for `generic_visit`)
+    _visitor_method_names: ClassVar[Dict[type, Optional[str]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitor_method_names = {}
+
     def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
+        method_names = type(self)._visitor_method_names
+        try:
+            method_name = method_names[node.__class__]
+        except KeyError:
+            method_name = method_names[node.__class__] = self._find_visitor_method(node)
+        visitor = getattr(self, method_name) if method_name else self.generic_visit
+
+        if ctxs := type(self).contexts:
+            with contextlib.ExitStack() as stack:
+                for ctx in ctxs:
+                    stack.enter_context(ctx(self, node, kwargs))
+                return visitor(node, **kwargs)
+        else:
+            return visitor(node, **kwargs)
 
+    def _find_visitor_method(self, node: concepts.TreeNode) -> Optional[str]:
         method_name = "visit_" + node.__class__.__name__
         if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
+            return method_name
         elif isinstance(node, concepts.BaseNode):
             for node_class in node.__class__.__mro__[1:]:
                 method_name = "visit_" + node_class.__name__
                 if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
+                    return method_name
 
                 if node_class is concepts.BaseNode:
                     break
 
-        if ctxs := type(self).contexts:
-            with contextlib.ExitStack() as stack:
-                for ctx in ctxs:
-                    stack.enter_context(ctx(self, node, kwargs))
-                return visitor(node, **kwargs)
-        else:
-            return visitor(node, **kwargs)
+        return None
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         for child in iterators.generic_iter_children(node):
@@ -301,4 +316,8 @@ class NodeMutator(NodeVisitor):
                 elif new_value != value:
                     set_op(result, key, new_value)
 
+            if isinstance(result, concepts.BaseNode):
+                # Children may have been modified in place
+                result.reset_hash_cache()
+
         return result
@@ -34,5 +34,5 @@ __versioninfo__: Optional[Union[LegacyVersion, Version]] = parse(__version__)
 
 del DistributionNotFound, LegacyVersion, Version, get_distribution, parse
 
-from . import config, gtscript, storage
+from . import config, gtscript, profiler, storage
 from .stencil_object import StencilObject
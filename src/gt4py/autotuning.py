@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Per-stencil autotuning of the OIR optimization pipeline.
+
+With the ``autotune`` backend option, the stencil is built with a few variants of the
+default OIR pipeline of the backend (see :func:`pipeline_variants`), each variant is timed
+on the domains of ``gt4py.config.autotuning_settings`` and the fastest one is used::
+
+    @gtscript.stencil(backend="gtc:gt:cpu_ifirst", autotune=True)
+    def stencil(...):
+        ...
+
+The choice is stored in a ``.tuninginfo`` file next to the ``.cacheinfo`` file of the
+stencil, so later builds of the same stencil (including rebuilds) reuse it without running
+the benchmarks again; delete the file to tune again. An explicit ``oir_pipeline`` option
+takes precedence over autotuning.
+"""
+
+import dataclasses
+import pathlib
+import pickle
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gt4py import config as gt_config
+from gt4py import storage as gt_storage
+from gt4py.definitions import BuildOptions
+from gt4py.stencil_builder import StencilBuilder
+from gtc.gtir_to_oir import GTIRToOIR
+from gtc.passes.oir_optimizations.caches import (
+    IJCacheDetection,
+    KCacheDetection,
+    PruneKCacheFills,
+    PruneKCacheFlushes,
+)
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
+from gtc.passes.oir_optimizations.horizontal_execution_merging import (
+    MergeCostModel,
+    OnTheFlyMerging,
+)
+from gtc.passes.oir_optimizations.vertical_loop_merging import (
+    AdjacentLoopMerging,
+    DependencyAwareLoopMerging,
+)
+from gtc.passes.oir_pipeline import DefaultPipeline
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_object import StencilObject
+
+
+#: Groups of passes skipped by the variants of :func:`pipeline_variants`.
+SKIPPED_PASSES = {
+    "no_hoisting": (KInvariantHoisting,),
+    "no_loop_merging": (AdjacentLoopMerging, DependencyAwareLoopMerging),
+    "no_on_the_fly_merging": (OnTheFlyMerging,),
+    "no_caches": (IJCacheDetection, KCacheDetection, PruneKCacheFills, PruneKCacheFlushes),
+}
+
+#: Factors applied to the memory access cost of the merge cost model by the variants.
+MEMORY_ACCESS_COST_FACTORS = {"eager_merging": 4.0, "conservative_merging": 0.25}
+
+
+def pipeline_variants(pipeline: DefaultPipeline) -> Dict[str, DefaultPipeline]:
+    """Variants of a pipeline skipping more passes or merging more or less on the fly."""
+    variants = {"default": pipeline}
+    for name, passes in SKIPPED_PASSES.items():
+        if any(step not in pipeline.skip for step in passes):
+            variants[name] = DefaultPipeline(
+                skip=[*pipeline.skip, *passes],
+                fast_math=pipeline.fast_math,
+                merge_cost_model=pipeline.merge_cost_model,
+            )
+    if OnTheFlyMerging not in pipeline.skip:
+        cost_model = pipeline.merge_cost_model or MergeCostModel()
+        for name, factor in MEMORY_ACCESS_COST_FACTORS.items():
+            variants[name] = DefaultPipeline(
+                skip=pipeline.skip,
+                fast_math=pipeline.fast_math,
+                merge_cost_model=dataclasses.replace(
+                    cost_model, memory_access_cost=cost_model.memory_access_cost * factor
+                ),
+            )
+    return variants
+
+
+def _distinct_variants(
+    builder: StencilBuilder, variants: Dict[str, DefaultPipeline]
+) -> Dict[str, DefaultPipeline]:
+    """Drop the variants giving the same OIR as a previous variant, they need no benchmark."""
+    base_oir = GTIRToOIR().visit(builder.gtir)
+    results = []
+    distinct = {}
+    for name, pipeline in variants.items():
+        result = pipeline.run(base_oir)
+        if result not in results:
+            results.append(result)
+            distinct[name] = pipeline
+    return distinct
+
+
+def _make_arguments(
+    stencil: "StencilObject", backend_name: str, domain: Tuple[int, ...]
+) -> Dict[str, Any]:
+    rng = np.random.default_rng(0)
+    arguments: Dict[str, Any] = {}
+    for name, info in stencil.field_info.items():
+        lower = info.boundary.lower_indices.filter_mask(info.domain_mask)
+        upper = info.boundary.upper_indices.filter_mask(info.domain_mask)
+        sizes = [size for size, used in zip(domain, info.domain_mask) if used]
+        shape = (*(lo + size + up for lo, size, up in zip(lower, sizes, upper)), *info.data_dims)
+        arguments[name] = gt_storage.from_array(
+            rng.uniform(0.5, 1.5, shape).astype(info.dtype),
+            backend=backend_name,
+            default_origin=(*lower, *((0,) * len(info.data_dims))),
+            shape=shape,
+            dtype=info.dtype,
+            mask=info.mask,
+        )
+    for name, info in stencil.parameter_info.items():
+        arguments[name] = info.dtype.type(1)
+    return arguments
+
+
+def _run_time(
+    stencil: "StencilObject",
+    backend_name: str,
+    *,
+    domains: Sequence[Tuple[int, ...]],
+    repetitions: int,
+) -> float:
+    """Sum over the domains of the fastest run time of the stencil."""
+    total = 0.0
+    for domain in domains:
+        arguments = _make_arguments(stencil, backend_name, domain)
+        stencil(**arguments, domain=domain, validate_args=False)
+        run_times = []
+        for _ in range(repetitions):
+            start_time = time.perf_counter()
+            stencil(**arguments, domain=domain, validate_args=False)
+            run_times.append(time.perf_counter() - start_time)
+        total += min(run_times)
+    return total
+
+
+def _build_variant(
+    builder: StencilBuilder, name: str, pipeline: DefaultPipeline, output_path: pathlib.Path
+) -> "StencilObject":
+    backend_opts = {
+        **{key: value for key, value in builder.options.backend_opts.items() if key != "autotune"},
+        "oir_pipeline": pipeline,
+    }
+    # type ignore explanation: Attribclass generated init not recognized by mypy
+    options = BuildOptions(  # type: ignore
+        name=f"{builder.options.name}_{name}",
+        module=builder.options.module,
+        format_source=False,
+        backend_opts=backend_opts,
+        rebuild=True,
+        impl_opts=builder.options._impl_opts,
+    )
+    variant_builder = (
+        StencilBuilder(
+            builder.definition,
+            backend=type(builder.backend),
+            options=options,
+            frontend=builder.frontend,
+        )
+        .with_externals(builder.externals)
+        .with_caching("nocaching", output_path=output_path / name)
+    )
+    return variant_builder.build()()
+
+
+def _load_tuning_info(path: Optional[pathlib.Path]) -> Optional[Dict[str, Any]]:
+    if not path or not path.exists():
+        return None
+    try:
+        with path.open("rb") as tuning_info_file:
+            return pickle.load(tuning_info_file)
+    except Exception:
+        # e.g. written by a version of gt4py with other passes, tune again
+        return None
+
+
+def tune(builder: StencilBuilder) -> Dict[str, Any]:
+    """Time the variants of the default OIR pipeline of the backend on the stencil.
+
+    Returns the tuning info: the name of the fastest variant (``"variant"``), its pipeline
+    (``"pipeline"``) and the run times of all variants (``"timings"``).
+    """
+    variants = _distinct_variants(
+        builder, pipeline_variants(builder.backend.default_oir_pipeline())
+    )
+    settings = gt_config.autotuning_settings
+    timings = {}
+    with tempfile.TemporaryDirectory() as output_path:
+        for name, pipeline in variants.items():
+            stencil = _build_variant(builder, name, pipeline, pathlib.Path(output_path))
+            timings[name] = _run_time(
+                stencil,
+                builder.backend.name,
+                domains=settings["domains"],
+                repetitions=settings["repetitions"],
+            )
+    variant = min(timings, key=timings.__getitem__)
+    return {"variant": variant, "pipeline": variants[variant], "timings": timings}
+
+
+def tuned_pipeline(builder: StencilBuilder) -> DefaultPipeline:
+    """Get the tuned OIR pipeline of the stencil, tune it first if no tuning info is stored."""
+    path = builder.caching.tuning_info_path
+    tuning_info = _load_tuning_info(path)
+    reused = tuning_info is not None
+    if tuning_info is None:
+        tuning_info = tune(builder)
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as tuning_info_file:
+                pickle.dump(tuning_info, tuning_info_file)
+
+    build_info = builder.options.build_info
+    if build_info is not None:
+        build_info["autotuning"] = {
+            "variant": tuning_info["variant"],
+            "timings": tuning_info["timings"],
+            "reused": reused,
+        }
+    return tuning_info["pipeline"]
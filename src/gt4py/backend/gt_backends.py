@@ -30,6 +30,7 @@ from gt4py import gt_src_manager
 from gt4py import ir as gt_ir
 from gt4py import utils as gt_utils
 from gt4py.utils import text as gt_text
+from gtc.passes.oir_optimizations.horizontal_execution_merging import MergeCostModel
 from gtc.passes.oir_pipeline import OirPipeline
 
 from . import pyext_builder
@@ -681,10 +682,18 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         "debug_mode": {"versioning": True, "type": bool},
         "verbose": {"versioning": False, "type": bool},
         "oir_pipeline": {"versioning": True, "type": OirPipeline},
+        "fast_math": {"versioning": True, "type": bool},
+        "autotune": {"versioning": True, "type": bool},
+        "merge_operation_cost": {"versioning": True, "type": float},
+        "merge_function_call_cost": {"versioning": True, "type": float},
+        "merge_expensive_function_cost": {"versioning": True, "type": float},
+        "merge_memory_access_cost": {"versioning": True, "type": float},
     }
 
     GT_BACKEND_T: str
 
+    MERGE_COST_MODEL = MergeCostModel()
+
     MODULE_GENERATOR_CLASS = PyExtModuleGenerator
 
     USE_LEGACY_TOOLCHAIN = True
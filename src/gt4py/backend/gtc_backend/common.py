@@ -15,10 +15,40 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+import dataclasses
 from typing import Tuple
 
 import gtc.utils as gtc_utils
 from eve.codegen import MakoTemplate as as_mako
+from gtc.passes.oir_optimizations.horizontal_execution_merging import MergeCostModel
+from gtc.passes.oir_pipeline import OirPipeline
+
+
+def merge_cost_model(backend) -> MergeCostModel:
+    """Return the on-the-fly merging cost model of a backend, updated by the `merge_*` options."""
+    backend_opts = backend.builder.options.backend_opts
+    parameters = {
+        field.name: float(backend_opts[f"merge_{field.name}"])
+        for field in dataclasses.fields(MergeCostModel)
+        if f"merge_{field.name}" in backend_opts
+    }
+    return dataclasses.replace(backend.MERGE_COST_MODEL, **parameters)
+
+
+def get_oir_pipeline(backend) -> OirPipeline:
+    """Return the OIR pipeline of a build.
+
+    This is the `oir_pipeline` option if given, else the autotuned pipeline with the `autotune`
+    option (see :mod:`gt4py.autotuning`) or the default pipeline of the backend.
+    """
+    backend_opts = backend.builder.options.backend_opts
+    if "oir_pipeline" in backend_opts:
+        return backend_opts["oir_pipeline"]
+    if backend_opts.get("autotune", False):
+        from gt4py import autotuning
+
+        return autotuning.tuned_pipeline(backend.builder)
+    return backend.default_oir_pipeline()
 
 
 def _get_unit_stride_dim(backend, domain_dim_flags, data_ndim):
@@ -71,6 +101,13 @@ def pybuffer_to_sid(
 
 
 def bindings_main_template():
+    """Template of the pybind11 module of a computation.
+
+    Besides ``run_computation``, which converts all buffers to SIDs at every call, the module
+    has a ``bind_computation`` function converting only the field buffers (the parameters
+    flagged in ``entry_param_is_field`` and ``sid_param_is_field``) once, which returns a
+    function running the computation on them with new values of the scalar parameters.
+    """
     return as_mako(
         """
         #include <chrono>
@@ -84,28 +121,60 @@ def bindings_main_template():
         #include "computation.hpp"
         namespace gt = gridtools;
         namespace py = ::pybind11;
+        namespace {
+        void set_exec_info_time(py::object const& exec_info, char const* key) {
+            if (!exec_info.is(py::none()))
+            {
+                auto exec_info_dict = exec_info.cast<py::dict>();
+                exec_info_dict[key] = static_cast<double>(
+                    std::chrono::duration_cast<std::chrono::nanoseconds>(
+                        std::chrono::high_resolution_clock::now().time_since_epoch()).count())/1e9;
+            }
+        }
+        }
         PYBIND11_MODULE(${module_name}, m) {
             m.def("run_computation", [](
             ${','.join(["std::array<gt::uint_t, 3> domain", *entry_params, 'py::object exec_info'])}
             ){
-                if (!exec_info.is(py::none()))
+                set_exec_info_time(exec_info, "run_cpp_start_time");
+
+                // the SIDs are created while holding the GIL, the computation runs without it
+                % for index, sid_param in enumerate(sid_params):
+                auto sid_arg_${index} = ${sid_param};
+                % endfor
                 {
-                    auto exec_info_dict = exec_info.cast<py::dict>();
-                    exec_info_dict["run_cpp_start_time"] = static_cast<double>(
-                        std::chrono::duration_cast<std::chrono::nanoseconds>(
-                            std::chrono::high_resolution_clock::now().time_since_epoch()).count())/1e9;
+                    py::gil_scoped_release release;
+                    ${name}(domain)(${','.join(f"std::move(sid_arg_{index})" for index in range(len(sid_params)))});
                 }
 
-                ${name}(domain)(${','.join(sid_params)});
+                set_exec_info_time(exec_info, "run_cpp_end_time");
+            }, "Runs the given computation");
 
-                if (!exec_info.is(py::none()))
-                {
-                    auto exec_info_dict = exec_info.cast<py::dict>();
-                    exec_info_dict["run_cpp_end_time"] = static_cast<double>(
-                        std::chrono::duration_cast<std::chrono::nanoseconds>(
-                            std::chrono::high_resolution_clock::now().time_since_epoch()).count()/1e9);
-                }
+            m.def("bind_computation", [](
+            ${','.join(["std::array<gt::uint_t, 3> domain", *(param for param, is_field in zip(entry_params, entry_param_is_field) if is_field)])}
+            ){
+                % for index, sid_param in enumerate(sid_params):
+                % if sid_param_is_field[index]:
+                auto sid_arg_${index} = ${sid_param};
+                % endif
+                % endfor
+                return py::cpp_function([${','.join(["domain", *(f"sid_arg_{index}" for index, is_field in enumerate(sid_param_is_field) if is_field)])}](
+                ${','.join([*(param for param, is_field in zip(entry_params, entry_param_is_field) if not is_field), 'py::object exec_info'])}
+                ){
+                    set_exec_info_time(exec_info, "run_cpp_start_time");
+
+                    % for index, sid_param in enumerate(sid_params):
+                    % if not sid_param_is_field[index]:
+                    auto sid_arg_${index} = ${sid_param};
+                    % endif
+                    % endfor
+                    {
+                        py::gil_scoped_release release;
+                        ${name}(domain)(${','.join(f"decltype(sid_arg_{index})(sid_arg_{index})" if is_field else f"std::move(sid_arg_{index})" for index, is_field in enumerate(sid_param_is_field))});
+                    }
 
-            }, "Runs the given computation");}
+                    set_exec_info_time(exec_info, "run_cpp_end_time");
+                });
+            }, "Converts the given field buffers and returns a function running the computation on them");}
         """
     )
@@ -26,14 +26,20 @@ from gt4py.backend.gt_backends import (
     cuda_is_compatible_type,
     make_cuda_layout_map,
 )
-from gt4py.backend.gtc_backend.common import bindings_main_template, pybuffer_to_sid
-from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gt4py.backend.gtc_backend.common import (
+    bindings_main_template,
+    get_oir_pipeline,
+    merge_cost_model,
+    pybuffer_to_sid,
+)
 from gtc import gtir_to_oir
 from gtc.common import DataType
 from gtc.cuir import cuir, cuir_codegen, extent_analysis, kernel_fusion, oir_to_cuir
-from gtc.passes.gtir_pipeline import GtirPipeline
-from gtc.passes.oir_optimizations.caches import FillFlushToLocalKCaches
+from gtc.passes.oir_optimizations.caches import FillFlushToLocalKCaches, KCacheDetection
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
+from gtc.passes.oir_optimizations.horizontal_execution_merging import MergeCostModel
 from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning
+from gtc.passes.oir_optimizations.temporaries import TemporaryDimensionReduction
 from gtc.passes.oir_pipeline import DefaultPipeline
 
 
@@ -48,26 +54,32 @@ class GTCCudaExtGenerator:
         self.backend = backend
 
     def __call__(self, definition_ir) -> Dict[str, Dict[str, str]]:
-        gtir = GtirPipeline(DefIRToGTIR.apply(definition_ir)).full()
-        base_oir = gtir_to_oir.GTIRToOIR().visit(gtir)
-        oir_pipeline = self.backend.builder.options.backend_opts.get(
-            "oir_pipeline", DefaultPipeline(skip=[NoFieldAccessPruning])
-        )
-        oir = oir_pipeline.run(base_oir)
-        oir = FillFlushToLocalKCaches().visit(oir)
-        cuir = oir_to_cuir.OIRToCUIR().visit(oir)
-        cuir = kernel_fusion.FuseKernels().visit(cuir)
-        cuir = extent_analysis.CacheExtents().visit(cuir)
-        format_source = self.backend.builder.options.format_source
-        implementation = cuir_codegen.CUIRCodegen.apply(cuir, format_source=format_source)
+        cuir = self.backend.builder.cached_ir("cuir", self._make_cuir, backend_specific=True)
+        implementation = cuir_codegen.CUIRCodegen.apply(cuir, format_source=False)
         bindings = GTCCudaBindingsCodegen.apply(
-            cuir, module_name=self.module_name, backend=self.backend, format_source=format_source
+            cuir, module_name=self.module_name, backend=self.backend, format_source=False
         )
+        if self.backend.builder.options.format_source:
+            implementation, bindings = codegen.format_sources(
+                "cpp", [implementation, bindings], style="LLVM"
+            )
         return {
             "computation": {"computation.hpp": implementation},
             "bindings": {"bindings.cu": bindings},
         }
 
+    def _make_cuir(self) -> cuir.Program:
+        base_oir = gtir_to_oir.GTIRToOIR().visit(self.backend.builder.gtir)
+        oir_pipeline = get_oir_pipeline(self.backend)
+        oir = oir_pipeline.run(base_oir, build_info=self.backend.builder.options.build_info)
+        if isinstance(oir_pipeline, DefaultPipeline) and KCacheDetection in oir_pipeline.steps:
+            # local k-caches also support read-only fields with horizontal offsets
+            oir = KCacheDetection(allow_ij_offsets=True).visit(oir)
+        oir = FillFlushToLocalKCaches().visit(oir)
+        cuir_node = oir_to_cuir.OIRToCUIR().visit(oir)
+        cuir_node = kernel_fusion.FuseKernels().visit(cuir_node)
+        return extent_analysis.CacheExtents().visit(cuir_node)
+
 
 class GTCCudaBindingsCodegen(codegen.TemplatedGenerator):
     def __init__(self, backend):
@@ -112,10 +124,13 @@ class GTCCudaBindingsCodegen(codegen.TemplatedGenerator):
         assert "module_name" in kwargs
         entry_params = self.visit(node.params, external_arg=True, **kwargs)
         sid_params = self.visit(node.params, external_arg=False, **kwargs)
+        param_is_field = [isinstance(param, cuir.FieldDecl) for param in node.params]
         return self.generic_visit(
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            entry_param_is_field=param_is_field,
+            sid_param_is_field=param_is_field,
             **kwargs,
         )
 
@@ -148,6 +163,15 @@ class GTCCudaBackend(BaseGTBackend, CLIBackendMixin):
     MODULE_GENERATOR_CLASS = GTCUDAPyModuleGenerator
     GT_BACKEND_T = "gpu"
     USE_LEGACY_TOOLCHAIN = False
+    # GPUs have more arithmetic throughput per memory bandwidth than CPUs
+    MERGE_COST_MODEL = MergeCostModel(memory_access_cost=16.0)
+
+    def default_oir_pipeline(self) -> DefaultPipeline:
+        return DefaultPipeline(
+            skip=[KInvariantHoisting, NoFieldAccessPruning, TemporaryDimensionReduction],
+            fast_math=self.builder.options.backend_opts.get("fast_math", False),
+            merge_cost_model=merge_cost_model(self),
+        )
 
     def generate_extension(self, **kwargs: Any) -> Tuple[str, str]:
         return self.make_extension(gt_version=2, ir=self.builder.definition_ir, uses_cuda=True)
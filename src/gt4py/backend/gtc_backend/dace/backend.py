@@ -25,15 +25,20 @@ from eve.codegen import MakoTemplate as as_mako
 from gt4py import gt_src_manager
 from gt4py.backend.base import CLIBackendMixin, register
 from gt4py.backend.gt_backends import BaseGTBackend, PyExtModuleGenerator, make_x86_layout_map
-from gt4py.backend.gtc_backend.common import bindings_main_template, pybuffer_to_sid
-from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gt4py.backend.gtc_backend.common import (
+    bindings_main_template,
+    get_oir_pipeline,
+    merge_cost_model,
+    pybuffer_to_sid,
+)
 from gt4py.backend.module_generator import make_args_data_from_gtir
 from gt4py.ir import StencilDefinition
-from gtc import gtir, gtir_to_oir
+from gtc import gtir, gtir_to_oir, oir
 from gtc.dace.oir_to_dace import OirSDFGBuilder
 from gtc.dace.utils import array_dimensions, replace_strides
 from gtc.passes.gtir_k_boundary import compute_k_boundary
 from gtc.passes.gtir_pipeline import GtirPipeline
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
 from gtc.passes.oir_optimizations.inlining import MaskInlining
 from gtc.passes.oir_optimizations.utils import compute_fields_extents
 from gtc.passes.oir_pipeline import DefaultPipeline
@@ -93,18 +98,8 @@ class GTCDaCeExtGenerator:
         self.backend = backend
 
     def __call__(self, definition_ir: StencilDefinition) -> Dict[str, Dict[str, str]]:
-        default_pipeline = DefaultPipeline(
-            skip=[
-                MaskInlining,
-            ]
-        )
-        gtir = GtirPipeline(DefIRToGTIR.apply(definition_ir)).full()
-        base_oir = gtir_to_oir.GTIRToOIR().visit(gtir)
-        oir_pipeline = self.backend.builder.options.backend_opts.get(
-            "oir_pipeline",
-            default_pipeline,
-        )
-        oir = oir_pipeline.run(base_oir)
+        gtir = self.backend.builder.gtir
+        oir = self.backend.builder.cached_ir("oir", self._make_oir, backend_specific=True)
         sdfg = OirSDFGBuilder().visit(oir)
 
         sdfg = _expand_and_finalize_sdfg(gtir, sdfg, self.backend.storage_info["layout_map"])
@@ -133,6 +128,11 @@ class GTCDaCeExtGenerator:
         }
         return sources
 
+    def _make_oir(self) -> oir.Stencil:
+        base_oir = gtir_to_oir.GTIRToOIR().visit(self.backend.builder.gtir)
+        oir_pipeline = get_oir_pipeline(self.backend)
+        return oir_pipeline.run(base_oir, build_info=self.backend.builder.options.build_info)
+
 
 class DaCeComputationCodegen:
 
@@ -172,8 +172,7 @@ class DaCeComputationCodegen:
         lines = filter(
             lambda l: '#include "../../include/hash.h"' not in l, computations.split("\n")
         )
-
-        computations = codegen.format_source("cpp", "\n".join(lines), style="LLVM")
+        computations = "\n".join(lines)
 
         interface = cls.template.definition.render(
             name=sdfg.name,
@@ -332,6 +331,21 @@ class DaCeBindingsCodegen:
             res.append(name)
         return res
 
+    def generate_entry_param_is_field(self, gtir: gtir.Stencil, sdfg: dace.SDFG):
+        # same order as `generate_entry_params`
+        entry_names = {
+            name
+            for name in sdfg.signature_arglist(with_types=False, for_call=True)
+            if name in sdfg.arrays or (name in sdfg.symbols and not name.startswith("__"))
+        }
+        return [node.name in sdfg.arrays for node in gtir.params if node.name in entry_names]
+
+    def generate_sid_param_is_field(self, sdfg: dace.SDFG):
+        # same order as `generate_sid_params`: the (non-transient) arrays, then the scalars
+        num_arrays = sum(1 for array in sdfg.arrays.values() if not array.transient)
+        num_scalars = sum(1 for name in sdfg.symbols.keys() if not name.startswith("__"))
+        return [True] * num_arrays + [False] * num_scalars
+
     def generate_sdfg_bindings(self, gtir, sdfg, module_name):
 
         return self.mako_template.render_values(
@@ -339,6 +353,8 @@ class DaCeBindingsCodegen:
             module_name=module_name,
             entry_params=self.generate_entry_params(gtir, sdfg),
             sid_params=self.generate_sid_params(sdfg),
+            entry_param_is_field=self.generate_entry_param_is_field(gtir, sdfg),
+            sid_param_is_field=self.generate_sid_param_is_field(sdfg),
         )
 
     @classmethod
@@ -369,6 +385,16 @@ class GTCDaceBackend(BaseGTBackend, CLIBackendMixin):
     PYEXT_GENERATOR_CLASS = GTCDaCeExtGenerator  # type: ignore
     USE_LEGACY_TOOLCHAIN = False
 
+    def default_oir_pipeline(self) -> DefaultPipeline:
+        return DefaultPipeline(
+            skip=[
+                KInvariantHoisting,
+                MaskInlining,
+            ],
+            fast_math=self.builder.options.backend_opts.get("fast_math", False),
+            merge_cost_model=merge_cost_model(self),
+        )
+
     def generate_extension(self) -> Tuple[str, str]:
         return self.make_extension(gt_version=2, ir=self.builder.definition_ir, uses_cuda=False)
 
@@ -31,12 +31,18 @@ from gt4py.backend.gt_backends import (
     mc_is_compatible_layout,
     x86_is_compatible_layout,
 )
-from gt4py.backend.gtc_backend.common import bindings_main_template, pybuffer_to_sid
-from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gt4py.backend.gtc_backend.common import (
+    bindings_main_template,
+    get_oir_pipeline,
+    merge_cost_model,
+    pybuffer_to_sid,
+)
 from gtc import gtir_to_oir
 from gtc.common import DataType
 from gtc.gtcpp import gtcpp, gtcpp_codegen, oir_to_gtcpp
-from gtc.passes.gtir_pipeline import GtirPipeline
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
+from gtc.passes.oir_optimizations.horizontal_execution_merging import MergeCostModel
+from gtc.passes.oir_optimizations.temporaries import TemporaryDimensionReduction
 from gtc.passes.oir_pipeline import DefaultPipeline
 
 
@@ -51,26 +57,29 @@ class GTCGTExtGenerator:
         self.backend = backend
 
     def __call__(self, definition_ir) -> Dict[str, Dict[str, str]]:
-        gtir = GtirPipeline(DefIRToGTIR.apply(definition_ir)).full()
-        base_oir = gtir_to_oir.GTIRToOIR().visit(gtir)
-        oir_pipeline = self.backend.builder.options.backend_opts.get(
-            "oir_pipeline", DefaultPipeline()
-        )
-        oir = oir_pipeline.run(base_oir)
-        gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
-        format_source = self.backend.builder.options.format_source
+        gtcpp = self.backend.builder.cached_ir("gtcpp", self._make_gtcpp, backend_specific=True)
         implementation = gtcpp_codegen.GTCppCodegen.apply(
-            gtcpp, gt_backend_t=self.backend.GT_BACKEND_T, format_source=format_source
+            gtcpp, gt_backend_t=self.backend.GT_BACKEND_T, format_source=False
         )
         bindings = GTCppBindingsCodegen.apply(
-            gtcpp, module_name=self.module_name, backend=self.backend, format_source=format_source
+            gtcpp, module_name=self.module_name, backend=self.backend, format_source=False
         )
+        if self.backend.builder.options.format_source:
+            implementation, bindings = codegen.format_sources(
+                "cpp", [implementation, bindings], style="LLVM"
+            )
         bindings_ext = ".cu" if self.backend.GT_BACKEND_T == "gpu" else ".cpp"
         return {
             "computation": {"computation.hpp": implementation},
             "bindings": {"bindings" + bindings_ext: bindings},
         }
 
+    def _make_gtcpp(self) -> gtcpp.Program:
+        base_oir = gtir_to_oir.GTIRToOIR().visit(self.backend.builder.gtir)
+        oir_pipeline = get_oir_pipeline(self.backend)
+        oir = oir_pipeline.run(base_oir, build_info=self.backend.builder.options.build_info)
+        return oir_to_gtcpp.OIRToGTCpp().visit(oir)
+
 
 class GTCppBindingsCodegen(codegen.TemplatedGenerator):
     def __init__(self):
@@ -115,10 +124,13 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
         assert "module_name" in kwargs
         entry_params = self.visit(node.parameters, external_arg=True, **kwargs)
         sid_params = self.visit(node.parameters, external_arg=False, **kwargs)
+        param_is_field = [isinstance(param, gtcpp.FieldDecl) for param in node.parameters]
         return self.generic_visit(
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            entry_param_is_field=param_is_field,
+            sid_param_is_field=param_is_field,
             **kwargs,
         )
 
@@ -138,6 +150,13 @@ class GTCGTBaseBackend(BaseGTBackend, CLIBackendMixin):
     PYEXT_GENERATOR_CLASS = GTCGTExtGenerator  # type: ignore
     USE_LEGACY_TOOLCHAIN = False
 
+    def default_oir_pipeline(self) -> DefaultPipeline:
+        return DefaultPipeline(
+            skip=[KInvariantHoisting, TemporaryDimensionReduction],
+            fast_math=self.builder.options.backend_opts.get("fast_math", False),
+            merge_cost_model=merge_cost_model(self),
+        )
+
     def _generate_extension(self, uses_cuda: bool) -> Tuple[str, str]:
         return self.make_extension(gt_version=2, ir=self.builder.definition_ir, uses_cuda=uses_cuda)
 
@@ -206,6 +225,7 @@ class GTCGTGpuBackend(GTCGTBaseBackend):
     MODULE_GENERATOR_CLASS = GTCUDAPyModuleGenerator
     name = "gtc:gt:gpu"
     GT_BACKEND_T = "gpu"
+    MERGE_COST_MODEL = MergeCostModel(memory_access_cost=16.0)
     languages = {"computation": "cuda", "bindings": ["python"]}
     options = {**BaseGTBackend.GT_BACKEND_OPTS, "device_sync": {"versioning": True, "type": bool}}
     storage_info = {
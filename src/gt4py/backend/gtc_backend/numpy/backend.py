@@ -24,6 +24,7 @@ from gt4py.backend.debug_backend import (
     debug_is_compatible_type,
     debug_layout,
 )
+from gt4py.backend.gtc_backend.common import get_oir_pipeline, merge_cost_model
 from gtc.gtir_to_oir import GTIRToOIR
 from gtc.numpy import npir
 from gtc.numpy.npir_codegen import NpirCodegen
@@ -34,6 +35,7 @@ from gtc.passes.oir_optimizations.caches import (
     PruneKCacheFills,
     PruneKCacheFlushes,
 )
+from gtc.passes.oir_optimizations.horizontal_execution_merging import MergeCostModel
 from gtc.passes.oir_pipeline import DefaultPipeline, OirPipeline
 
 
@@ -87,6 +89,12 @@ class GTCNumpyBackend(BaseBackend, CLIBackendMixin):
     name = "gtc:numpy"
     options: ClassVar[Dict[str, Any]] = {
         "oir_pipeline": {"versioning": True, "type": OirPipeline},
+        "fast_math": {"versioning": True, "type": bool},
+        "autotune": {"versioning": True, "type": bool},
+        "merge_operation_cost": {"versioning": True, "type": float},
+        "merge_function_call_cost": {"versioning": True, "type": float},
+        "merge_expensive_function_cost": {"versioning": True, "type": float},
+        "merge_memory_access_cost": {"versioning": True, "type": float},
         # TODO: Implement this option in source code
         "ignore_np_errstate": {"versioning": True, "type": bool},
     }
@@ -101,6 +109,8 @@ class GTCNumpyBackend(BaseBackend, CLIBackendMixin):
     MODULE_GENERATOR_CLASS = GTCModuleGenerator
     USE_LEGACY_TOOLCHAIN = False
     GTIR_KEY = "gtc:gtir"
+    # every NumPy operation loads and stores whole arrays, so temporaries hardly add traffic
+    MERGE_COST_MODEL = MergeCostModel(expensive_function_cost=5.0, memory_access_cost=1.0)
 
     def generate_computation(self) -> Dict[str, Union[str, Dict]]:
         computation_name = (
@@ -129,25 +139,29 @@ class GTCNumpyBackend(BaseBackend, CLIBackendMixin):
             recursive_write(src_dir, self.generate_computation())
         return self.make_module()
 
+    def default_oir_pipeline(self) -> DefaultPipeline:
+        return DefaultPipeline(
+            skip=[
+                IJCacheDetection,
+                KCacheDetection,
+                PruneKCacheFills,
+                PruneKCacheFlushes,
+            ],
+            fast_math=self.builder.options.backend_opts.get("fast_math", False),
+            merge_cost_model=merge_cost_model(self),
+        )
+
     def _make_npir(self) -> npir.Computation:
         base_oir = GTIRToOIR().visit(self.builder.gtir)
-        oir_pipeline = self.builder.options.backend_opts.get(
-            "oir_pipeline",
-            DefaultPipeline(
-                skip=[
-                    IJCacheDetection,
-                    KCacheDetection,
-                    PruneKCacheFills,
-                    PruneKCacheFlushes,
-                ]
-            ),
-        )
-        oir = oir_pipeline.run(base_oir)
+        oir_pipeline = get_oir_pipeline(self)
+        oir = oir_pipeline.run(base_oir, build_info=self.builder.options.build_info)
         return OirToNpir().visit(oir)
 
     @property
     def npir(self) -> npir.Computation:
         key = "gtcnumpy:npir"
         if key not in self.builder.backend_data:
-            self.builder.with_backend_data({key: self._make_npir()})
+            self.builder.with_backend_data(
+                {key: self.builder.cached_ir("npir", self._make_npir, backend_specific=True)}
+            )
         return self.builder.backend_data[key]
@@ -267,7 +267,7 @@ class BaseModuleGenerator(abc.ABC):
         if self.builder.backend.USE_LEGACY_TOOLCHAIN:
             min_sequential_axis_size = 0
         else:
-            min_sequential_axis_size = compute_min_k_size(self.builder.gtir_pipeline.full())
+            min_sequential_axis_size = compute_min_k_size(self.builder.gtir)
         domain_info = repr(
             DomainInfo(
                 parallel_axes=tuple(ax.name for ax in parallel_axes),
@@ -407,17 +407,63 @@ class PyExtModuleGenerator(BaseModuleGenerator):
             return iir_has_effect(self.builder.implementation_ir)
         return gtir_has_effect(self.builder.gtir_pipeline)
 
-    def generate_implementation(self) -> str:
+    def _pyext_args(self, *, fields: bool = True, parameters: bool = True) -> List[str]:
+        """Arguments of the functions of the Python extension in the generated code."""
         definition_ir = self.builder.definition_ir
-        sources = gt_utils.text.TextBlock(indent_size=BaseModuleGenerator.TEMPLATE_INDENT_SIZE)
-
         args = []
         api_fields = set(field.name for field in definition_ir.api_fields)
         for arg in definition_ir.api_signature:
             if arg.name not in self.args_data.unreferenced:
-                args.append(arg.name)
                 if arg.name in api_fields:
-                    args.append("list(_origin_['{}'])".format(arg.name))
+                    if fields:
+                        args.extend([arg.name, "list(_origin_['{}'])".format(arg.name)])
+                elif parameters:
+                    args.append(arg.name)
+        return args
+
+    def generate_device_sync(self) -> str:
+        """Code waiting for the end of the computation after the Python extension returns."""
+        return ""
+
+    def generate_class_members(self) -> str:
+        if not self._has_effect() or self.builder.backend.USE_LEGACY_TOOLCHAIN:
+            return ""
+
+        # Override `StencilObject._bind` to convert the field buffers only once
+        api_fields = set(field.name for field in self.builder.definition_ir.api_fields)
+        api_names = [arg.name for arg in self.builder.definition_ir.api_signature]
+        field_names = [name for name in api_names if name in api_fields]
+        param_names = [name for name in api_names if name not in api_fields]
+        bind_args = ["list(_domain_)", *self._pyext_args(parameters=False)]
+        run_args = [*self._pyext_args(fields=False), "exec_info"]
+        run_params = ["exec_info", *(["*", *param_names] if param_names else [])]
+        body = [
+            self.generate_pre_run(),
+            "if exec_info is not None:",
+            "    exec_info['domain'] = _domain_",
+            "    exec_info['origin'] = _origin_",
+            "    exec_info['run_start_time'] = time.perf_counter()",
+            f"run_bound({', '.join(run_args)})",
+            self.generate_device_sync(),
+            "if exec_info is not None:",
+            "    exec_info['run_end_time'] = time.perf_counter()",
+            self.generate_post_run(),
+        ]
+        return "\n".join(
+            [
+                f"def _bind(self, _domain_, _origin_, {', '.join(['*', *field_names])}):",
+                f"    run_bound = pyext_module.bind_computation({', '.join(bind_args)})",
+                "",
+                f"    def run({', '.join(run_params)}):",
+                textwrap.indent("\n".join(line for line in body if line), " " * 8),
+                "",
+                "    return run",
+            ]
+        )
+
+    def generate_implementation(self) -> str:
+        sources = gt_utils.text.TextBlock(indent_size=BaseModuleGenerator.TEMPLATE_INDENT_SIZE)
+        args = self._pyext_args()
 
         # only generate implementation if any multi_stages are present. e.g. if no statement in the
         # stencil has any effect on the API fields, this may not be the case since they could be
@@ -439,14 +485,15 @@ class PyExtModuleGenerator(BaseModuleGenerator):
 class CUDAPyExtModuleGenerator(PyExtModuleGenerator):
     def generate_implementation(self) -> str:
         source = super().generate_implementation()
-        if self.builder.options.backend_opts.get("device_sync", True):
-            source += textwrap.dedent(
-                """
-                    cupy.cuda.Device(0).synchronize()
-                """
-            )
+        if device_sync := self.generate_device_sync():
+            source += "\n" + device_sync + "\n"
         return source
 
+    def generate_device_sync(self) -> str:
+        if self.builder.options.backend_opts.get("device_sync", True):
+            return "cupy.cuda.Device(0).synchronize()"
+        return ""
+
     def generate_imports(self) -> str:
         source = (
             textwrap.dedent(
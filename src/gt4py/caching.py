@@ -23,6 +23,7 @@ import sys
 import types
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import gt4py
 from gt4py import config as gt_config
 from gt4py import utils as gt_utils
 from gt4py.definitions import StencilID
@@ -60,6 +61,30 @@ class CachingStrategy(abc.ABC):
         """Calculate the file path where caching info for the current process should be stored."""
         raise NotImplementedError
 
+    @property
+    def formatting_cache_path(self) -> Optional[pathlib.Path]:
+        """Get the directory of the persistent cache of formatted sources (if any)."""
+        return None
+
+    @property
+    def tuning_info_path(self) -> Optional[pathlib.Path]:
+        """Get the file storing the autotuned OIR pipeline of the stencil (if any)."""
+        return None
+
+    def ir_cache_file(self, name: str, *, backend_specific: bool = False) -> Optional[pathlib.Path]:
+        """
+        Get the file of the persistent cache for the IR called `name` (if any).
+
+        Parameters
+        ----------
+        name:
+            Name of the intermediate representation
+
+        backend_specific:
+            Whether the IR depends on the backend or only on the stencil definition
+        """
+        return None
+
     @abc.abstractmethod
     def generate_cache_info(self) -> Dict[str, Any]:
         """
@@ -195,11 +220,29 @@ class JITCachingStrategy(CachingStrategy):
             backend_root.mkdir(parents=False)
         return backend_root
 
+    @property
+    def formatting_cache_path(self) -> Optional[pathlib.Path]:
+        return self.root_path / gt_config.cache_settings["formatting_dir_name"]
+
+    def ir_cache_file(self, name: str, *, backend_specific: bool = False) -> Optional[pathlib.Path]:
+        if not gt_config.cache_settings["ir_cache"]:
+            return None
+        if backend_specific:
+            name = f"{gt_utils.slugify(self.builder.backend.name)}_{name}"
+        # IRs may change with every gt4py version
+        version = gt_utils.shashed_id(self.stencil_id.version, gt4py.__version__)
+        file_name = f"{self.builder.options.qualified_name}__{name}_{version}.ir"
+        return self.root_path / gt_config.cache_settings["ir_dir_name"] / file_name
+
     @property
     def cache_info_path(self) -> Optional[pathlib.Path]:
         """Get the cache info file path from the stencil module path."""
         return self.builder.module_path.parent / f"{self.builder.module_path.stem}.cacheinfo"
 
+    @property
+    def tuning_info_path(self) -> Optional[pathlib.Path]:
+        return self.builder.module_path.parent / f"{self.builder.module_path.stem}.tuninginfo"
+
     def generate_cache_info(self) -> Dict[str, Any]:
         return {
             "backend": self.builder.backend.name,
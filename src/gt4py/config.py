@@ -73,8 +73,42 @@ cache_settings: Dict[str, Any] = {
     "root_path": os.environ.get("GT_CACHE_ROOT", os.path.abspath(".")),
     "load_retries": os.environ.get("GT_CACHE_LOAD_RETRIES", 3),
     "load_retry_delay": os.environ.get("GT_CACHE_LOAD_RETRY_DELAY", 100),  # unit miliseconds
+    "formatting_dir_name": os.environ.get("GT_CACHE_FORMATTING_DIR_NAME", "formatted_sources"),
+    # persistent cache of intermediate representations (disabled by default)
+    "ir_cache": os.environ.get("GT_CACHE_IR", "0").lower() in ("1", "true", "yes", "on"),
+    "ir_dir_name": os.environ.get("GT_CACHE_IR_DIR_NAME", "ir"),
 }
 
-code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
+code_settings: Dict[str, Any] = {
+    "root_package_name": "_GT_",
+    # skip formatting of all generated sources (not meant to be read in production runs)
+    "production": os.environ.get("GT_PRODUCTION", "0").lower() in ("1", "true", "yes", "on"),
+}
+
+storage_settings: Dict[str, Any] = {
+    # total size (in bytes) of the unused buffers kept for reuse by CPU storages (0 disables it)
+    "cpu_pool_max_bytes": int(os.environ.get("GT_STORAGE_CPU_POOL_MAX_BYTES", 0)),
+    # number of threads used for the parallel first touch of storages
+    "num_threads": int(
+        os.environ.get("OMP_NUM_THREADS", str(multiprocessing.cpu_count())).split(",")[0]
+    ),
+}
+
+execution_settings: Dict[str, Any] = {
+    # number of threads running the stencils submitted with `StencilObject.submit`
+    "submit_num_threads": int(
+        os.environ.get("GT_SUBMIT_NUM_THREADS", min(4, multiprocessing.cpu_count()))
+    ),
+}
+
+autotuning_settings: Dict[str, Any] = {
+    # domains on which the variants of the OIR pipeline are timed (e.g. "32x32x16,128x128x64")
+    "domains": [
+        tuple(int(size) for size in domain.split("x"))
+        for domain in os.environ.get("GT_AUTOTUNING_DOMAINS", "32x32x16,128x128x64").split(",")
+    ],
+    # number of timed runs per variant and domain (the fastest one counts)
+    "repetitions": int(os.environ.get("GT_AUTOTUNING_REPETITIONS", 3)),
+}
 
 os.environ.setdefault("DACE_CONFIG", os.path.join(os.path.abspath("."), ".dace.conf"))
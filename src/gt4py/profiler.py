@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Recording of the execution times of stencils.
+
+A :class:`Profiler` records every stencil call made while it is active (see
+:data:`active_profiler`), accumulating per-stencil statistics and, optionally,
+the events of a Chrome trace (which can be opened in ``chrome://tracing`` or
+https://ui.perfetto.dev)::
+
+    with gt4py.profiler.Profiler() as profiler:
+        for step in range(num_steps):
+            with profiler.region("time step"):
+                model.step()
+
+    print(profiler.summary())
+    profiler.save_chrome_trace("trace.json")
+
+When no profiler is active, stencil calls only check :data:`active_profiler`.
+"""
+
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+#: Profiler recording the stencil calls (`None` if profiling is disabled).
+active_profiler: Optional["Profiler"] = None
+
+#: Number of bins of the histograms of :class:`StencilStats`.
+HISTOGRAM_BINS = 32
+
+#: Upper bound (in seconds) of the first bin of the histograms, each next bin doubles it.
+HISTOGRAM_BASE = 1e-6
+
+TIMINGS = ("call", "run", "run_cpp")
+
+
+def histogram_bin(seconds: float) -> int:
+    """Index of the histogram bin of a time (bin `i` holds times up to ``HISTOGRAM_BASE * 2**i``)."""
+    if seconds <= HISTOGRAM_BASE:
+        return 0
+    return min(math.ceil(math.log2(seconds / HISTOGRAM_BASE)), HISTOGRAM_BINS - 1)
+
+
+@dataclass
+class TimingStats:
+    """Statistics of one kind of time (see :data:`TIMINGS`) of the calls of a stencil."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * HISTOGRAM_BINS)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.histogram[histogram_bin(seconds)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate of a quantile (the upper bound of the histogram bin containing it)."""
+        if not self.count:
+            return 0.0
+        threshold = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.histogram):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(HISTOGRAM_BASE * 2 ** index, self.max)
+        return self.max
+
+
+@dataclass
+class StencilStats:
+    """Statistics of the calls of a stencil."""
+
+    name: str
+    backend: str
+    ncalls: int = 0
+    timings: Dict[str, TimingStats] = field(
+        default_factory=lambda: {kind: TimingStats() for kind in TIMINGS}
+    )
+    stencil_id: Optional[str] = None
+
+
+class Profiler:
+    """Recorder of the execution times of stencils.
+
+    Parameters
+    ----------
+    trace: record the events of a Chrome trace (besides the statistics)
+
+    max_events: maximum number of trace events (the following ones are dropped and counted
+        in :attr:`dropped_events`)
+    """
+
+    def __init__(self, *, trace: bool = True, max_events: int = 1_000_000):
+        self.trace = trace
+        self.max_events = max_events
+        #: Statistics of each stencil, keyed by stencil id (see :meth:`record`)
+        self.stats: Dict[str, StencilStats] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.dropped_events = 0
+        self._lock = threading.Lock()
+        self._previous: List[Optional[Profiler]] = []
+        self._origin = time.perf_counter()
+
+    def start(self) -> "Profiler":
+        """Make this profiler the active one (until :meth:`stop` is called)."""
+        global active_profiler
+        self._previous.append(active_profiler)
+        active_profiler = self
+        return self
+
+    def stop(self) -> None:
+        """Restore the profiler which was active before :meth:`start`."""
+        global active_profiler
+        active_profiler = self._previous.pop()
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def clear(self) -> None:
+        """Remove all the recorded statistics and events."""
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+            self.dropped_events = 0
+            self._origin = time.perf_counter()
+
+    def _add_event(self, name: str, category: str, start: float, end: float, **args) -> None:
+        if len(self.events) >= self.max_events:
+            self.dropped_events += 1
+            return
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def record(
+        self,
+        name: str,
+        backend: str,
+        exec_info: Dict[str, Any],
+        *,
+        stencil_id: Optional[str] = None,
+    ) -> None:
+        """Record a stencil call from the times in its `exec_info` dictionary.
+
+        The statistics are accumulated per `stencil_id` (the name is used if it is not given),
+        so stencils with the same name, e.g. built for several backends or from different
+        definitions, are kept apart.
+
+        The `call` times are the ones of the whole call (``call_start_time`` and
+        ``call_end_time``, or ``call_run_start_time`` and ``call_run_end_time`` for frozen
+        and bound stencils), the `run` times the ones of the generated ``run`` method and the
+        `run_cpp` times the ones of the C++ computation of compiled backends.
+        """
+        call_start = exec_info.get("call_start_time", exec_info.get("call_run_start_time"))
+        call_end = exec_info.get("call_end_time", exec_info.get("call_run_end_time"))
+        run_start = exec_info.get("run_start_time")
+        run_end = exec_info.get("run_end_time")
+        cpp_start = exec_info.get("run_cpp_start_time")
+        cpp_end = exec_info.get("run_cpp_end_time")
+        times = {
+            "call": (call_start, call_end),
+            "run": (run_start, run_end),
+            "run_cpp": (cpp_start, cpp_end),
+        }
+
+        with self._lock:
+            key = name if stencil_id is None else stencil_id
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StencilStats(name, backend, stencil_id=stencil_id)
+            stats.ncalls += 1
+            for kind, (start, end) in times.items():
+                if start is not None and end is not None:
+                    stats.timings[kind].add(end - start)
+
+            if self.trace:
+                if call_start is not None and call_end is not None:
+                    self._add_event(name, "call", call_start, call_end, backend=backend)
+                if run_start is not None and run_end is not None:
+                    # the C++ times are not measured with the clock of `time.perf_counter`
+                    args = {"domain": str(exec_info.get("domain"))}
+                    if cpp_start is not None and cpp_end is not None:
+                        args["run_cpp_time_us"] = (cpp_end - cpp_start) * 1e6
+                    self._add_event(f"{name}.run", "run", run_start, run_end, **args)
+
+    @contextlib.contextmanager
+    def region(self, name: str) -> Iterator[None]:
+        """Mark a region of user code (e.g. a time step or a model component) in the trace."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if self.trace:
+                with self._lock:
+                    self._add_event(name, "region", start, end)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the recorded events in the Chrome trace event format."""
+        with self._lock:
+            return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename) -> None:
+        """Write the recorded events to a Chrome trace JSON file."""
+        with open(filename, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def summary(self, *, sort_by: str = "call") -> str:
+        """Return a table with the statistics of each stencil, sorted by total time.
+
+        Parameters
+        ----------
+        sort_by: kind of time (one of :data:`TIMINGS`) used to sort the stencils
+        """
+        if sort_by not in TIMINGS:
+            raise ValueError(f"Invalid timing '{sort_by}' (must be one of {TIMINGS}).")
+        with self._lock:
+            stats = sorted(
+                self.stats.values(), key=lambda item: item.timings[sort_by].total, reverse=True
+            )
+            grand_total = sum(item.timings[sort_by].total for item in stats) or 1.0
+
+            header = (
+                f"{'stencil':<32} {'backend':<18} {'calls':>7} {'total [ms]':>11} {'%':>6}"
+                f" {'mean [us]':>10} {'p90 [us]':>10} {'run [%]':>8} {'cpp [%]':>8}"
+            )
+            lines = [header, "-" * len(header)]
+            for item in stats:
+                call, run, cpp = (item.timings[kind] for kind in TIMINGS)
+                sorted_timing = item.timings[sort_by]
+                run_ratio = f"{100 * run.total / call.total:.1f}" if call.total else "-"
+                cpp_ratio = (
+                    f"{100 * cpp.total / call.total:.1f}" if call.total and cpp.count else "-"
+                )
+                lines.append(
+                    f"{item.name[:32]:<32} {item.backend[:18]:<18} {item.ncalls:>7}"
+                    f" {sorted_timing.total * 1e3:>11.3f}"
+                    f" {100 * sorted_timing.total / grand_total:>6.1f}"
+                    f" {sorted_timing.mean * 1e6:>10.1f} {sorted_timing.quantile(0.9) * 1e6:>10.1f}"
+                    f" {run_ratio:>8} {cpp_ratio:>8}"
+                )
+            return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profile(**kwargs: Any) -> Iterator[Profiler]:
+    """Record the stencil calls in the context in a new :class:`Profiler`."""
+    with Profiler(**kwargs) as profiler:
+        yield profiler
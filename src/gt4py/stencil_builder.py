@@ -14,11 +14,16 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import contextlib
+import os
 import pathlib
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
+import tempfile
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, Type, TypeVar, Union
 
 import gt4py.caching
 import gt4py.frontend
+from eve import codegen, serialization
+from gt4py import config as gt_config
 from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
 from gt4py.definitions import BuildOptions, StencilID
 from gt4py.type_hints import AnnotatedStencilFunc, StencilFunc
@@ -34,6 +39,12 @@ if TYPE_CHECKING:
     from gt4py.stencil_object import StencilObject
 
 
+T = TypeVar("T")
+
+#: Build info entries stored in the IR cache together with the IR generated with them
+IR_CACHE_BUILD_INFO_KEYS = ("oir_pipeline", "autotuning")
+
+
 class StencilBuilder:
     """
     Orchestrates code generation and compilation.
@@ -85,16 +96,30 @@ class StencilBuilder:
         # load or generate
         stencil_class = None if self.options.rebuild else self.backend.load()
         if stencil_class is None:
-            stencil_class = self.backend.generate()
+            with self.formatting_settings():
+                stencil_class = self.backend.generate()
         return stencil_class
 
     def generate_computation(self) -> Dict[str, Union[str, Dict]]:
         """Generate the stencil source code, fail if backend does not support CLI."""
-        return self.cli_backend.generate_computation()
+        with self.formatting_settings():
+            return self.cli_backend.generate_computation()
 
     def generate_bindings(self, targe_language: str) -> Dict[str, Union[str, Dict]]:
         """Generate ``target_language`` bindings source, fail if backend does not support CLI."""
-        return self.cli_backend.generate_bindings(targe_language)
+        with self.formatting_settings():
+            return self.cli_backend.generate_bindings(targe_language)
+
+    @contextlib.contextmanager
+    def formatting_settings(self) -> Iterator[None]:
+        """Apply the gt4py code settings to the formatting of generated sources."""
+        settings = codegen.FORMATTING_SETTINGS
+        cache_path = self.caching.formatting_cache_path
+        with codegen.formatting_settings(
+            production=gt_config.code_settings["production"] or settings["production"],
+            cache_dir=str(cache_path) if cache_path else settings["cache_dir"],
+        ):
+            yield
 
     def with_caching(
         self: "StencilBuilder", caching_strategy_name: str, *args: Any, **kwargs: Any
@@ -255,11 +280,89 @@ class StencilBuilder:
     def pkg_path(self) -> pathlib.Path:
         return self.caching.backend_root_path.joinpath(*self.options.qualified_name.split("."))
 
+    def cached_ir(
+        self, name: str, factory: Callable[[], T], *, backend_specific: bool = False
+    ) -> T:
+        """
+        Load an intermediate representation from the persistent IR cache or generate it.
+
+        Parameters
+        ----------
+        name:
+            Name of the IR in the cache
+
+        factory:
+            Generates the IR if it is not cached (the result is then stored in the cache)
+
+        backend_specific:
+            Whether the IR depends on the backend or only on the stencil definition
+
+        Notes
+        -----
+        The IR cache is only used if enabled in the cache settings and if supported by the
+        caching strategy. It is keyed by the stencil fingerprint, so IRs are never loaded
+        for a modified stencil definition. Unreadable cache entries are regenerated.
+
+        The build info entries in :data:`IR_CACHE_BUILD_INFO_KEYS` set while generating
+        the IR (e.g. the OIR pipeline statistics) are stored with it and restored when it
+        is loaded, and the ``"ir_cache_hit"`` build info entry tells if any IR was loaded.
+        """
+        cache_file = self.caching.ir_cache_file(name, backend_specific=backend_specific)
+        if cache_file is None:
+            return factory()
+
+        build_info = self.options.build_info
+        if not self.options.rebuild and cache_file.exists():
+            try:
+                with cache_file.open("rb") as f:
+                    result, cached_build_info = serialization.load(f)
+            except Exception:
+                pass
+            else:
+                if build_info is not None:
+                    build_info.update(cached_build_info)
+                    build_info["ir_cache_hit"] = True
+                return result
+
+        def cacheable_build_info() -> Dict[str, Any]:
+            if build_info is None:
+                return {}
+            return {key: build_info[key] for key in IR_CACHE_BUILD_INFO_KEYS if key in build_info}
+
+        if build_info is not None:
+            build_info.setdefault("ir_cache_hit", False)
+        previous_build_info = cacheable_build_info()
+        result = factory()
+        generated_build_info = {
+            key: value
+            for key, value in cacheable_build_info().items()
+            if value is not previous_build_info.get(key, None)
+        }
+        try:
+            data = serialization.dumps((result, generated_build_info))
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, cache_file)
+            finally:
+                if os.path.exists(tmp_name):
+                    os.remove(tmp_name)
+        except Exception:
+            # The IR cache is only an optimization
+            pass
+
+        return result
+
     @property
     def definition_ir(self) -> "StencilDefinition":
-        return self._build_data.get("ir") or self._build_data.setdefault(
-            "ir", self.frontend.generate(self.definition, self.externals, self.options)
-        )
+        if "ir" not in self._build_data:
+            self._build_data["ir"] = self.cached_ir(
+                "definition_ir",
+                lambda: self.frontend.generate(self.definition, self.externals, self.options),
+            )
+        return self._build_data["ir"]
 
     @property
     def implementation_ir(self) -> "StencilImplementation":
@@ -269,13 +372,20 @@ class StencilBuilder:
 
     @property
     def gtir_pipeline(self) -> GtirPipeline:
-        return self._build_data.get("gtir_pipeline") or self._build_data.setdefault(
-            "gtir_pipeline", GtirPipeline(DefIRToGTIR.apply(self.definition_ir))
-        )
+        if "gtir_pipeline" not in self._build_data:
+            self._build_data["gtir_pipeline"] = GtirPipeline(
+                self.cached_ir("gtir", lambda: DefIRToGTIR.apply(self.definition_ir))
+            )
+        return self._build_data["gtir_pipeline"]
 
     @property
     def gtir(self) -> gtir.Stencil:
-        return self.gtir_pipeline.full()
+        if "gtir" not in self._build_data:
+            pipeline = self.gtir_pipeline
+            node = self.cached_ir("gtir_full", pipeline.full)
+            pipeline.seed(node)
+            self._build_data["gtir"] = node
+        return self._build_data["gtir"]
 
     @property
     def module_name(self) -> str:
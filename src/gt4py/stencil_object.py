@@ -16,17 +16,22 @@
 
 import abc
 import collections.abc
+import concurrent.futures
+import inspect
 import sys
+import threading
 import time
 import typing
 import warnings
 from dataclasses import dataclass
 from pickle import dumps
-from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 import gt4py.backend as gt_backend
+import gt4py.config as gt_config
+import gt4py.profiler as gt_profiler
 import gt4py.storage as gt_storage
 import gt4py.utils as gt_utils
 from gt4py.definitions import AccessKind, DomainInfo, FieldInfo, Index, ParameterInfo, Shape
@@ -46,6 +51,28 @@ def _compute_cache_key(field_args, parameter_args, domain, origin) -> int:
     return hash((field_data, *parameter_args.keys(), dumps(domain), dumps(origin)))
 
 
+def _data_ptr(field) -> int:
+    # Device pointer of explicitly synced GPU storages and CuPy arrays, host pointer otherwise
+    if isinstance(field, gt_storage.storage.ExplicitlySyncedGPUStorage):
+        return field._ptr
+    return field.ctypes.data if isinstance(field, np.ndarray) else field.data.ptr
+
+
+_submit_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_submit_executor_lock = threading.Lock()
+
+
+def _get_submit_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _submit_executor
+    with _submit_executor_lock:
+        if _submit_executor is None:
+            _submit_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=gt_config.execution_settings["submit_num_threads"],
+                thread_name_prefix="gt4py-stencil",
+            )
+        return _submit_executor
+
+
 @dataclass(frozen=True)
 class FrozenStencil:
     """Stencil with pre-computed domain and origin for each field argument."""
@@ -64,6 +91,9 @@ class FrozenStencil:
     def __call__(self, **kwargs) -> None:
         assert "origin" not in kwargs and "domain" not in kwargs
         exec_info = kwargs.get("exec_info")
+        profiler = gt_profiler.active_profiler
+        if profiler is not None and exec_info is None:
+            exec_info = {}
 
         if exec_info is not None:
             exec_info["call_run_start_time"] = time.perf_counter()
@@ -81,6 +111,60 @@ class FrozenStencil:
 
         if exec_info is not None:
             exec_info["call_run_end_time"] = time.perf_counter()
+        if profiler is not None:
+            profiler.record(
+                self.stencil_object.options["name"],
+                self.stencil_object.backend,
+                exec_info,
+                stencil_id=self.stencil_object._gt_id_,
+            )
+
+    def submit(self, **kwargs) -> concurrent.futures.Future:
+        """Run the stencil asynchronously (see :meth:`StencilObject.submit`)."""
+        return _get_submit_executor().submit(self, **kwargs)
+
+
+@dataclass(frozen=True)
+class BoundStencil:
+    """Stencil with fixed field arguments, domain and origin, called with the parameters only.
+
+    Created by :meth:`StencilObject.bind`, which prepares the fields (e.g. the conversion of
+    the buffers of compiled backends) once for all the calls. The fields are kept alive by
+    this object and must not be reallocated while it is used.
+    """
+
+    stencil_object: "StencilObject"
+    field_args: Dict[str, Any]
+    origin: Dict[str, Tuple[int, ...]]
+    domain: Tuple[int, ...]
+    run: Callable[..., None]
+
+    def __call__(
+        self, *, validate_args: bool = True, exec_info: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> None:
+        profiler = gt_profiler.active_profiler
+        if profiler is not None and exec_info is None:
+            exec_info = {}
+        if exec_info is not None:
+            exec_info["call_run_start_time"] = time.perf_counter()
+
+        if validate_args:
+            self.stencil_object._validate_parameter_args(kwargs)
+        parameter_args = {
+            name: kwargs.get(name) for name in self.stencil_object.parameter_info.keys()
+        }
+
+        self.run(exec_info, **parameter_args)
+
+        if exec_info is not None:
+            exec_info["call_run_end_time"] = time.perf_counter()
+        if profiler is not None:
+            profiler.record(
+                self.stencil_object.options["name"],
+                self.stencil_object.backend,
+                exec_info,
+                stencil_id=self.stencil_object._gt_id_,
+            )
 
 
 class StencilObject(abc.ABC):
@@ -276,7 +360,7 @@ class StencilObject(abc.ABC):
         else:
             return max_domain
 
-    def _validate_args(  # noqa: C901  # Function is too complex
+    def _validate_args(
         self,
         field_args: Dict[str, FieldType],
         param_args: Dict[str, Any],
@@ -294,7 +378,17 @@ class StencilObject(abc.ABC):
             TypeError
                 If an incorrect field or parameter data type is passed.
         """
-        assert isinstance(field_args, dict) and isinstance(param_args, dict)
+        self._validate_field_args(field_args, domain, origin)
+        self._validate_parameter_args(param_args)
+
+    def _validate_field_args(  # noqa: C901  # Function is too complex
+        self,
+        field_args: Dict[str, FieldType],
+        domain: Tuple[int, ...],
+        origin: Dict[str, Tuple[int, ...]],
+    ) -> None:
+        """Validate the domain, origin and field arguments (see :meth:`_validate_args`)."""
+        assert isinstance(field_args, dict)
 
         # validate domain sizes
         domain_ndim = self.domain_info.ndim
@@ -402,6 +496,10 @@ class StencilObject(abc.ABC):
                         f"Shape of field {name} is {field.shape} but must be at least {min_shape} for given domain and origin."
                     )
 
+    def _validate_parameter_args(self, param_args: Dict[str, Any]) -> None:
+        """Validate the parameter arguments (see :meth:`_validate_args`)."""
+        assert isinstance(param_args, dict)
+
         # assert compatibility of parameters with stencil
         for name, parameter_info in self.parameter_info.items():
             if parameter_info.access != AccessKind.NONE:
@@ -509,6 +607,169 @@ class StencilObject(abc.ABC):
         if exec_info is not None:
             exec_info["call_run_end_time"] = time.perf_counter()
 
+    def batched(self, *args, **kwargs) -> None:
+        """Run the stencil for all the members of an ensemble in a single call.
+
+        Takes the same arguments as a regular call, but each field or parameter argument can
+        be either a sequence (`list` or `tuple`) with one value per member, or a single value
+        shared by all the members. The arguments are validated once for the whole batch:
+        the arguments of the first member are fully validated and the batched fields of the
+        other members must have the same type, shape, strides, dtype, default origin and
+        alignment of the data pointer (and the parameters the same type) as the ones of the
+        first member. Then all the members are run by a loop in the generated stencil module,
+        using the same domain and origin. The loop still dispatches each member separately
+        to the backend implementation (one call into the compiled extension per member for
+        the C++ backends), so batching saves the argument processing, not the calls.
+
+        Check :class:`StencilObject` for a full specification of the `domain`, `origin`,
+        `validate_args` and `exec_info` keyword arguments.
+
+        This generic implementation (for stencil classes not generated by a backend) calls
+        the stencil once per member, validating the arguments of every member.
+        """
+        bound_args = inspect.signature(self.__call__).bind(*args, **kwargs)
+        members = self._batch_members(
+            {
+                name: value
+                for name, value in bound_args.arguments.items()
+                if name in self.field_info or name in self.parameter_info
+            }
+        )
+        for member in members:
+            bound_args.arguments.update(member)
+            self(*bound_args.args, **bound_args.kwargs)
+        exec_info = bound_args.arguments.get("exec_info", None)
+        if exec_info is not None:
+            exec_info["batch_size"] = len(members)
+
+    @staticmethod
+    def _batch_members(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split the arguments of a batched call into the arguments of each member."""
+        batched_names = [name for name, value in args.items() if isinstance(value, (list, tuple))]
+        if not batched_names:
+            raise ValueError("Batched calls require at least one argument with a value per member.")
+        batch_sizes = {len(args[name]) for name in batched_names}
+        if len(batch_sizes) != 1:
+            raise ValueError(
+                f"Batched arguments have different numbers of members ({sorted(batch_sizes)})."
+            )
+        return [
+            {name: value[i] if name in batched_names else value for name, value in args.items()}
+            for i in range(batch_sizes.pop())
+        ]
+
+    def _call_run_batched(
+        self,
+        field_args: Dict[str, Any],
+        parameter_args: Dict[str, Any],
+        domain: Optional[Tuple[int, ...]],
+        origin: Optional[OriginType],
+        *,
+        validate_args: bool = True,
+        exec_info: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Check the arguments of a batched call once and run all the members (see :meth:`batched`)."""
+        if exec_info is not None:
+            exec_info["call_run_start_time"] = time.perf_counter()
+
+        args = {**field_args, **parameter_args}
+        batched_names = [name for name, value in args.items() if isinstance(value, (list, tuple))]
+        members = self._batch_members(args)
+        if not members:
+            return
+
+        first_field_args = {name: members[0][name] for name in field_args}
+        first_parameter_args = {name: members[0][name] for name in parameter_args}
+        cache_key = _compute_cache_key(first_field_args, first_parameter_args, domain, origin)
+        if cache_key not in self._domain_origin_cache:
+            origin = self._normalize_origins(first_field_args, origin)
+
+            if domain is None:
+                domain = self._get_max_domain(first_field_args, origin)
+
+            if validate_args:
+                self._validate_args(first_field_args, first_parameter_args, domain, origin)
+
+            type(self)._domain_origin_cache[cache_key] = (domain, origin)
+        else:
+            domain, origin = type(self)._domain_origin_cache[cache_key]
+
+        if validate_args:
+            self._validate_batch_members(members, batched_names)
+
+        self._run_batched(  # type: ignore[attr-defined]  # generated method
+            _domain_=domain, _origin_=origin, exec_info=exec_info, _members_=members
+        )
+
+        if exec_info is not None:
+            exec_info["batch_size"] = len(members)
+            exec_info["call_run_end_time"] = time.perf_counter()
+
+    def _validate_batch_members(self, members: List[Dict[str, Any]], names: List[str]) -> None:
+        """Check that the batched arguments of all members are compatible with the first one."""
+        for name in names:
+            first = members[0][name]
+            if name in self.field_info:
+                if self.field_info[name].access == AccessKind.NONE:
+                    continue
+                layout = (
+                    type(first),
+                    first.shape,
+                    first.strides,
+                    first.dtype,
+                    getattr(first, "default_origin", None),
+                )
+                alignment = (
+                    gt_backend.from_name(self.backend).storage_info["alignment"]
+                    * first.dtype.itemsize
+                )
+                first_misalignment = _data_ptr(first) % alignment
+                for i, member in enumerate(members[1:], 1):
+                    field = member[name]
+                    if (
+                        type(field),
+                        getattr(field, "shape", None),
+                        getattr(field, "strides", None),
+                        getattr(field, "dtype", None),
+                        getattr(field, "default_origin", None),
+                    ) != layout:
+                        raise ValueError(
+                            f"Field '{name}' of member {i} does not have the type, shape, strides, "
+                            "dtype and default origin of the first member."
+                        )
+                    if _data_ptr(field) % alignment != first_misalignment:
+                        raise ValueError(
+                            f"The data of field '{name}' of member {i} does not have the "
+                            "alignment of the first member."
+                        )
+                    if isinstance(field, gt_storage.storage.Storage) and not field.is_stencil_view:
+                        raise ValueError(
+                            f"An incompatible view was passed for field {name} of member {i}."
+                        )
+            else:
+                for i, member in enumerate(members[1:], 1):
+                    if type(member[name]) != type(first):
+                        raise TypeError(
+                            f"The type of parameter '{name}' of member {i} is "
+                            f"'{type(member[name])}' instead of '{type(first)}'"
+                        )
+
+    def submit(self, *args, **kwargs) -> concurrent.futures.Future:
+        """Run the stencil asynchronously in a thread pool shared by all stencils.
+
+        Takes the same arguments as a regular call and returns a
+        :class:`concurrent.futures.Future`, whose result is `None` once the stencil has run
+        (or which raises the exception of the call). Stencils of the compiled backends run
+        without holding the GIL, so independent stencils submitted together (e.g. stencils
+        of a time step which do not write the fields used by each other) run concurrently.
+        Ordering between dependent stencils is left to the caller, e.g. by waiting for the
+        future of the first one before submitting the second one.
+
+        The size of the thread pool is set by the ``"submit_num_threads"`` execution setting
+        (see :mod:`gt4py.config`) before the first submission.
+        """
+        return _get_submit_executor().submit(self, *args, **kwargs)
+
     def freeze(
         self: "StencilObject", *, origin: Dict[str, Tuple[int, ...]], domain: Tuple[int, ...]
     ) -> FrozenStencil:
@@ -537,6 +798,61 @@ class StencilObject(abc.ABC):
         """
         return FrozenStencil(self, origin, domain)
 
+    def bind(
+        self: "StencilObject",
+        *,
+        domain: Optional[Tuple[int, ...]] = None,
+        origin: Optional[OriginType] = None,
+        validate_args: bool = True,
+        **kwargs,
+    ) -> BoundStencil:
+        """Return a handle running the stencil on fixed fields with varying parameters.
+
+        The fields (passed by name), domain and origin are checked and prepared once, and the
+        returned :class:`BoundStencil` is then called with the parameters only, e.g.
+        ``bound = stencil.bind(in_field=a, out_field=b)`` and ``bound(alpha=0.5)``. This skips
+        the per-call processing of the fields, which is significant for small domains.
+
+        Check :class:`StencilObject` for a full specification of the `domain`, `origin` and
+        `validate_args` keyword arguments.
+        """
+        unknown_names = set(kwargs) - set(self.field_info)
+        if unknown_names:
+            raise TypeError(f"Invalid field names {sorted(unknown_names)} for bind().")
+        field_args = {name: kwargs.get(name) for name in self.field_info.keys()}
+
+        origin = self._normalize_origins(field_args, origin)
+        if domain is None:
+            domain = self._get_max_domain(field_args, origin)
+        if validate_args:
+            self._validate_field_args(field_args, domain, origin)
+
+        run = self._bind(domain, origin, **field_args)
+        return BoundStencil(self, field_args, origin, domain, run)
+
+    def _bind(
+        self,
+        _domain_: Tuple[int, ...],
+        _origin_: Dict[str, Tuple[int, ...]],
+        **field_args,
+    ) -> Callable[..., None]:
+        """Return a function running the stencil on the given fields, domain and origin.
+
+        The function takes the `exec_info` dictionary and the parameters (as keyword arguments).
+        Generated stencil classes may override this method to prepare the fields once.
+        """
+
+        def run(exec_info: Optional[Dict[str, Any]], **parameter_args) -> None:
+            self.run(
+                _domain_=_domain_,
+                _origin_=_origin_,
+                exec_info=exec_info,
+                **field_args,
+                **parameter_args,
+            )
+
+        return run
+
     def clean_call_args_cache(self: "StencilObject") -> None:
         """Clean the argument cache.
 
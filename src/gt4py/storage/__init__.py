@@ -17,7 +17,8 @@
 """GridTools storages classes."""
 
 
-from .storage import Storage, empty, from_array, ones, zeros
+from .checkpoint import load_checkpoint, save_checkpoint
+from .storage import Storage, empty, from_array, load, memmap, ones, save, zeros
 
 
 _numpy_array_patch = None
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checkpoints of many storages in a single chunked and compressed file.
+
+The values of each storage are split in chunks of consecutive slices along its
+first dimension, which are compressed independently by a pool of threads (the
+compressors release the GIL). A checkpoint file contains:
+
+- a magic string,
+- the compressed chunks of all the storages, one after the other,
+- an index encoded as JSON, with the metadata of each storage (backend, default
+  origin, mask, dtype and shape) and the position of its chunks in the file,
+- the position of the index as a 64 bit little-endian integer.
+
+Storages are restored by allocating new storages (for the original or any other
+backend) and decompressing the chunks directly into their memory.
+"""
+
+import bz2
+import collections
+import concurrent.futures
+import json
+import lzma
+import struct
+import zlib
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from gt4py import config as gt_config
+
+from . import storage as gt_storage
+
+
+#: Supported compression methods (``None`` stores the chunks uncompressed).
+COMPRESSIONS: Dict[Optional[str], Tuple[Callable[..., bytes], Callable[[bytes], bytes]]] = {
+    None: (lambda data, level: bytes(data), bytes),
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress),
+    "bz2": (lambda data, level: bz2.compress(data, level), bz2.decompress),
+    "lzma": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"\x93GT4PY-CHECKPOINT\x01\n"
+_INDEX_POSITION = struct.Struct("<Q")
+
+
+def _host_array(storage: gt_storage.Storage) -> np.ndarray:
+    return storage.view(np.ndarray)
+
+
+def _chunk_rows(shape: Tuple[int, ...], itemsize: int, chunk_size: int) -> int:
+    row_size = int(np.prod(shape[1:], dtype=np.int64)) * itemsize
+    return max(1, chunk_size // max(row_size, 1))
+
+
+def _chunk_slices(shape: Tuple[int, ...], rows: int) -> List[Any]:
+    if not shape:
+        return [Ellipsis]
+    return [slice(start, start + rows) for start in range(0, shape[0], rows)]
+
+
+def _run_bounded(
+    executor: concurrent.futures.Executor,
+    func: Callable[..., Any],
+    items: Iterable[Any],
+    max_pending: int,
+) -> Iterable[Any]:
+    """Like :meth:`Executor.map`, but with at most `max_pending` unfinished tasks."""
+    pending: Deque[concurrent.futures.Future] = collections.deque()
+    for item in items:
+        pending.append(executor.submit(func, *item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def save_checkpoint(
+    filename,
+    storages: Mapping[str, gt_storage.Storage],
+    *,
+    compression: Optional[str] = "zlib",
+    level: int = 1,
+    chunk_size: int = 4 * 1024 ** 2,
+    num_threads: Optional[int] = None,
+) -> None:
+    """Write the values and metadata of several storages into a checkpoint file.
+
+    Parameters
+    ----------
+    filename: path of the checkpoint file
+
+    storages: mapping from names to storages
+
+    compression: one of :data:`COMPRESSIONS`
+
+    level: compression level (higher levels are slower and compress more)
+
+    chunk_size: approximate size (in bytes) of the uncompressed chunks
+
+    num_threads: number of threads compressing the chunks (defaults to the
+        ``"num_threads"`` storage setting)
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Invalid compression '{compression}'.")
+    compress = COMPRESSIONS[compression][0]
+    if num_threads is None:
+        num_threads = gt_config.storage_settings["num_threads"]
+    num_threads = max(num_threads, 1)
+
+    index: Dict[str, Any] = {"version": FORMAT_VERSION, "compression": compression, "storages": {}}
+    tasks = []
+    for name, storage in storages.items():
+        if not isinstance(storage, gt_storage.Storage):
+            raise TypeError(f"Value of '{name}' is not a storage.")
+        storage.device_to_host()
+        array = _host_array(storage)
+        if array.dtype.fields is not None:
+            raise ValueError("Checkpoints do not support structured data types.")
+        rows = _chunk_rows(array.shape, array.itemsize, chunk_size)
+        index["storages"][name] = {
+            "backend": storage.backend,
+            "default_origin": storage.default_origin,
+            "mask": storage.mask,
+            "dtype": array.dtype.str,
+            "shape": array.shape,
+            "chunk_rows": rows,
+            "chunks": [],
+        }
+        for chunk in _chunk_slices(array.shape, rows):
+            tasks.append((name, array, chunk))
+
+    def _compress_chunk(name: str, array: np.ndarray, chunk: slice) -> Tuple[str, bytes]:
+        return name, compress(np.ascontiguousarray(array[chunk]).data, level)
+
+    with open(filename, "wb") as file, concurrent.futures.ThreadPoolExecutor(
+        num_threads
+    ) as executor:
+        file.write(_MAGIC)
+        position = len(_MAGIC)
+        for name, data in _run_bounded(executor, _compress_chunk, tasks, 2 * num_threads):
+            file.write(data)
+            index["storages"][name]["chunks"].append((position, len(data)))
+            position += len(data)
+        file.write(json.dumps(index).encode())
+        file.write(_INDEX_POSITION.pack(position))
+
+
+def read_checkpoint_index(filename) -> Dict[str, Any]:
+    """Read the index of a checkpoint file with the metadata of its storages."""
+    with open(filename, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"'{filename}' is not a checkpoint file.")
+        file.seek(-_INDEX_POSITION.size, 2)
+        end = file.tell()
+        (position,) = _INDEX_POSITION.unpack(file.read(_INDEX_POSITION.size))
+        file.seek(position)
+        index = json.loads(file.read(end - position).decode())
+    if index["version"] != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint format version {index['version']} (expected {FORMAT_VERSION})."
+        )
+    return index
+
+
+def load_checkpoint(
+    filename,
+    backend: Optional[str] = None,
+    *,
+    names: Optional[Iterable[str]] = None,
+    managed_memory: bool = False,
+    num_threads: Optional[int] = None,
+) -> Dict[str, gt_storage.Storage]:
+    """Restore the storages of a checkpoint file.
+
+    Parameters
+    ----------
+    filename: path of the checkpoint file
+
+    backend: backend of the new storages (defaults to the backend of each saved storage)
+
+    names: names of the storages to restore (defaults to all of them)
+
+    managed_memory: use managed memory for GPU storages (see :func:`gt4py.storage.empty`)
+
+    num_threads: number of threads decompressing the chunks (defaults to the
+        ``"num_threads"`` storage setting)
+
+    Returns
+    -------
+    A dictionary from names to the new storages, which have the same default origin,
+    mask, dtype and shape as the saved ones.
+    """
+    index = read_checkpoint_index(filename)
+    decompress = COMPRESSIONS[index["compression"]][1]
+    if num_threads is None:
+        num_threads = gt_config.storage_settings["num_threads"]
+    num_threads = max(num_threads, 1)
+    names = list(index["storages"]) if names is None else list(names)
+    for name in names:
+        if name not in index["storages"]:
+            raise KeyError(f"Storage '{name}' is not in the checkpoint.")
+
+    storages: Dict[str, gt_storage.Storage] = {}
+    tasks = []
+    for name in names:
+        info = index["storages"][name]
+        storage = gt_storage.empty(
+            backend or info["backend"],
+            tuple(info["default_origin"]),
+            tuple(info["shape"]),
+            np.dtype(info["dtype"]),
+            mask=tuple(info["mask"]),
+            managed_memory=managed_memory,
+        )
+        storages[name] = storage
+        array = _host_array(storage)
+        chunks = _chunk_slices(array.shape, info["chunk_rows"])
+        for chunk, (position, size) in zip(chunks, info["chunks"]):
+            tasks.append((array, chunk, position, size))
+
+    def _read_tasks(file):
+        for array, chunk, position, size in tasks:
+            file.seek(position)
+            yield array, chunk, file.read(size)
+
+    def _decompress_chunk(array: np.ndarray, chunk: slice, data: bytes) -> None:
+        target = array[chunk]
+        target[...] = np.frombuffer(decompress(data), dtype=array.dtype).reshape(target.shape)
+
+    with open(filename, "rb") as file, concurrent.futures.ThreadPoolExecutor(
+        num_threads
+    ) as executor:
+        for _ in _run_bounded(executor, _decompress_chunk, _read_tasks(file), 2 * num_threads):
+            pass
+
+    for storage in storages.values():
+        storage.host_to_device(force=True)
+
+    return storages
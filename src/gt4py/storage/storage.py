@@ -14,7 +14,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
 import itertools
+import warnings
 from typing import Dict
 
 import numpy as np
@@ -36,9 +38,22 @@ def _error_on_invalid_backend(backend):
         raise RuntimeError(f"Backend '{backend}' is not registered.")
 
 
-def empty(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def empty(
+    backend, default_origin, shape, dtype, mask=None, *, managed_memory=False, first_touch=None
+):
+    """Allocate a storage without initializing its values.
+
+    The ``first_touch`` option controls the placement of the memory pages of CPU storages
+    in NUMA systems, where pages are placed on the memory node of the thread writing them
+    first (see :data:`gt4py.storage.utils.FIRST_TOUCH_POLICIES`). By default, storages may
+    reuse pooled memory and are initialized by the calling thread.
+    """
     _error_on_invalid_backend(backend)
+    if first_touch not in storage_utils.FIRST_TOUCH_POLICIES:
+        raise ValueError(f"Invalid first touch policy '{first_touch}'.")
     if gt_backend.from_name(backend).storage_info["device"] == "gpu":
+        if first_touch is not None:
+            raise ValueError("First touch policies are only supported by CPU storages.")
         if managed_memory:
             storage_t = GPUStorage
         else:
@@ -47,11 +62,18 @@ def empty(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fa
         storage_t = CPUStorage
 
     return storage_t(
-        shape=shape, dtype=dtype, backend=backend, default_origin=default_origin, mask=mask
+        shape=shape,
+        dtype=dtype,
+        backend=backend,
+        default_origin=default_origin,
+        mask=mask,
+        first_touch=first_touch,
     )
 
 
-def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def ones(
+    backend, default_origin, shape, dtype, mask=None, *, managed_memory=False, first_touch=None
+):
     storage = empty(
         shape=shape,
         dtype=dtype,
@@ -59,12 +81,18 @@ def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fal
         default_origin=default_origin,
         mask=mask,
         managed_memory=managed_memory,
+        first_touch=first_touch,
     )
-    storage[...] = 1
+    if first_touch is None:
+        storage[...] = 1
+    else:
+        _parallel_fill(storage, 1)
     return storage
 
 
-def zeros(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def zeros(
+    backend, default_origin, shape, dtype, mask=None, *, managed_memory=False, first_touch=None
+):
     storage = empty(
         shape=shape,
         dtype=dtype,
@@ -72,14 +100,50 @@ def zeros(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fa
         default_origin=default_origin,
         mask=mask,
         managed_memory=managed_memory,
+        first_touch=first_touch,
     )
-    storage[...] = 0
+    if first_touch is None:
+        # Otherwise the memory is already zeroed
+        storage[...] = 0
     return storage
 
 
 def from_array(
-    data, backend, default_origin, shape=None, dtype=None, mask=None, *, managed_memory=False
+    data,
+    backend,
+    default_origin,
+    shape=None,
+    dtype=None,
+    mask=None,
+    *,
+    managed_memory=False,
+    first_touch=None,
+    copy=True,
 ):
+    """Create a storage with the values of an array.
+
+    With ``copy=False``, the storage uses the memory of `data` directly, which must be
+    a NumPy array with the dtype, shape, strides order and alignment required by the
+    backend (otherwise a :class:`ValueError` explaining the mismatch is raised). With
+    ``copy=None``, the memory of `data` is used if possible and otherwise the values are
+    copied, warning about the reason with a :class:`RuntimeWarning`. The returned storage
+    thus shares memory with `data` exactly if no warning was emitted.
+    """
+    if copy is not True:
+        incompatibility = _find_zero_copy_incompatibility(
+            data, backend, default_origin, shape, dtype, mask, first_touch
+        )
+        if incompatibility is None:
+            default_origin, shape, dtype, mask = storage_utils.normalize_storage_spec(
+                default_origin, data.shape, data.dtype, mask
+            )
+            return CPUStorage._from_buffer(data, backend, default_origin, mask)
+        if copy is False:
+            raise ValueError(
+                f"Storage can not be created without copying the data: {incompatibility}."
+            )
+        warnings.warn(f"Copying the data to create a storage: {incompatibility}.", RuntimeWarning)
+
     is_cupy_array = cp is not None and isinstance(data, cp.ndarray)
     xp = cp if is_cupy_array else np
     if shape is None:
@@ -93,6 +157,7 @@ def from_array(
         default_origin=default_origin,
         mask=mask,
         managed_memory=managed_memory,
+        first_touch=first_touch,
     )
     if is_cupy_array:
         if isinstance(storage, GPUStorage) or isinstance(storage, ExplicitlySyncedGPUStorage):
@@ -100,12 +165,142 @@ def from_array(
             tmp[...] = data
         else:
             storage[...] = cp.asnumpy(data)
+    elif first_touch is not None:
+        _parallel_fill(storage, data)
     else:
         storage[...] = data
 
     return storage
 
 
+def _parallel_fill(storage, value):
+    storage_utils.parallel_fill(
+        storage.data, value, axis=storage_utils.outer_domain_axis(storage.layout_map)
+    )
+
+
+def _find_zero_copy_incompatibility(data, backend, default_origin, shape, dtype, mask, first_touch):
+    if not isinstance(data, np.ndarray) or isinstance(data, Storage):
+        return f"data of type '{type(data).__name__}' is not a NumPy array"
+    _error_on_invalid_backend(backend)
+    storage_info = gt_backend.from_name(backend).storage_info
+    if storage_info["device"] != "cpu":
+        return f"backend '{backend}' does not use CPU storages"
+    if first_touch is not None:
+        return f"first touch policy '{first_touch}' requires new memory"
+    if dtype is not None and np.dtype(dtype) != data.dtype:
+        return f"data type '{data.dtype}' does not match '{np.dtype(dtype)}'"
+
+    default_origin, shape, dtype, mask = storage_utils.normalize_storage_spec(
+        default_origin, data.shape if shape is None else shape, data.dtype, mask
+    )
+    if shape != data.shape:
+        return f"shape {data.shape} does not match {shape}"
+
+    return storage_utils.find_zero_copy_incompatibility(
+        data,
+        default_origin,
+        storage_info["layout_map"](mask),
+        storage_info["alignment"] * dtype.itemsize,
+    )
+
+
+def _cpu_storage_info(backend, action):
+    _error_on_invalid_backend(backend)
+    storage_info = gt_backend.from_name(backend).storage_info
+    if storage_info["device"] != "cpu":
+        raise ValueError(f"{action} is only supported by CPU storages (backend '{backend}').")
+    return storage_info
+
+
+def memmap(filename, backend, default_origin, shape, dtype, mask=None):
+    """Allocate a storage in a new memory-mapped file, without initializing its values.
+
+    The storage has the same padding and alignment as the storages allocated by
+    :func:`empty` and can be passed to the stencils of `backend`, but its values are
+    paged in and out of the file by the operating system. The file can be reopened
+    later with :func:`load`.
+    """
+    storage_info = _cpu_storage_info(backend, "Memory mapping")
+    default_origin, shape, dtype, mask = storage_utils.normalize_storage_spec(
+        default_origin, shape, dtype, mask
+    )
+    raw_buffer, field = storage_utils.allocate_memmap(
+        filename,
+        default_origin,
+        shape,
+        storage_info["layout_map"](mask),
+        dtype,
+        storage_info["alignment"] * dtype.itemsize,
+        metadata=_storage_file_metadata(backend, default_origin, mask),
+    )
+    return CPUStorage._from_buffer(field, backend, default_origin, mask, raw_buffer=raw_buffer)
+
+
+def save(filename, storage):
+    """Save a CPU storage into a file, which can be memory-mapped with :func:`load`.
+
+    The file contains the metadata of the storage (shape, default origin, mask,
+    dtype and backend) and its raw padded buffer.
+    """
+    if not isinstance(storage, CPUStorage):
+        raise TypeError("Only CPU storages can be saved.")
+    raw_buffer = storage._raw_buffer
+    if not storage.is_stencil_view or raw_buffer.ndim != 1 or not raw_buffer.flags.c_contiguous:
+        # Views and storages wrapping other arrays are saved with a new buffer
+        storage = storage.copy()
+        raw_buffer = storage._raw_buffer
+    storage_utils.save_storage_file(
+        filename,
+        raw_buffer,
+        storage.data,
+        metadata=_storage_file_metadata(storage.backend, storage.default_origin, storage.mask),
+    )
+
+
+def load(filename, *, mode="r+"):
+    """Open a storage file written by :func:`memmap` or :func:`save` without copying it.
+
+    The buffer of the storage is memory-mapped in the given `mode`: ``"r+"`` (changes
+    are written to the file), ``"r"`` (read-only) or ``"c"`` (copy-on-write, changes
+    are kept only in memory).
+    """
+    metadata, raw_buffer, field = storage_utils.open_storage_file(filename, mode)
+    backend = metadata["backend"]
+    _cpu_storage_info(backend, "Memory mapping")
+    return CPUStorage._from_buffer(
+        field,
+        backend,
+        tuple(metadata["default_origin"]),
+        tuple(metadata["mask"]),
+        raw_buffer=raw_buffer,
+    )
+
+
+def _storage_file_metadata(backend, default_origin, mask):
+    return {"backend": backend, "default_origin": default_origin, "mask": mask}
+
+
+def _listify_index(item):
+    # Fast path for the most common indices
+    return item if type(item) is tuple else gt_utils.listify(item)
+
+
+@functools.lru_cache(maxsize=256)
+def _storage_layout(backend, mask):
+    # Layout map and order of the dimensions in the layout map (from the innermost)
+    layout_map = gt_backend.from_name(backend).storage_info["layout_map"](mask)
+    order = tuple(reversed(np.argsort([m for m in layout_map if m is not None]).tolist()))
+    return layout_map, order
+
+
+@functools.lru_cache(maxsize=256)
+def _view_mask(mask, index_is_slice):
+    index_iter = itertools.chain(index_is_slice, [True] * (len(mask) - len(index_is_slice)))
+    interpolated_mask = gt_utils.interpolate_mask(index_iter, mask, False)
+    return tuple(x & y for x, y in zip(mask, interpolated_mask))
+
+
 class Storage(np.ndarray):
     """
     Storage class based on a numpy (CPU) or cupy (GPU) array, taking care of proper memory alignment, with additional
@@ -114,7 +309,7 @@ class Storage(np.ndarray):
 
     __array_subok__ = True
 
-    def __new__(cls, shape, dtype, backend, default_origin, mask=None):
+    def __new__(cls, shape, dtype, backend, default_origin, mask=None, *, first_touch=None):
         """
         Parameters
         ----------
@@ -139,6 +334,9 @@ class Storage(np.ndarray):
             has reduced dimension and reading and writing from offsets along this axis access the same element.
             In a list of spatial axes (IJK), a boolean mask will be generated with ``True`` entries for all
             dimensions except for the missing spatial axes names.
+
+        first_touch: string, optional
+            first touch policy of the memory of CPU storages (see :func:`empty`)
         """
 
         default_origin, shape, dtype, mask = storage_utils.normalize_storage_spec(
@@ -147,11 +345,22 @@ class Storage(np.ndarray):
 
         _error_on_invalid_backend(backend)
 
-        alignment = gt_backend.from_name(backend).storage_info["alignment"]
-        layout_map = gt_backend.from_name(backend).storage_info["layout_map"](mask)
-
-        obj = cls._construct(backend, np.dtype(dtype), default_origin, shape, alignment, layout_map)
+        storage_info = gt_backend.from_name(backend).storage_info
+        alignment = storage_info["alignment"]
+        layout_map = storage_info["layout_map"](mask)
+
+        construct_kwargs = {} if first_touch is None else {"first_touch": first_touch}
+        obj = cls._construct(
+            backend,
+            np.dtype(dtype),
+            default_origin,
+            shape,
+            alignment,
+            layout_map,
+            **construct_kwargs,
+        )
         obj._backend = backend
+        obj._cached_storage_info = storage_info
         obj.is_stencil_view = True
         obj._mask = mask
         obj._check_data()
@@ -174,15 +383,28 @@ class Storage(np.ndarray):
 
     @property
     def layout_map(self):
-        return gt_backend.from_name(self.backend).storage_info["layout_map"](self.mask)
+        return _storage_layout(self._backend, self._mask)[0]
 
-    def transpose(self, *axes):
-        res = super().transpose(*axes)
-        if res._is_consistent(self):
-            res.is_stencil_view = self.is_stencil_view
-        else:
-            res.is_stencil_view = False
-        return res
+    @property
+    def is_stencil_view(self):
+        """Whether the storage can be passed to stencils (i.e. it has the layout of its backend)."""
+        is_stencil_view = self._is_stencil_view
+        if is_stencil_view is None:
+            is_stencil_view = self._is_stencil_view = self._has_stencil_layout()
+        return is_stencil_view
+
+    @is_stencil_view.setter
+    def is_stencil_view(self, value):
+        self._is_stencil_view = value
+
+    @property
+    def _storage_info(self):
+        # Cached in the storage (and inherited by its views)
+        storage_info = self.__dict__.get("_cached_storage_info", None)
+        if storage_info is None:
+            storage_info = gt_backend.from_name(self._backend).storage_info
+            self._cached_storage_info = storage_info
+        return storage_info
 
     def __deepcopy__(self, memo={}):
         return self.copy()
@@ -210,45 +432,42 @@ class Storage(np.ndarray):
                     "Copying storages is only possible through Storage.copy() or deepcopy."
                 )
             else:
-                if not isinstance(obj, Storage) and not isinstance(obj, _ViewableNdarray):
+                if not isinstance(obj, (Storage, _ViewableNdarray)):
                     raise RuntimeError(
                         "Meta information can not be inferred when creating Storage views from other classes than Storage."
                     )
                 self.__dict__ = {**obj.__dict__, **self.__dict__}
-                self.is_stencil_view = False
-                if hasattr(obj, "_new_index"):
-                    index_iter = itertools.chain(
-                        obj._new_index, [slice(None, None)] * (len(obj.mask) - len(obj._new_index))
-                    )
-                    interpolated_mask = gt_utils.interpolate_mask(
-                        (isinstance(x, slice) for x in index_iter), obj.mask, False
+                new_index = self.__dict__.pop("_new_index", None)
+                if new_index is not None:
+                    del obj._new_index
+                    self._mask = _view_mask(
+                        obj.mask, tuple([isinstance(x, slice) for x in new_index])
                     )
-                    self._mask = tuple(x & y for x, y in zip(obj.mask, interpolated_mask))
-                    delattr(obj, "_new_index")
                 if not hasattr(obj, "default_origin"):
                     self.is_stencil_view = True
-                elif self._is_consistent(obj):
-                    self.is_stencil_view = obj.is_stencil_view
+                elif self.shape != obj.shape or not obj.is_stencil_view:
+                    self.is_stencil_view = False
+                else:
+                    # The layout is only checked if `is_stencil_view` is used
+                    self.is_stencil_view = None
                 self._finalize_view(obj)
 
     def _is_consistent(self, obj):
-        if not self.shape == obj.shape:
-            return False
+        return self.shape == obj.shape and self._has_stencil_layout()
+
+    def _has_stencil_layout(self):
         # check strides
         stride = 0
-        layout_map = [m for m in self.layout_map if m is not None]
-        if len(self.strides) < len(layout_map):
+        order = _storage_layout(self._backend, self._mask)[1]
+        if len(self.strides) < len(order):
             return False
-        for dim in reversed(np.argsort(layout_map)):
+        for dim in order:
             if self.strides[dim] < stride:
                 return False
             stride = self.strides[dim]
         # check alignment
-        if (
-            self.ctypes.data + np.sum([o * s for o, s in zip(self.default_origin, self.strides)])
-        ) % gt_backend.from_name(self.backend).storage_info["alignment"]:
-            return False
-        return True
+        origin_offset = sum(o * s for o, s in zip(self.default_origin, self.strides))
+        return (self.ctypes.data + origin_offset) % self._storage_info["alignment"] == 0
 
     def _finalize_view(self, obj):
         pass
@@ -313,7 +532,7 @@ class GPUStorage(Storage):
 
     def __getitem__(self, item):
         self.device_to_host()
-        self._new_index = gt_utils.listify(item)
+        self._new_index = _listify_index(item)
         return super().__getitem__(item)
 
     def __setitem__(self, key, value):
@@ -370,9 +589,16 @@ class CPUStorage(Storage):
         return self._ndarray.ctypes.data
 
     @classmethod
-    def _construct(cls, backend, dtype, default_origin, shape, alignment, layout_map):
+    def _construct(
+        cls, backend, dtype, default_origin, shape, alignment, layout_map, first_touch=None
+    ):
         (raw_buffer, field) = storage_utils.allocate_cpu(
-            default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
+            default_origin,
+            shape,
+            layout_map,
+            dtype,
+            alignment * dtype.itemsize,
+            first_touch=first_touch,
         )
         obj = field.view(_ViewableNdarray)
         obj = obj.view(CPUStorage)
@@ -380,6 +606,17 @@ class CPUStorage(Storage):
         obj.default_origin = default_origin
         return obj
 
+    @classmethod
+    def _from_buffer(cls, buffer, backend, default_origin, mask, raw_buffer=None):
+        obj = buffer.view(_ViewableNdarray)
+        obj = obj.view(cls)
+        obj._raw_buffer = buffer if raw_buffer is None else raw_buffer
+        obj.default_origin = default_origin
+        obj._backend = backend
+        obj.is_stencil_view = True
+        obj._mask = mask
+        return obj
+
     def _check_data(self):
         # check that memory of field is within raw_buffer and that field is a view of raw_buffer
         if (
@@ -400,7 +637,7 @@ class CPUStorage(Storage):
         return res
 
     def __getitem__(self, item):
-        self._new_index = gt_utils.listify(item)
+        self._new_index = _listify_index(item)
         return super().__getitem__(item)
 
 
@@ -468,7 +705,7 @@ class ExplicitlySyncedGPUStorage(Storage):
     def __getitem__(self, item):
         if self._is_device_modified:
             self.device_to_host()
-        self._new_index = gt_utils.listify(item)
+        self._new_index = _listify_index(item)
         return super().__getitem__(item)
 
     @property
@@ -14,14 +14,21 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import collections
 import collections.abc
+import concurrent.futures
+import functools
+import json
 import math
 import numbers
-from typing import Optional, Sequence
+import threading
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 import gt4py.utils as gt_util
+from gt4py import config as gt_config
 from gt4py.definitions import Index, Shape
 
 
@@ -137,12 +144,8 @@ def strides_from_padded_shape(padded_size, order_idx, itemsize):
     return list(strides)
 
 
-def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f):
-    dtype = np.dtype(dtype)
-    assert (
-        alignment_bytes % dtype.itemsize
-    ) == 0, "Alignment must be a multiple of byte-width of dtype."
-    itemsize = dtype.itemsize
+@functools.lru_cache(maxsize=256)
+def _compute_allocation_layout(default_origin, shape, layout_map, itemsize, alignment_bytes):
     items_per_alignment = int(alignment_bytes / itemsize)
 
     order_idx = idx_from_order([i for i in layout_map if i is not None])
@@ -159,6 +162,25 @@ def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate
         halo_offset = 0
 
     padded_size = int(np.prod(padded_shape))
+    return items_per_alignment, tuple(padded_shape), tuple(strides), halo_offset, padded_size
+
+
+def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f):
+    dtype = np.dtype(dtype)
+    assert (
+        alignment_bytes % dtype.itemsize
+    ) == 0, "Alignment must be a multiple of byte-width of dtype."
+    itemsize = dtype.itemsize
+
+    (
+        items_per_alignment,
+        padded_shape,
+        strides,
+        halo_offset,
+        padded_size,
+    ) = _compute_allocation_layout(
+        tuple(default_origin), tuple(shape), tuple(layout_map), itemsize, alignment_bytes
+    )
     buffer_size = padded_size + items_per_alignment - 1
     array, raw_buffer = allocate_f(buffer_size, dtype=dtype)
 
@@ -173,6 +195,41 @@ def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate
     return raw_buffer, field
 
 
+def find_zero_copy_incompatibility(array, default_origin, layout_map, alignment_bytes):
+    """Check if the memory of `array` can be used as is by a storage.
+
+    The strides of `array` have to follow the order of `layout_map`, the
+    strides of all but the innermost dimension have to be multiples of the
+    alignment and the element at `default_origin` has to be aligned, as in
+    the storages allocated by :func:`allocate`.
+
+    Returns
+    -------
+    A description of the first incompatibility found or ``None`` if the memory can be used.
+    """
+    if not array.flags.writeable:
+        return "the array is read-only"
+    if any(stride <= 0 for stride in array.strides):
+        return f"the array strides {array.strides} are not positive"
+
+    order_idx = idx_from_order([i for i in layout_map if i is not None])
+    if len(order_idx) != array.ndim:
+        return f"the array dimensions do not match the layout map {tuple(layout_map)}"
+    strides = [array.strides[idx] for idx in order_idx]
+    if strides != sorted(strides, reverse=True):
+        return f"the array strides {array.strides} do not follow the layout map {tuple(layout_map)}"
+    if any(stride % alignment_bytes for stride in strides[:-1]):
+        return f"the array strides {array.strides} are not aligned to {alignment_bytes} bytes"
+
+    origin_address = array.ctypes.data + sum(
+        origin * stride for origin, stride in zip(default_origin, array.strides)
+    )
+    if origin_address % alignment_bytes:
+        return f"the default origin element is not aligned to {alignment_bytes} bytes"
+
+    return None
+
+
 def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_bytes):
     dtype = np.dtype(dtype)
     assert (
@@ -222,12 +279,321 @@ def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_b
     return raw_buffer, field, device_raw_buffer, device_field
 
 
-def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes):
+class _PooledMemory:
+    """Owner of the memory of a pooled buffer while it is used by storages.
+
+    It is the ``base`` of the arrays returned by :meth:`CPUMemoryPool.allocate`,
+    so it stays alive as long as any array (or view) using the memory does.
+    """
+
+    __slots__ = ("__array_interface__", "__weakref__")
+
+    def __init__(self, buffer: np.ndarray) -> None:
+        self.__array_interface__ = {
+            "data": (buffer.ctypes.data, False),
+            "shape": buffer.shape,
+            "typestr": buffer.dtype.str,
+            "version": 3,
+        }
+
+
+class CPUMemoryPool:
+    """Pool of reusable memory buffers for CPU storages.
+
+    Buffers are grouped in size classes (with a spacing of 1/8 of the
+    enclosing power of two), keyed on (size class, alignment). Storages get
+    their memory through an array owned by a :class:`_PooledMemory` object,
+    which is the ``base`` of all the arrays using that memory, so the buffer is
+    returned to the pool only when the last storage (or view) using it is
+    deleted. Reused buffers are neither cleared nor page-faulted again.
+
+    Only buffers of at least `min_bytes` bytes are pooled (smaller ones are
+    cheap to allocate), and unused buffers are kept as long as their total
+    size does not exceed `max_bytes` (``0`` disables the pool, the default of
+    ``gt4py.config.storage_settings["cpu_pool_max_bytes"]``).
+    """
+
+    def __init__(self, max_bytes: int, min_bytes: int = 128 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self.min_bytes = min_bytes
+        self._free: Dict[Tuple[int, int], List[np.ndarray]] = collections.defaultdict(list)
+        self._free_bytes = 0
+        self._in_use: Dict[int, weakref.finalize] = {}
+        # Buffers may be returned to the pool while allocating (e.g. by the garbage collector)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._trim()
+
+    def accepts(self, nbytes: int) -> bool:
+        return self._max_bytes > 0 and nbytes >= self.min_bytes
+
+    @staticmethod
+    def size_class(nbytes: int) -> int:
+        step = 1 << max(0, (nbytes - 1).bit_length() - 3)
+        return -(-nbytes // step) * step
+
+    def allocate(self, nbytes: int, alignment: int) -> np.ndarray:
+        """Get a writable 1D ``uint8`` array of at least `nbytes` bytes."""
+        key = (self.size_class(nbytes), alignment)
+        with self._lock:
+            buffers = self._free.get(key, None)
+            if buffers:
+                buffer = buffers.pop()
+                self._free_bytes -= key[0]
+                self.hits += 1
+            else:
+                buffer = None
+                self.misses += 1
+
+        if buffer is None:
+            buffer = np.empty(key[0], dtype=np.uint8)
+        owner = _PooledMemory(buffer)
+        with self._lock:
+            self._in_use[id(owner)] = weakref.finalize(owner, self._release, id(owner), key, buffer)
+        return np.asarray(owner)
+
+    def _release(self, owner_id: int, key: Tuple[int, int], buffer: np.ndarray) -> None:
+        with self._lock:
+            del self._in_use[owner_id]
+            if self._free_bytes + key[0] <= self._max_bytes:
+                self._free[key].append(buffer)
+                self._free_bytes += key[0]
+            else:
+                self.discarded += 1
+
+    def _trim(self) -> None:
+        for key, buffers in self._free.items():
+            while buffers and self._free_bytes > self._max_bytes:
+                buffers.pop()
+                self._free_bytes -= key[0]
+                self.discarded += 1
+
+    def clear(self) -> None:
+        """Drop all the unused buffers and reset the statistics."""
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.discarded = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+                "in_use_buffers": len(self._in_use),
+                "free_buffers": sum(len(buffers) for buffers in self._free.values()),
+                "free_bytes": self._free_bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+
+#: Memory pool used by CPU storages
+cpu_memory_pool = CPUMemoryPool(max_bytes=gt_config.storage_settings["cpu_pool_max_bytes"])
+
+
+#: First touch policies of CPU storages:
+#:
+#:  - ``None``: (possibly pooled) memory initialized by the calling thread.
+#:  - ``"lazy"``: fresh zeroed memory (``calloc``) whose pages are placed when they are
+#:    first written, e.g. by the threads of a multithreaded stencil.
+#:  - ``"parallel"``: fresh zeroed memory whose pages are written first by
+#:    :func:`parallel_fill`, with the threads splitting the domain like the
+#:    multithreaded backends.
+FIRST_TOUCH_POLICIES = (None, "lazy", "parallel")
+
+_PAGE_SIZE = 4096
+
+
+def outer_domain_axis(layout_map):
+    """Axis of the storages with `layout_map` split between the threads of the backends.
+
+    The multithreaded backends distribute the iterations of the outer loop over the
+    domain, i.e. the domain axis with the largest stride, between their threads.
+    Returns ``None`` if the storages have no domain axes.
+    """
+    domain_layout = [index for index in layout_map[:3] if index is not None]
+    if not domain_layout:
+        return None
+    return int(np.argmin(domain_layout))
+
+
+def static_blocks(size, num_blocks):
+    """Split ``range(size)`` into the blocks of an OpenMP ``schedule(static)`` loop.
+
+    The first ``size % num_blocks`` blocks contain one more iteration than the others
+    and empty blocks are omitted.
+    """
+    quotient, remainder = divmod(size, num_blocks)
+    blocks = []
+    start = 0
+    for i in range(min(size, num_blocks)):
+        stop = start + quotient + (i < remainder)
+        blocks.append(slice(start, stop))
+        start = stop
+    return blocks
+
+
+def parallel_fill(array, value, num_threads=None, *, axis=0):
+    """Assign `value` (a scalar or an array broadcastable to `array`) from several threads.
+
+    The array is split along `axis` into one block per thread like the outer
+    domain loops of the multithreaded backends (see :func:`outer_domain_axis`
+    and :func:`static_blocks`), so that the memory pages written first by each
+    thread are the ones used by the same thread in the stencils.
+    """
+    if num_threads is None:
+        num_threads = gt_config.storage_settings["num_threads"]
+    if axis is None or array.ndim == 0 or num_threads < 2 or array.shape[axis] < 2:
+        np.copyto(array, value)
+        return
+
+    value = np.broadcast_to(value, array.shape)
+    index = [slice(None)] * array.ndim
+    blocks = []
+    for block in static_blocks(array.shape[axis], num_threads):
+        index[axis] = block
+        blocks.append(tuple(index))
+
+    # numpy releases the GIL while copying arrays
+    with concurrent.futures.ThreadPoolExecutor(len(blocks)) as executor:
+        for _ in executor.map(lambda block: np.copyto(array[block], value[block]), blocks):
+            pass
+
+
+def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes, *, first_touch=None):
     def allocate_f(size, dtype):
-        raw_buffer = np.empty(size, dtype)
+        nbytes = size * dtype.itemsize
+        if first_touch is not None:
+            # Fresh zeroed memory whose pages are placed when they are first written
+            raw_buffer = np.zeros(size, dtype)
+        elif cpu_memory_pool.accepts(nbytes):
+            memory = cpu_memory_pool.allocate(nbytes, alignment_bytes)
+            raw_buffer = memory[:nbytes].view(dtype)
+        else:
+            raw_buffer = np.empty(size, dtype)
         return raw_buffer, raw_buffer
 
-    return allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f)
+    raw_buffer, field = allocate(
+        default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f
+    )
+    if first_touch == "parallel":
+        parallel_fill(field, 0, axis=outer_domain_axis(layout_map))
+    return raw_buffer, field
+
+
+#: Size of the header of storage files. The header contains a magic string and
+#: the storage metadata encoded as JSON, and the raw buffer of the storage is
+#: stored after it (see :func:`save_storage_file`).
+STORAGE_FILE_HEADER_SIZE = _PAGE_SIZE
+
+_STORAGE_FILE_MAGIC = b"\x93GT4PY\x01\n"
+
+
+def _storage_file_layout(raw_buffer, field, data_offset):
+    if raw_buffer.dtype.fields is not None:
+        raise ValueError("Storage files do not support structured data types.")
+    return {
+        "dtype": raw_buffer.dtype.str,
+        "data_offset": data_offset,
+        "size": raw_buffer.size,
+        "field_offset": field.ctypes.data - raw_buffer.ctypes.data,
+        "shape": field.shape,
+        "strides": field.strides,
+    }
+
+
+def _write_storage_file_header(file, metadata):
+    header = _STORAGE_FILE_MAGIC + json.dumps(metadata).encode()
+    if len(header) > STORAGE_FILE_HEADER_SIZE:
+        raise ValueError("The storage metadata does not fit in the storage file header.")
+    file.write(header.ljust(STORAGE_FILE_HEADER_SIZE, b" "))
+
+
+def read_storage_file_header(filename):
+    """Read the metadata stored in the header of a storage file."""
+    with open(filename, "rb") as file:
+        header = file.read(STORAGE_FILE_HEADER_SIZE)
+    if not header.startswith(_STORAGE_FILE_MAGIC):
+        raise ValueError(f"'{filename}' is not a storage file.")
+    return json.loads(header[len(_STORAGE_FILE_MAGIC) :].decode())
+
+
+def allocate_memmap(filename, default_origin, shape, layout_map, dtype, alignment_bytes, metadata):
+    """Allocate the buffer of a storage in a new memory-mapped storage file.
+
+    The file starts with a header containing `metadata` and the layout of the
+    buffer, followed by the (page aligned) buffer itself.
+    """
+
+    def allocate_f(size, dtype):
+        raw_buffer = np.memmap(
+            filename, dtype, mode="w+", offset=STORAGE_FILE_HEADER_SIZE, shape=(size,)
+        )
+        return raw_buffer, raw_buffer
+
+    raw_buffer, field = allocate(
+        default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f
+    )
+    with open(filename, "r+b") as file:
+        _write_storage_file_header(
+            file,
+            {**metadata, **_storage_file_layout(raw_buffer, field, STORAGE_FILE_HEADER_SIZE)},
+        )
+    return raw_buffer, field
+
+
+def save_storage_file(filename, raw_buffer, field, metadata):
+    """Write a contiguous 1D buffer and the layout of the `field` view into a storage file.
+
+    The buffer is stored at an offset with the same remainder modulo the page size
+    as its current address, so the alignment of `field` is kept when the file is
+    memory-mapped by :func:`open_storage_file`.
+    """
+    data_offset = STORAGE_FILE_HEADER_SIZE + raw_buffer.ctypes.data % _PAGE_SIZE
+    with open(filename, "wb") as file:
+        _write_storage_file_header(
+            file, {**metadata, **_storage_file_layout(raw_buffer, field, data_offset)}
+        )
+        file.seek(data_offset)
+        file.write(raw_buffer.data)
+
+
+def open_storage_file(filename, mode="r+"):
+    """Memory-map the buffer of a storage file.
+
+    Returns
+    -------
+    A tuple with the metadata of the file, the memory-mapped buffer and the field view.
+    """
+    if mode not in ("r", "r+", "c"):
+        raise ValueError(f"Invalid storage file mode '{mode}' (expected 'r', 'r+' or 'c').")
+    metadata = read_storage_file_header(filename)
+    dtype = np.dtype(metadata["dtype"])
+    raw_buffer = np.memmap(
+        filename, dtype, mode=mode, offset=metadata["data_offset"], shape=(metadata["size"],)
+    )
+    field = np.ndarray(
+        tuple(metadata["shape"]),
+        dtype,
+        buffer=raw_buffer,
+        offset=metadata["field_offset"],
+        strides=tuple(metadata["strides"]),
+    )
+    return metadata, raw_buffer, field
 
 
 def allocate_gpu(default_origin, shape, layout_map, dtype, alignment_bytes):
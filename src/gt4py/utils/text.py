@@ -21,17 +21,17 @@ import contextlib
 import re
 import textwrap
 
-import black
-
-
-black_mode = black.FileMode(
-    target_versions={black.TargetVersion.PY36, black.TargetVersion.PY37}, line_length=120
-)
+from eve import codegen
 
 
 def format_source(source: str, line_length: int) -> str:
-    black_mode.line_length = line_length
-    return black.format_str(source, mode=black_mode)
+    return codegen.format_source(
+        "python",
+        source,
+        skip_errors=False,
+        line_length=line_length,
+        target_versions={"3.6", "3.7"},
+    )
 
 
 def get_line_number(text, re_query, re_flags=0):
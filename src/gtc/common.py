@@ -653,7 +653,12 @@ def validate_symbol_refs() -> RootValidatorType:
 
 
 class _LvalueDimsValidator(NodeVisitor):
-    def __init__(self, vertical_loop_type: Type[Node], decl_type: Type[Node]) -> None:
+    def __init__(
+        self,
+        vertical_loop_type: Type[Node],
+        decl_type: Type[Node],
+        column_decl_type: Optional[Type[Node]] = None,
+    ) -> None:
         if not vertical_loop_type.__annotations__.get("loop_order") is LoopOrder:
             raise ValueError(
                 f"Vertical loop type {vertical_loop_type} has no `loop_order` attribute"
@@ -662,6 +667,7 @@ class _LvalueDimsValidator(NodeVisitor):
             raise ValueError(f"Field decl type {decl_type} has no `dimensions` attribute")
         self.vertical_loop_type = vertical_loop_type
         self.decl_type = decl_type
+        self.column_decl_type = column_decl_type
 
     def visit_Node(
         self,
@@ -692,6 +698,8 @@ class _LvalueDimsValidator(NodeVisitor):
             return None
 
         allowed_flags = self._allowed_flags(loop_order)
+        if self.column_decl_type is not None and isinstance(decl, self.column_decl_type):
+            allowed_flags.append((False, False, True))
         flags = decl.dimensions
         if flags not in allowed_flags:
             dims = dimension_flags_to_names(flags)
@@ -710,7 +718,9 @@ class _LvalueDimsValidator(NodeVisitor):
 # TODO(ricoh) consider making gtir.Decl & oir.Decl common and / or adding a VerticalLoop baseclass
 # TODO(ricoh) in common instead of passing type arguments
 def validate_lvalue_dims(
-    vertical_loop_type: Type[Node], decl_type: Type[Node]
+    vertical_loop_type: Type[Node],
+    decl_type: Type[Node],
+    column_decl_type: Optional[Type[Node]] = None,
 ) -> RootValidatorType:
     """
     Validate lvalue dimensions using the root node symbol table.
@@ -736,13 +746,16 @@ def validate_lvalue_dims(
     decl_type:
         A declaration type with field dimension information in the format
         `Tuple[bool, bool, bool]` in an attribute named `dimensions`.
+    column_decl_type:
+        A subtype of `decl_type` whose K-fields may be assigned in any loop order
+        (e.g. temporaries which are only assigned horizontally invariant values).
     """
 
     def _impl(
         cls: Type[pydantic.BaseModel], values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
         for _, children in values.items():
-            _LvalueDimsValidator(vertical_loop_type, decl_type).visit(
+            _LvalueDimsValidator(vertical_loop_type, decl_type, column_decl_type).visit(
                 children, symtable=values["symtable_"]
             )
         return values
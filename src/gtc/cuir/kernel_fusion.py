@@ -14,6 +14,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Set, Tuple
+
 from eve import NodeTranslator
 
 from . import cuir
@@ -33,17 +35,43 @@ class FuseKernels(NodeTranslator):
             assert all(parallel) or not any(parallel), "Mixed k-parallelism in kernel"
             return any(parallel)
 
+        def writes(kernel: cuir.Kernel) -> Set[str]:
+            return (
+                kernel.iter_tree()
+                .if_isinstance(cuir.AssignStmt)
+                .getattr("left")
+                .if_isinstance(cuir.FieldAccess)
+                .getattr("name")
+                .to_set()
+            )
+
+        def accesses(kernel: cuir.Kernel, parallel: bool) -> Tuple[Set[str], Set[str]]:
+            """Names of all accessed fields and of fields accessed by other thread blocks.
+
+            Points of a field can be accessed by other blocks through offsets (also in k if the
+            kernel is k-parallel) and in horizontal executions with extended compute domains.
+            """
+            all_accesses: Set[str] = set()
+            shared_accesses: Set[str] = set()
+            for horizontal_execution in kernel.iter_tree().if_isinstance(cuir.HorizontalExecution):
+                extent = horizontal_execution.extent
+                extended = extent is not None and (extent.i != (0, 0) or extent.j != (0, 0))
+                for access in horizontal_execution.iter_tree().if_isinstance(cuir.FieldAccess):
+                    offset = access.offset.to_dict()
+                    all_accesses.add(access.name)
+                    if (
+                        extended
+                        or offset["i"] != 0
+                        or offset["j"] != 0
+                        or (offset["k"] != 0 and parallel)
+                    ):
+                        shared_accesses.add(access.name)
+            return all_accesses, shared_accesses
+
         kernels = [self.visit(node.kernels[0])]
         previous_parallel = is_parallel(kernels[-1])
-        previous_writes = (
-            kernels[-1]
-            .iter_tree()
-            .if_isinstance(cuir.AssignStmt)
-            .getattr("left")
-            .if_isinstance(cuir.FieldAccess)
-            .getattr("name")
-            .to_set()
-        )
+        previous_writes = writes(kernels[-1])
+        previous_accesses, previous_shared = accesses(kernels[-1], previous_parallel)
         for kernel in node.kernels[1:]:
             parallel = is_parallel(kernel)
             reads_with_offsets = (
@@ -56,21 +84,26 @@ class FuseKernels(NodeTranslator):
                 .getattr("name")
                 .to_set()
             )
-            new_writes = (
-                kernel.iter_tree()
-                .if_isinstance(cuir.AssignStmt)
-                .getattr("left")
-                .if_isinstance(cuir.FieldAccess)
-                .getattr("name")
-                .to_set()
+            new_writes = writes(kernel)
+            new_accesses, new_shared = accesses(kernel, parallel)
+            # overwriting points which other blocks may still access in the previous loops
+            write_after_access = (new_writes & previous_shared) or (
+                new_writes & new_shared & previous_accesses
             )
 
-            if previous_parallel != parallel or reads_with_offsets & previous_writes:
+            if (
+                previous_parallel != parallel
+                or reads_with_offsets & previous_writes
+                or write_after_access
+            ):
                 kernels.append(self.visit(kernel))
                 previous_writes = new_writes
+                previous_accesses, previous_shared = new_accesses, new_shared
             else:
                 kernels[-1].vertical_loops += self.visit(kernel.vertical_loops)
                 previous_writes |= new_writes
+                previous_accesses |= new_accesses
+                previous_shared |= new_shared
             previous_parallel = parallel
 
         return cuir.Program(
@@ -65,10 +65,12 @@ class TemporaryDecl(Decl):
     ----------
     offset: Origin of the temporary field.
     padding: Buffer added to compute domain as field size.
+    dimensions: Axes of the temporary field (the others are broadcast).
 
     """
 
     data_dims: Tuple[int, ...] = eve.field(default_factory=tuple)
+    dimensions: Tuple[bool, bool, bool] = (True, True, True)
     offset: Tuple[int, int]
     padding: Tuple[int, int]
 
@@ -51,8 +51,10 @@ ORIGIN_CORRECTED_VIEW_CLASS = textwrap.dedent(
             self.offsets = offsets
 
         @classmethod
-        def empty(cls, shape, offset):
-            return cls(np.empty(shape), offset, (True, True, True))
+        def empty(cls, shape, offset, dimensions=(True, True, True)):
+            shape = [size for size, has_dim in zip(shape, dimensions) if has_dim]
+            offset = [off for off, has_dim in zip(offset, dimensions) if has_dim]
+            return cls(np.empty(shape), offset, dimensions)
 
         def shim_key(self, key):
             new_args = []
@@ -113,8 +115,14 @@ class NpirCodegen(TemplatedGenerator):
         "{name} = Field({name}, _origin_['{name}'], ({', '.join(dimensions)}))"
     )
 
+    def visit_TemporaryDecl(
+        self, node: npir.TemporaryDecl, **kwargs: Any
+    ) -> Union[str, Collection[str]]:
+        dimensions = f", {tuple(node.dimensions)}" if not all(node.dimensions) else ""
+        return self.generic_visit(node, dimensions_arg=dimensions, **kwargs)
+
     TemporaryDecl = FormatTemplate(
-        "{name} = Field.empty((_dI_ + {padding[0]}, _dJ_ + {padding[1]}, _dK_), ({', '.join(offset)}, 0))"
+        "{name} = Field.empty((_dI_ + {padding[0]}, _dJ_ + {padding[1]}, _dK_), ({', '.join(offset)}, 0){dimensions_arg})"
     )
 
     # LocalDecl is purposefully omitted.
@@ -148,7 +156,11 @@ class NpirCodegen(TemplatedGenerator):
         all_args = [_slice_string(ch, offset) for ch, offset in zip(("i", "j"), offsets)] + [k]
         if node.name in kwargs.get("symtable", {}):
             decl = kwargs["symtable"][node.name]
-            dimensions = decl.dimensions if isinstance(decl, npir.FieldDecl) else [True] * 3
+            dimensions = (
+                decl.dimensions
+                if isinstance(decl, (npir.FieldDecl, npir.TemporaryDecl))
+                else [True] * 3
+            )
             args = [axis for i, axis in enumerate(all_args) if dimensions[i]]
         else:
             args = all_args
@@ -214,6 +226,14 @@ class NpirCodegen(TemplatedGenerator):
         left = self.visit(node.left, **kwargs)
         right = self.visit(node.right, **kwargs)
         if not node.mask:
+            decl = kwargs.get("symtable", {}).get(node.left.name)
+            if (
+                isinstance(node.right, npir.Broadcast)
+                and isinstance(decl, (npir.FieldDecl, npir.TemporaryDecl))
+                and not all(decl.dimensions[:2])
+            ):
+                # the target is broadcast horizontally, assign the scalar directly
+                right = self.visit(node.right.expr, **kwargs)
             return f"{left} = {right}"
 
         mask = self.visit(node.mask, **kwargs)
@@ -64,6 +64,7 @@ class OirToNpir(NodeTranslator):
             data_dims=node.data_dims,
             offset=offset,
             padding=padding,
+            dimensions=node.dimensions,
         )
 
     # --- Expressions ---
@@ -3,6 +3,7 @@ import typing
 from typing import Any, Dict, Tuple, Union
 
 from eve import NodeVisitor
+from eve.memoization import memoized_analysis
 from eve.utils import XIterable
 from gtc import gtir
 from gtc.common import LevelMarker
@@ -54,6 +55,7 @@ class KBoundaryVisitor(NodeVisitor):
         field_boundaries[node.name] = boundary
 
 
+@memoized_analysis
 def compute_k_boundary(
     node: gtir.Stencil, include_center_interval=True
 ) -> Dict[str, Tuple[int, int]]:
@@ -56,3 +56,8 @@ class GtirPipeline:
         skip = skip or []
         pipeline = [step for step in self.steps() if step not in skip]
         return self._get_cached(pipeline) or self._set_cached(pipeline, self.apply(pipeline))
+
+    def seed(self, node: gtir.Stencil, skip: Sequence[PASS_T] = None) -> None:
+        """Store a known result of :meth:`full` (e.g. loaded from a cache)."""
+        skip = skip or []
+        self._set_cached([step for step in self.steps() if step not in skip], node)
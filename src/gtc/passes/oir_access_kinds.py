@@ -18,6 +18,7 @@
 import collections
 from typing import Any, Dict
 
+from eve.memoization import memoized_analysis
 from eve.visitors import NodeVisitor
 from gt4py.definitions import AccessKind, Extent
 from gtc import oir
@@ -70,5 +71,6 @@ class AccessKindComputer(NodeVisitor):
         return access
 
 
+@memoized_analysis
 def compute_access_kinds(stencil: oir.Stencil) -> Dict[str, AccessKind]:
     return AccessKindComputer().visit(stencil)
@@ -20,6 +20,7 @@ from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
 
 from eve import NodeTranslator, SymbolTableTrait
 from gtc import common, oir
+from gtc.passes.pass_manager import ALL_ANALYSES
 
 from .utils import AccessCollector, symbol_name_creator
 
@@ -51,7 +52,12 @@ statements.
 """
 
 
+_CacheKey = Tuple[str, int, int]
+
+
 class IJCacheDetection(NodeTranslator):
+    preserved_analyses = ALL_ANALYSES
+
     def visit_VerticalLoop(
         self, node: oir.VerticalLoop, *, local_tmps: Set[str], **kwargs: Any
     ) -> oir.VerticalLoop:
@@ -101,17 +107,33 @@ class IJCacheDetection(NodeTranslator):
         return self.generic_visit(node, local_tmps=local_tmps, **kwargs)
 
 
+def _k_offsets_by_ij(offsets: Iterable[Tuple[int, int, int]]) -> Dict[Tuple[int, int], Set[int]]:
+    """Group the vertical offsets of accesses by their horizontal offsets."""
+    result: Dict[Tuple[int, int], Set[int]] = collections.defaultdict(set)
+    for offset in offsets:
+        result[offset[:2]].add(offset[2])
+    return result
+
+
 @dataclass
 class KCacheDetection(NodeTranslator):
+    """Adds fill and flush k-caches to vertical sweeps.
+
+    Fields accessed at more than one vertical offset (of at most `max_cacheable_offset`) in a
+    loop are cached. By default, fields with horizontal offsets are not cached. If
+    `allow_ij_offsets` is set, read-only fields with horizontal offsets of at most
+    `max_cacheable_ij_offset` are cached as well, which is only supported by converting the caches
+    to local k-caches with :class:`FillFlushToLocalKCaches` (one cached column per horizontal
+    offset) and not by GridTools C++ k-caches.
+    """
+
     max_cacheable_offset: int = 5
+    allow_ij_offsets: bool = False
+    max_cacheable_ij_offset: int = 1
+    preserved_analyses = ALL_ANALYSES
 
     def visit_VerticalLoop(self, node: oir.VerticalLoop, **kwargs: Any) -> oir.VerticalLoop:
-        # k-caches are restricted to loops with a single horizontal region as all regions without
-        # horizontal offsets should be merged before anyway and this restriction allows for easier
-        # conversion of fill and flush caches to local caches later
-        if node.loop_order == common.LoopOrder.PARALLEL or any(
-            len(section.horizontal_executions) != 1 for section in node.sections
-        ):
+        if node.loop_order == common.LoopOrder.PARALLEL:
             return self.generic_visit(node, **kwargs)
 
         all_accesses = AccessCollector.apply(node)
@@ -120,16 +142,26 @@ class KCacheDetection(NodeTranslator):
             for field, offsets in all_accesses.offsets().items()
             if any(off[2] is None for off in offsets)
         }
+        written_fields = all_accesses.write_fields()
 
-        def accessed_more_than_once(offsets: Set[Any]) -> bool:
-            return len(offsets) > 1
+        def accessed_more_than_once(offsets: Set[Tuple[int, int, int]]) -> bool:
+            return any(len(k_offsets) > 1 for k_offsets in _k_offsets_by_ij(offsets).values())
 
         def already_cached(field: str) -> bool:
             return field in {c.name for c in node.caches}
 
-        # TODO(fthaler): k-caches with non-zero ij offsets?
-        def has_horizontal_offset(offsets: Set[Tuple[int, int, int]]) -> bool:
-            return any(offset[:2] != (0, 0) for offset in offsets)
+        def horizontal_offsets_allowed(field: str, offsets: Set[Tuple[int, int, int]]) -> bool:
+            if all(offset[:2] == (0, 0) for offset in offsets):
+                return True
+            # a written field would have to be cached consistently in all columns
+            return (
+                self.allow_ij_offsets
+                and field not in written_fields
+                and all(
+                    max(abs(offset[0]), abs(offset[1])) <= self.max_cacheable_ij_offset
+                    for offset in offsets
+                )
+            )
 
         def offsets_within_limits(offsets: Set[Tuple[int, int, int]]) -> bool:
             return all(abs(offset[2]) <= self.max_cacheable_offset for offset in offsets)
@@ -144,11 +176,17 @@ class KCacheDetection(NodeTranslator):
             if not already_cached(field)
             and not has_variable_offset_reads(field)
             and accessed_more_than_once(offsets)
-            and not has_horizontal_offset(offsets)
+            and horizontal_offsets_allowed(field, offsets)
             and offsets_within_limits(offsets)
         }
+        # read-only fields with horizontal offsets never need flushes
         caches = self.visit(node.caches, **kwargs) + [
-            oir.KCache(name=field, fill=True, flush=True) for field in cacheable
+            oir.KCache(
+                name=field,
+                fill=True,
+                flush=all(offset[:2] == (0, 0) for offset in accesses[field]),
+            )
+            for field in cacheable
         ]
         return oir.VerticalLoop(
             loop_order=node.loop_order,
@@ -161,12 +199,15 @@ class KCacheDetection(NodeTranslator):
 class PruneKCacheFills(NodeTranslator):
     """Prunes unneeded k-cache fills.
 
-    A fill is classified as required if at least one of the two following conditions holds in any of the loop sections:
+    A fill is classified as required if at least one of the following conditions holds in any of the loop sections:
     * There is a read with offset in the direction of looping.
+    * There is a read with horizontal offset.
     * The first centered access is a read access.
     If none of the conditions holds for any loop section, the fill is considered as unneeded.
     """
 
+    preserved_analyses = ALL_ANALYSES
+
     def visit_KCache(self, node: oir.KCache, *, pruneable: Set[str], **kwargs: Any) -> oir.KCache:
         if node.name in pruneable:
             return oir.KCache(name=node.name, fill=False, flush=node.flush)
@@ -186,6 +227,9 @@ class PruneKCacheFills(NodeTranslator):
             def requires_fill(field: str) -> bool:
                 if field not in offsets:
                     return False
+                if any(o[:2] != (0, 0) for o in offsets[field]):
+                    # columns at horizontal offsets are never written by the loop
+                    return True
                 k_offsets = (o[2] for o in offsets[field])
                 if node.loop_order == common.LoopOrder.FORWARD and max(k_offsets) > 0:
                     return True
@@ -238,6 +282,8 @@ class PruneKCacheFlushes(NodeTranslator):
     * There are no read accesses to the field in a following loop.
     """
 
+    preserved_analyses = ALL_ANALYSES
+
     def visit_KCache(self, node: oir.KCache, *, pruneable: Set[str], **kwargs: Any) -> oir.KCache:
         if node.name in pruneable:
             return oir.KCache(name=node.name, fill=node.fill, flush=False, loc=node.loc)
@@ -278,35 +324,68 @@ class FillFlushToLocalKCaches(NodeTranslator):
     3. Loop sections are split where necessary to allow single-level loads whereever possible.
     3. Fill statements from the original field to the temporary are introduced.
     4. Flush statements from the temporary to the original field are introduced.
+
+    Read-only fields with horizontal offsets get one temporary per horizontal offset at which
+    they are read with more than one vertical offset (i.e. a cached column per horizontal
+    offset), their other accesses are kept.
+
+    Fill and flush statements are added to the horizontal execution of sections with a single
+    one and as additional horizontal executions before and after the others otherwise.
     """
 
     contexts = (SymbolTableTrait.symtable_merger,)
 
     def visit_FieldAccess(
-        self, node: oir.FieldAccess, *, name_map: Dict[str, str], **kwargs: Any
+        self, node: oir.FieldAccess, *, name_map: Dict[_CacheKey, str], **kwargs: Any
     ) -> oir.FieldAccess:
-        if node.name in name_map:
+        offset = node.offset
+        if isinstance(offset, common.CartesianOffset):
+            key = (node.name, offset.i, offset.j)
+            offset = common.CartesianOffset(i=0, j=0, k=offset.k)
+        else:
+            key = (node.name, 0, 0)
+        if key in name_map:
             return oir.FieldAccess(
-                name=name_map[node.name],
+                name=name_map[key],
                 data_index=node.data_index,
                 dtype=node.dtype,
-                offset=node.offset,
+                offset=offset,
                 loc=node.loc,
             )
         return node
 
     def visit_VerticalLoopSection(
-        self, node: oir.VerticalLoopSection, **kwargs: Any
+        self,
+        node: oir.VerticalLoopSection,
+        *,
+        fills: List[oir.Stmt],
+        flushes: List[oir.Stmt],
+        **kwargs: Any,
     ) -> oir.VerticalLoopSection:
-        if len(node.horizontal_executions) > 1:
-            raise NotImplementedError("Multiple horizontal_executions are not supported")
-        return self.generic_visit(node, **kwargs)
+        if len(node.horizontal_executions) == 1:
+            return self.generic_visit(node, fills=fills, flushes=flushes, **kwargs)
+
+        # fills are in a separate horizontal execution with an extent covering all reads, each
+        # flush is in its own horizontal execution to not write fields outside of their extents
+        horizontal_executions = self.visit(
+            node.horizontal_executions, fills=[], flushes=[], **kwargs
+        )
+        if fills:
+            horizontal_executions.insert(0, oir.HorizontalExecution(body=fills, declarations=[]))
+        horizontal_executions += [
+            oir.HorizontalExecution(body=[flush], declarations=[]) for flush in flushes
+        ]
+        return oir.VerticalLoopSection(
+            interval=node.interval,
+            horizontal_executions=horizontal_executions,
+            loc=node.loc,
+        )
 
     def visit_HorizontalExecution(
         self,
         node: oir.HorizontalExecution,
         *,
-        name_map: Dict[str, str],
+        name_map: Dict[_CacheKey, str],
         fills: List[oir.Stmt],
         flushes: List[oir.Stmt],
         **kwargs: Any,
@@ -320,29 +399,30 @@ class FillFlushToLocalKCaches(NodeTranslator):
     @staticmethod
     def _fill_limits(
         loop_order: common.LoopOrder, section: oir.VerticalLoopSection
-    ) -> Dict[str, Tuple[int, int]]:
-        """Direction-normalized min and max read accesses for each accessed field.
+    ) -> Dict[_CacheKey, Tuple[int, int]]:
+        """Direction-normalized min and max read accesses for each accessed field column.
 
         Args:
             loop_order: forward or backward order.
             section: loop section to split.
 
         Returns:
-            A dict, mapping field names to min and max read offsets relative to loop order (i.e., positive means in the direction of the loop order).
+            A dict, mapping field names and horizontal offsets to min and max read offsets relative to loop order (i.e., positive means in the direction of the loop order).
 
         """
 
-        def directional_k_offset(offset: Tuple[int, int, int]) -> int:
+        def directional_k_offset(k_offset: int) -> int:
             """Positive k-offset for forward loops, negative for backward."""
-            return offset[2] if loop_order == common.LoopOrder.FORWARD else -offset[2]
+            return k_offset if loop_order == common.LoopOrder.FORWARD else -k_offset
 
         read_offsets = AccessCollector.apply(section).cartesian_accesses().read_offsets()
         return {
-            field: (
-                min(directional_k_offset(o) for o in offsets),
-                max(directional_k_offset(o) for o in offsets),
+            (field, i, j): (
+                min(directional_k_offset(k) for k in k_offsets),
+                max(directional_k_offset(k) for k in k_offsets),
             )
             for field, offsets in read_offsets.items()
+            for (i, j), k_offsets in _k_offsets_by_ij(offsets).items()
         }
 
     @staticmethod
@@ -410,28 +490,28 @@ class FillFlushToLocalKCaches(NodeTranslator):
         cls,
         loop_order: common.LoopOrder,
         section: oir.VerticalLoopSection,
-        filling_fields: Iterable[str],
-        first_unfilled: Dict[str, int],
+        filling_fields: Iterable[_CacheKey],
+        first_unfilled: Dict[_CacheKey, int],
         new_symbol_name: Callable[[str], str],
-    ) -> Tuple[Tuple[oir.VerticalLoopSection, ...], Dict[str, int]]:
+    ) -> Tuple[Tuple[oir.VerticalLoopSection, ...], Dict[_CacheKey, int]]:
         """Split loop sections that require multiple fills.
 
         Args:
             loop_order: forward or backward order.
             section: loop section to split.
-            filling_fields: fields that are using fill caches.
-            first_unfilled: direction-normalized offset of the first unfilled cache entry for each field.
+            filling_fields: fields and horizontal offsets that are using fill caches.
+            first_unfilled: direction-normalized offset of the first unfilled cache entry for each field column.
 
         Returns:
             A list of sections and an updated `first_unfilled` map.
         """
         fill_limits = cls._fill_limits(loop_order, section)
         max_required_fills = 0
-        for field in filling_fields:
-            lmin, lmax = fill_limits.get(field, (0, 0))
-            required_fills = lmax + 1 - max(lmin, first_unfilled.get(field, lmin))
+        for key in filling_fields:
+            lmin, lmax = fill_limits.get(key, (0, 0))
+            required_fills = lmax + 1 - max(lmin, first_unfilled.get(key, lmin))
             max_required_fills = max(required_fills, max_required_fills)
-            first_unfilled[field] = lmax
+            first_unfilled[key] = lmax
         if max_required_fills > 1 and cls._requires_splitting(section.interval):
             return cls._split_entry_level(loop_order, section, new_symbol_name), first_unfilled
         return (section,), first_unfilled
@@ -441,43 +521,44 @@ class FillFlushToLocalKCaches(NodeTranslator):
         cls,
         loop_order: common.LoopOrder,
         section: oir.VerticalLoopSection,
-        filling_fields: Dict[str, str],
-        first_unfilled: Dict[str, int],
+        filling_fields: Dict[_CacheKey, str],
+        first_unfilled: Dict[_CacheKey, int],
         symtable: Dict[str, Any],
-    ) -> Tuple[List[oir.AssignStmt], Dict[str, int]]:
+    ) -> Tuple[List[oir.AssignStmt], Dict[_CacheKey, int]]:
         """Generate fill statements for the given loop section.
 
         Args:
             loop_order: forward or backward order.
             section: loop section to split.
-            filling_fields: mapping from field names to cache names.
-            first_unfilled: direction-normalized offset of the first unfilled cache entry for each field.
+            filling_fields: mapping from field names and horizontal offsets to cache names.
+            first_unfilled: direction-normalized offset of the first unfilled cache entry for each field column.
 
         Returns:
             A list of fill statements and an updated `first_unfilled` map.
         """
         fill_limits = cls._fill_limits(loop_order, section)
         fill_stmts = []
-        for field, cache in filling_fields.items():
-            lmin, lmax = fill_limits.get(field, (0, 0))
-            lmin = max(lmin, first_unfilled.get(field, lmin))
+        for key, cache in filling_fields.items():
+            field, i, j = key
+            lmin, lmax = fill_limits.get(key, (0, 0))
+            lmin = max(lmin, first_unfilled.get(key, lmin))
             for offset in range(lmin, lmax + 1):
-                k_offset = common.CartesianOffset(
-                    i=0,
-                    j=0,
-                    k=offset if loop_order == common.LoopOrder.FORWARD else -offset,
-                )
+                k = offset if loop_order == common.LoopOrder.FORWARD else -offset
                 fill_stmts.append(
                     oir.AssignStmt(
                         left=oir.FieldAccess(
-                            name=cache, dtype=symtable[field].dtype, offset=k_offset
+                            name=cache,
+                            dtype=symtable[field].dtype,
+                            offset=common.CartesianOffset(i=0, j=0, k=k),
                         ),
                         right=oir.FieldAccess(
-                            name=field, dtype=symtable[field].dtype, offset=k_offset
+                            name=field,
+                            dtype=symtable[field].dtype,
+                            offset=common.CartesianOffset(i=i, j=j, k=k),
                         ),
                     )
                 )
-            first_unfilled[field] = lmax
+            first_unfilled[key] = lmax
         return fill_stmts, first_unfilled
 
     @classmethod
@@ -485,7 +566,7 @@ class FillFlushToLocalKCaches(NodeTranslator):
         cls,
         loop_order: common.LoopOrder,
         section: oir.VerticalLoopSection,
-        flushing_fields: Dict[str, str],
+        flushing_fields: Dict[_CacheKey, str],
         symtable: Dict[str, Any],
     ) -> List[oir.AssignStmt]:
         """Generate flush statements for the given loop section.
@@ -493,14 +574,14 @@ class FillFlushToLocalKCaches(NodeTranslator):
         Args:
             loop_order: forward or backward order.
             section: loop section to split.
-            flushing_fields: mapping from field names to cache names.
+            flushing_fields: mapping from field names and horizontal offsets to cache names.
 
         Returns:
             A list of flush statements.
         """
         write_fields = AccessCollector.apply(section).write_fields()
         flush_stmts = []
-        for field, cache in flushing_fields.items():
+        for (field, _, _), cache in flushing_fields.items():
             if field in write_fields:
                 flush_stmts.append(
                     oir.AssignStmt(
@@ -527,26 +608,44 @@ class FillFlushToLocalKCaches(NodeTranslator):
         new_symbol_name: Callable[[str], str],
         **kwargs: Any,
     ) -> oir.VerticalLoop:
-        filling_fields: Dict[str, str] = {
-            c.name: new_symbol_name(c.name)
-            for c in node.caches
-            if isinstance(c, oir.KCache) and c.fill
+        k_caches = [c for c in node.caches if isinstance(c, oir.KCache) and (c.fill or c.flush)]
+        if not k_caches:
+            return node
+
+        accesses = AccessCollector.apply(node).cartesian_accesses()
+        offsets = accesses.offsets()
+        write_fields = accesses.write_fields()
+
+        def cache_keys(field: str) -> List[_CacheKey]:
+            k_offsets_by_ij = _k_offsets_by_ij(offsets.get(field, set()))
+            if set(k_offsets_by_ij) <= {(0, 0)}:
+                return [(field, 0, 0)]
+            if field in write_fields:
+                raise NotImplementedError(
+                    "K-caches of written fields with horizontal offsets are not supported"
+                )
+            return [
+                (field, i, j)
+                for (i, j), k_offsets in sorted(k_offsets_by_ij.items())
+                if len(k_offsets) > 1
+            ]
+
+        filling_fields: Dict[_CacheKey, str] = {
+            key: new_symbol_name(c.name) for c in k_caches if c.fill for key in cache_keys(c.name)
         }
-        flushing_fields: Dict[str, str] = {
-            c.name: filling_fields[c.name] if c.name in filling_fields else new_symbol_name(c.name)
-            for c in node.caches
-            if isinstance(c, oir.KCache) and c.flush
+        flushing_fields: Dict[_CacheKey, str] = {
+            key: filling_fields[key] if key in filling_fields else new_symbol_name(c.name)
+            for c in k_caches
+            if c.flush
+            for key in cache_keys(c.name)
         }
 
         filling_or_flushing_fields = dict(
             set(filling_fields.items()) | set(flushing_fields.items())
         )
 
-        if not filling_or_flushing_fields:
-            return node
-
         # new temporaries used for caches, declarations are later added to stencil
-        for field_name, tmp_name in filling_or_flushing_fields.items():
+        for (field_name, _, _), tmp_name in filling_or_flushing_fields.items():
             new_tmps.append(
                 oir.Temporary(
                     name=tmp_name, dtype=symtable[field_name].dtype, dimensions=(True, True, True)
@@ -555,10 +654,10 @@ class FillFlushToLocalKCaches(NodeTranslator):
 
         if filling_fields:
             # split sections where more than one fill operations are required at the entry level
-            first_unfilled: Dict[str, int] = dict()
+            first_unfilled: Dict[_CacheKey, int] = dict()
             split_sections: List[oir.VerticalLoopSection] = []
             for section in node.sections:
-                split_section, previous_fills = self._split_section_with_multiple_fills(
+                split_section, first_unfilled = self._split_section_with_multiple_fills(
                     node.loop_order, section, filling_fields, first_unfilled, new_symbol_name
                 )
                 split_sections += split_section
@@ -585,7 +684,8 @@ class FillFlushToLocalKCaches(NodeTranslator):
             )
 
         # replace cache declarations
-        caches = [c for c in node.caches if c.name not in filling_or_flushing_fields] + [
+        cached_fields = {c.name for c in k_caches}
+        caches = [c for c in node.caches if c.name not in cached_fields] + [
             oir.KCache(name=f, fill=False, flush=False) for f in filling_or_flushing_fields.values()
         ]
 
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import collections
+import operator
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from eve import NOTHING, NodeTranslator
+from gtc import common, oir
+
+
+_UNARY_OPERATORS: Dict[common.UnaryOperator, Callable[[Any], Any]] = {
+    common.UnaryOperator.POS: operator.pos,
+    common.UnaryOperator.NEG: operator.neg,
+    common.UnaryOperator.NOT: operator.not_,
+}
+
+_BINARY_OPERATORS: Dict[
+    Union[common.ArithmeticOperator, common.ComparisonOperator, common.LogicalOperator],
+    Callable[[Any, Any], Any],
+] = {
+    common.ArithmeticOperator.ADD: operator.add,
+    common.ArithmeticOperator.SUB: operator.sub,
+    common.ArithmeticOperator.MUL: operator.mul,
+    common.ArithmeticOperator.DIV: operator.truediv,
+    common.ComparisonOperator.GT: operator.gt,
+    common.ComparisonOperator.LT: operator.lt,
+    common.ComparisonOperator.GE: operator.ge,
+    common.ComparisonOperator.LE: operator.le,
+    common.ComparisonOperator.EQ: operator.eq,
+    common.ComparisonOperator.NE: operator.ne,
+    common.LogicalOperator.AND: lambda left, right: left and right,
+    common.LogicalOperator.OR: lambda left, right: left or right,
+}
+
+
+def _scalar_type(dtype: common.DataType) -> Any:
+    return np.dtype(common.data_type_to_typestr(dtype)).type
+
+
+def _value(node: oir.Expr) -> Optional[Any]:
+    """Value of a literal as NumPy scalar of its dtype (`None` if not a constant)."""
+    if not isinstance(node, oir.Literal):
+        return None
+    if node.value == common.BuiltInLiteral.TRUE:
+        return np.bool_(True)
+    if node.value == common.BuiltInLiteral.FALSE:
+        return np.bool_(False)
+    if isinstance(node.value, common.BuiltInLiteral):
+        return None
+    if node.dtype == common.DataType.BOOL:
+        return {"True": np.bool_(True), "False": np.bool_(False)}.get(node.value)
+    try:
+        return _scalar_type(node.dtype)(node.value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _literal(value: Any, dtype: common.DataType) -> Optional[oir.Literal]:
+    """Literal of a NumPy scalar (`None` if not representable in the generated code)."""
+    value = _scalar_type(dtype)(value)
+    if dtype == common.DataType.BOOL:
+        literal = common.BuiltInLiteral.TRUE if value else common.BuiltInLiteral.FALSE
+        return oir.Literal(value=literal, dtype=dtype)
+    if dtype.isfloat():
+        if not np.isfinite(value):
+            return None
+        # the float64 representation is exact also for other float types
+        return oir.Literal(value=repr(float(value)), dtype=dtype)
+    return oir.Literal(value=str(int(value)), dtype=dtype)
+
+
+class ConstantFolding(NodeTranslator):
+    """Evaluates constant expressions and eliminates statically decided branches.
+
+    1. Replaces unary and binary operations, casts and ternary operations on literals by
+       the resulting literal, evaluated with NumPy scalars of the node dtypes (integer
+       divisions and non-finite results are not folded, as their semantics differ between
+       backends).
+    2. Replaces mask statements with constant masks by their body or removes them, and removes
+       while loops with a false condition.
+    3. Propagates constants: local scalars assigned a literal once, outside of masks and
+       loops, and temporaries only assigned the same literal, outside of masks and loops,
+       are replaced by the literal.
+
+    The steps are repeated until no more constants are found.
+    """
+
+    def visit_Literal(self, node: oir.Literal, **kwargs: Any) -> oir.Literal:
+        return node
+
+    def visit_ScalarAccess(
+        self, node: oir.ScalarAccess, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> oir.Expr:
+        return constants.get(node.name, node)
+
+    def visit_FieldAccess(
+        self, node: oir.FieldAccess, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> oir.Expr:
+        if node.name in constants:
+            return constants[node.name]
+        return self.generic_visit(node, constants=constants, **kwargs)
+
+    def visit_UnaryOp(self, node: oir.UnaryOp, **kwargs: Any) -> oir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        value = _value(expr)
+        if value is not None:
+            with np.errstate(all="ignore"):
+                literal = _literal(_UNARY_OPERATORS[node.op](value), node.dtype)
+            if literal is not None:
+                return literal
+        return oir.UnaryOp(op=node.op, expr=expr, loc=node.loc)
+
+    def visit_BinaryOp(self, node: oir.BinaryOp, **kwargs: Any) -> oir.Expr:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        left_value, right_value = _value(left), _value(right)
+
+        if node.op in (common.LogicalOperator.AND, common.LogicalOperator.OR):
+            # `x and True` is `x`, `x and False` is `False`, dually for `or`
+            absorbing = node.op == common.LogicalOperator.OR
+            for constant, other in ((left_value, right), (right_value, left)):
+                if constant is not None:
+                    return _literal(absorbing, node.dtype) if constant == absorbing else other
+
+        if (
+            left_value is not None
+            and right_value is not None
+            and left.dtype == right.dtype
+            and not (node.op == common.ArithmeticOperator.DIV and left.dtype.isinteger())
+        ):
+            with np.errstate(all="ignore"):
+                literal = _literal(_BINARY_OPERATORS[node.op](left_value, right_value), node.dtype)
+            if literal is not None:
+                return literal
+        return oir.BinaryOp(op=node.op, left=left, right=right, loc=node.loc)
+
+    def visit_TernaryOp(self, node: oir.TernaryOp, **kwargs: Any) -> oir.Expr:
+        cond = self.visit(node.cond, **kwargs)
+        true_expr = self.visit(node.true_expr, **kwargs)
+        false_expr = self.visit(node.false_expr, **kwargs)
+        cond_value = _value(cond)
+        if cond_value is not None:
+            return true_expr if cond_value else false_expr
+        return oir.TernaryOp(cond=cond, true_expr=true_expr, false_expr=false_expr, loc=node.loc)
+
+    def visit_Cast(self, node: oir.Cast, **kwargs: Any) -> oir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        value = _value(expr)
+        if value is not None:
+            with np.errstate(all="ignore"):
+                literal = _literal(value, node.dtype)
+            if literal is not None:
+                return literal
+        return oir.Cast(dtype=node.dtype, expr=expr, loc=node.loc)
+
+    def _visit_stmts(self, stmts: List[oir.Stmt], **kwargs: Any) -> List[oir.Stmt]:
+        result: List[oir.Stmt] = []
+        for stmt in stmts:
+            visited = self.visit(stmt, **kwargs)
+            if visited is not NOTHING:
+                result.extend(visited if isinstance(visited, list) else [visited])
+        return result
+
+    def visit_AssignStmt(
+        self, node: oir.AssignStmt, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> Any:
+        if node.left.name in constants:
+            return NOTHING
+        return self.generic_visit(node, constants=constants, **kwargs)
+
+    def visit_MaskStmt(self, node: oir.MaskStmt, **kwargs: Any) -> Any:
+        mask = self.visit(node.mask, **kwargs)
+        mask_value = _value(mask)
+        if mask_value is not None:
+            return self._visit_stmts(node.body, **kwargs) if mask_value else NOTHING
+        body = self._visit_stmts(node.body, **kwargs)
+        if not body:
+            return NOTHING
+        return oir.MaskStmt(mask=mask, body=body, loc=node.loc)
+
+    def visit_While(self, node: oir.While, **kwargs: Any) -> Any:
+        cond = self.visit(node.cond, **kwargs)
+        cond_value = _value(cond)
+        if cond_value is not None and not cond_value:
+            return NOTHING
+        return oir.While(cond=cond, body=self._visit_stmts(node.body, **kwargs), loc=node.loc)
+
+    def visit_HorizontalRestriction(self, node: oir.HorizontalRestriction, **kwargs: Any) -> Any:
+        body = self._visit_stmts(node.body, **kwargs)
+        if not body:
+            return NOTHING
+        return oir.HorizontalRestriction(mask=node.mask, body=body, loc=node.loc)
+
+    def visit_HorizontalExecution(
+        self,
+        node: oir.HorizontalExecution,
+        *,
+        constants: Dict[str, oir.Literal],
+        **kwargs: Any,
+    ) -> oir.HorizontalExecution:
+        body = self._visit_stmts(node.body, constants=constants, **kwargs)
+        declarations = node.declarations
+        while True:
+            local_names = {decl.name for decl in declarations}
+            assignments = collections.Counter(
+                assign.left.name
+                for assign in oir.HorizontalExecution(body=body, declarations=[])
+                .iter_tree()
+                .if_isinstance(oir.AssignStmt)
+                if isinstance(assign.left, oir.ScalarAccess)
+            )
+            local_constants = {
+                stmt.left.name: stmt.right
+                for stmt in body
+                if isinstance(stmt, oir.AssignStmt)
+                and isinstance(stmt.left, oir.ScalarAccess)
+                and stmt.left.name in local_names
+                and assignments[stmt.left.name] == 1
+                and _value(stmt.right) is not None
+            }
+            if not local_constants:
+                break
+            body = self._visit_stmts(body, constants={**constants, **local_constants}, **kwargs)
+            declarations = [decl for decl in declarations if decl.name not in local_constants]
+
+        return oir.HorizontalExecution(body=body, declarations=declarations, loc=node.loc)
+
+    @staticmethod
+    def _constant_temporaries(node: oir.Stencil) -> Dict[str, oir.Literal]:
+        """Temporaries which are only assigned the same literal, outside of masks and loops."""
+        values: Dict[str, Optional[oir.Literal]] = {
+            decl.name: None for decl in node.declarations if not decl.data_dims
+        }
+        for horizontal_execution in node.iter_tree().if_isinstance(oir.HorizontalExecution):
+            for stmt in horizontal_execution.body:
+                for assign in stmt.iter_tree().if_isinstance(oir.AssignStmt):
+                    name = assign.left.name
+                    if name not in values:
+                        continue
+                    if (
+                        assign is not stmt
+                        or _value(assign.right) is None
+                        or (
+                            values[name] is not None
+                            and (values[name].value, values[name].dtype)
+                            != (assign.right.value, assign.right.dtype)
+                        )
+                    ):
+                        del values[name]
+                    else:
+                        values[name] = assign.right
+        return {name: value for name, value in values.items() if value is not None}
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        constants: Dict[str, oir.Literal] = {}
+        vertical_loops = self.visit(node.vertical_loops, constants=constants, **kwargs)
+        while True:
+            stencil = oir.Stencil(
+                name=node.name,
+                params=node.params,
+                vertical_loops=vertical_loops,
+                declarations=[decl for decl in node.declarations if decl.name not in constants],
+                loc=node.loc,
+            )
+            new_constants = self._constant_temporaries(stencil)
+            if not new_constants:
+                return stencil
+            constants.update(new_constants)
+            vertical_loops = self.visit(vertical_loops, constants=new_constants, **kwargs)
+
+    def visit_VerticalLoopSection(
+        self, node: oir.VerticalLoopSection, **kwargs: Any
+    ) -> oir.VerticalLoopSection:
+        horizontal_executions = self.visit(node.horizontal_executions, **kwargs)
+        # sections are kept to preserve the contiguity of the loop intervals
+        nonempty = [he for he in horizontal_executions if he.body] or horizontal_executions[:1]
+        return oir.VerticalLoopSection(
+            interval=node.interval, horizontal_executions=nonempty, loc=node.loc
+        )
+
+    def visit_VerticalLoop(
+        self, node: oir.VerticalLoop, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> oir.VerticalLoop:
+        return oir.VerticalLoop(
+            loop_order=node.loop_order,
+            sections=self.visit(node.sections, constants=constants, **kwargs),
+            caches=[cache for cache in node.caches if cache.name not in constants],
+            loc=node.loc,
+        )
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, Callable, List, Set, Tuple
+
+from eve import NodeTranslator
+from gtc import common, oir
+from gtc.passes.oir_optimizations.utils import (
+    AccessCollector,
+    collect_symbol_names,
+    symbol_name_creator,
+)
+
+
+class KInvariantHoisting(NodeTranslator):
+    """Hoists k-invariant expressions out of vertical loops into 2D temporaries.
+
+    Expressions of vertical loops which only read literals, scalar parameters and fields
+    without vertical dimension that are not written in the loop have the same value on all
+    levels. If they contain a native function call or at least `min_operations` operations,
+    they are computed once, on the first level of a new forward loop inserted before the loop,
+    into a temporary without vertical dimension which replaces them.
+
+    Expressions of horizontal regions, of the bodies of masks and while loops and of sections
+    of a single level are not hoisted: conditional expressions would be evaluated on all points
+    (e.g. a division guarded by a mask), possibly raising floating point errors.
+
+    Backends must support temporaries without vertical dimension, so this pass is skipped
+    by the backends allocating all temporaries as 3D fields.
+    """
+
+    min_operations = 2
+
+    def _is_hoistable(
+        self, node: oir.Expr, *, invariant_fields: Set[str], scalars: Set[str]
+    ) -> bool:
+        accesses = list(node.iter_tree().if_isinstance(oir.FieldAccess))
+        if not accesses or isinstance(node, oir.FieldAccess):
+            return False
+        if any(
+            access.name not in invariant_fields
+            or access.data_index
+            or not isinstance(access.offset, common.CartesianOffset)
+            for access in accesses
+        ):
+            return False
+        scalar_names = node.iter_tree().if_isinstance(oir.ScalarAccess).getattr("name").to_set()
+        if not scalar_names <= scalars:
+            return False
+        operations = list(
+            node.iter_tree().if_isinstance(
+                oir.UnaryOp, oir.BinaryOp, oir.TernaryOp, oir.NativeFuncCall
+            )
+        )
+        return len(operations) >= self.min_operations or any(
+            isinstance(operation, oir.NativeFuncCall) for operation in operations
+        )
+
+    def visit_Expr(
+        self,
+        node: oir.Expr,
+        *,
+        invariant_fields: Set[str],
+        scalars: Set[str],
+        hoisted: List[Tuple[oir.Expr, str]],
+        new_symbol_name: Callable[[str], str],
+        **kwargs: Any,
+    ) -> oir.Expr:
+        if not self._is_hoistable(node, invariant_fields=invariant_fields, scalars=scalars):
+            return self.generic_visit(
+                node,
+                invariant_fields=invariant_fields,
+                scalars=scalars,
+                hoisted=hoisted,
+                new_symbol_name=new_symbol_name,
+                **kwargs,
+            )
+        for expr, name in hoisted:
+            if expr == node:
+                break
+        else:
+            name = new_symbol_name("k_invariant")
+            hoisted.append((node, name))
+        return oir.FieldAccess(
+            name=name, offset=common.CartesianOffset.zero(), dtype=node.dtype, loc=node.loc
+        )
+
+    def visit_HorizontalRestriction(
+        self, node: oir.HorizontalRestriction, **kwargs: Any
+    ) -> oir.HorizontalRestriction:
+        return node
+
+    def visit_MaskStmt(self, node: oir.MaskStmt, **kwargs: Any) -> oir.MaskStmt:
+        return oir.MaskStmt(mask=self.visit(node.mask, **kwargs), body=node.body, loc=node.loc)
+
+    def visit_While(self, node: oir.While, **kwargs: Any) -> oir.While:
+        return oir.While(cond=self.visit(node.cond, **kwargs), body=node.body, loc=node.loc)
+
+    def visit_VerticalLoopSection(
+        self, node: oir.VerticalLoopSection, **kwargs: Any
+    ) -> oir.VerticalLoopSection:
+        start, end = node.interval.start, node.interval.end
+        if start.level == end.level and end.offset - start.offset <= 1:
+            return node
+        return self.generic_visit(node, **kwargs)
+
+    @staticmethod
+    def _hoisted_loop(hoisted: List[Tuple[oir.Expr, str]]) -> oir.VerticalLoop:
+        """Forward loop computing the hoisted expressions on the first level."""
+        horizontal_execution = oir.HorizontalExecution(
+            body=[
+                oir.AssignStmt(
+                    left=oir.FieldAccess(
+                        name=name, offset=common.CartesianOffset.zero(), dtype=expr.dtype
+                    ),
+                    right=expr,
+                )
+                for expr, name in hoisted
+            ],
+            declarations=[],
+        )
+        return oir.VerticalLoop(
+            loop_order=common.LoopOrder.FORWARD,
+            sections=[
+                oir.VerticalLoopSection(
+                    interval=oir.Interval(
+                        start=common.AxisBound.start(), end=common.AxisBound.from_start(1)
+                    ),
+                    horizontal_executions=[horizontal_execution],
+                )
+            ],
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        fields_without_k = {
+            decl.name
+            for decl in node.params
+            if isinstance(decl, oir.FieldDecl) and not decl.dimensions[2]
+        }
+        scalars = {decl.name for decl in node.params if isinstance(decl, oir.ScalarDecl)}
+        new_symbol_name = symbol_name_creator(collect_symbol_names(node))
+
+        vertical_loops: List[oir.VerticalLoop] = []
+        declarations = list(node.declarations)
+        for vertical_loop in node.vertical_loops:
+            hoisted: List[Tuple[oir.Expr, str]] = []
+            vertical_loop = self.visit(
+                vertical_loop,
+                invariant_fields=fields_without_k
+                - AccessCollector.apply(vertical_loop).write_fields(),
+                scalars=scalars,
+                hoisted=hoisted,
+                new_symbol_name=new_symbol_name,
+            )
+            if hoisted:
+                vertical_loops.append(self._hoisted_loop(hoisted))
+                declarations += [
+                    oir.Temporary(name=name, dtype=expr.dtype, dimensions=(True, True, False))
+                    for expr, name in hoisted
+                ]
+            vertical_loops.append(vertical_loop)
+
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=vertical_loops,
+            declarations=declarations,
+            loc=node.loc,
+        )
@@ -20,6 +20,7 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from eve import NodeTranslator, SourceLocation, SymbolTableTrait
 from gt4py.definitions import Extent
 from gtc import common, oir
+from gtc.passes.pass_manager import ACCESS_KINDS, EXTENTS, SYMBOL_NAMES
 
 from .utils import (
     AccessCollector,
@@ -30,6 +31,9 @@ from .utils import (
 
 
 class HorizontalExecutionMerging(NodeTranslator):
+    required_analyses = (EXTENTS, SYMBOL_NAMES)
+    preserved_analyses = (ACCESS_KINDS,)
+
     def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
         all_names = collect_symbol_names(node)
         return self.generic_visit(
@@ -141,18 +145,89 @@ class HorizontalExecutionMerging(NodeTranslator):
         )
 
 
+#: Native functions considered expensive by :class:`MergeCostModel`.
+EXPENSIVE_FUNCTIONS = frozenset(
+    {
+        common.NativeFunction.POW,
+        common.NativeFunction.SIN,
+        common.NativeFunction.COS,
+        common.NativeFunction.TAN,
+        common.NativeFunction.ARCSIN,
+        common.NativeFunction.ARCCOS,
+        common.NativeFunction.ARCTAN,
+        common.NativeFunction.SINH,
+        common.NativeFunction.COSH,
+        common.NativeFunction.TANH,
+        common.NativeFunction.ARCSINH,
+        common.NativeFunction.ARCCOSH,
+        common.NativeFunction.ARCTANH,
+        common.NativeFunction.SQRT,
+        common.NativeFunction.EXP,
+        common.NativeFunction.LOG,
+        common.NativeFunction.GAMMA,
+        common.NativeFunction.CBRT,
+    }
+)
+
+
+@dataclass(frozen=True)
+class MergeCostModel:
+    """Estimates if merging a horizontal execution on the fly into its consumers pays off.
+
+    Costs are per grid point, in arbitrary but consistent units. Merging recomputes the body
+    of the producer once per distinct offset at which each consumer reads its outputs, instead
+    of computing it once; in exchange, its output fields are neither stored nor loaded again.
+    The defaults roughly match a CPU, backends adjust them to their hardware.
+    """
+
+    #: Cost of an arithmetic, logical or comparison operation.
+    operation_cost: float = 1.0
+    #: Cost of a call to a native function not in :data:`EXPENSIVE_FUNCTIONS`.
+    function_call_cost: float = 1.0
+    #: Cost of a call to a native function in :data:`EXPENSIVE_FUNCTIONS`.
+    expensive_function_cost: float = 30.0
+    #: Cost of storing or loading a value of a field.
+    memory_access_cost: float = 8.0
+
+    def computation_cost(self, node: oir.HorizontalExecution) -> float:
+        cost = 0.0
+        for operation in node.iter_tree().if_isinstance(
+            oir.UnaryOp, oir.BinaryOp, oir.TernaryOp, oir.NativeFuncCall
+        ):
+            if not isinstance(operation, oir.NativeFuncCall):
+                cost += self.operation_cost
+            elif operation.func in EXPENSIVE_FUNCTIONS:
+                cost += self.expensive_function_cost
+            else:
+                cost += self.function_call_cost
+        return cost
+
+    def is_profitable(
+        self, node: oir.HorizontalExecution, *, written_fields: int, offset_counts: List[int]
+    ) -> bool:
+        """Compare the cost of redundant computations with the saved memory traffic.
+
+        `offset_counts` holds, for each consumer, the number of distinct offsets at which it
+        reads the `written_fields` outputs of `node`.
+        """
+        recomputation_cost = (sum(offset_counts) - 1) * self.computation_cost(node)
+        saved_memory_cost = written_fields * (1 + len(offset_counts)) * self.memory_access_cost
+        return recomputation_cost <= saved_memory_cost
+
+
 @dataclass
 class OnTheFlyMerging(NodeTranslator):
     """Merges consecutive horizontal executions inside parallel vertical loops by introducing redundant computations.
 
+    Merging is only applied if considered profitable by `cost_model`, see :class:`MergeCostModel`.
+
     Limitations:
     * Works on the level of whole horizontal executions, no full dependency analysis is performed (common subexpression and dead code eliminitation at a later stage can work around this limitation).
-    * The chosen default merge limits are totally arbitrary.
     """
 
-    max_horizontal_execution_body_size: int = 100
-    allow_expensive_function_duplication: bool = False
+    cost_model: MergeCostModel = MergeCostModel()
     contexts = (SymbolTableTrait.symtable_merger,)
+    required_analyses = (SYMBOL_NAMES,)
 
     def visit_CartesianOffset(
         self,
@@ -213,38 +288,9 @@ class OnTheFlyMerging(NodeTranslator):
         def first_fields_rewritten_later() -> bool:
             return bool(first_accesses.fields() & other_accesses.write_fields())
 
-        def first_has_large_body() -> bool:
-            return len(first.body) > self.max_horizontal_execution_body_size
-
         def first_writes_protected() -> bool:
             return bool(protected_fields & first_accesses.write_fields())
 
-        def first_has_expensive_function_call() -> bool:
-            if self.allow_expensive_function_duplication:
-                return False
-            nf = common.NativeFunction
-            expensive_calls = {
-                nf.SIN,
-                nf.COS,
-                nf.TAN,
-                nf.ARCSIN,
-                nf.ARCCOS,
-                nf.ARCTAN,
-                nf.SINH,
-                nf.COSH,
-                nf.TANH,
-                nf.ARCSINH,
-                nf.ARCCOSH,
-                nf.ARCTANH,
-                nf.SQRT,
-                nf.EXP,
-                nf.LOG,
-                nf.GAMMA,
-                nf.CBRT,
-            }
-            calls = first.iter_tree().if_isinstance(oir.NativeFuncCall).getattr("func")
-            return any(call in expensive_calls for call in calls)
-
         def first_has_variable_access() -> bool:
             return first_accesses.has_variable_access()
 
@@ -254,16 +300,13 @@ class OnTheFlyMerging(NodeTranslator):
         if (
             first_fields_rewritten_later()
             or first_writes_protected()
-            or first_has_large_body()
-            or first_has_expensive_function_call()
             or first_has_variable_access()
             or first_has_horizontal_restriction()
         ):
             return [first] + self._merge(others, symtable, new_symbol_name, protected_fields)
 
-        first_scalars = {decl.name for decl in first.declarations}
         writes = first_accesses.write_fields()
-        others_otf = []
+        others_read_offsets: List[Set[Tuple[int, int, int]]] = []
         for horizontal_execution in others:
             read_offsets: Set[Tuple[int, int, int]] = set()
             read_offsets = read_offsets.union(
@@ -276,7 +319,18 @@ class OnTheFlyMerging(NodeTranslator):
                     if field in writes
                 )
             )
+            others_read_offsets.append(read_offsets)
+
+        if not self.cost_model.is_profitable(
+            first,
+            written_fields=len(writes),
+            offset_counts=[len(offsets) for offsets in others_read_offsets if offsets],
+        ):
+            return [first] + self._merge(others, symtable, new_symbol_name, protected_fields)
 
+        first_scalars = {decl.name for decl in first.declarations}
+        others_otf = []
+        for horizontal_execution, read_offsets in zip(others, others_read_offsets):
             if not read_offsets:
                 others_otf.append(horizontal_execution)
                 continue
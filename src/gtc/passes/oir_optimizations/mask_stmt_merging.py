@@ -18,17 +18,21 @@ from typing import List
 
 from eve import NodeTranslator
 from gtc import oir
+from gtc.passes.pass_manager import EXTENTS, SYMBOL_NAMES
 
 from .utils import AccessCollector
 
 
 class MaskStmtMerging(NodeTranslator):
+    preserved_analyses = (EXTENTS, SYMBOL_NAMES)
+
     def _merge(self, stmts: List[oir.Stmt]) -> List[oir.Stmt]:
-        merged = [self.visit(stmts[0])]
-        for stmt in stmts[1:]:
+        merged: List[oir.Stmt] = []
+        for stmt in stmts:
             stmt = self.visit(stmt)
             if (
-                isinstance(stmt, oir.MaskStmt)
+                merged
+                and isinstance(stmt, oir.MaskStmt)
                 and isinstance(merged[-1], oir.MaskStmt)
                 and stmt.mask == merged[-1].mask
                 and not (
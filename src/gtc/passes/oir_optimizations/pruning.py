@@ -14,13 +14,14 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Set
 
 from eve import NOTHING, NodeTranslator
 from gt4py.definitions import Extent
-from gtc import oir
+from gtc import common, oir
 from gtc.passes.horizontal_masks import mask_overlap_with_extent
-from gtc.passes.oir_optimizations.utils import compute_horizontal_block_extents
+from gtc.passes.oir_optimizations.utils import AccessCollector, compute_horizontal_block_extents
+from gtc.passes.pass_manager import EXTENTS, SYMBOL_NAMES
 
 
 class NoFieldAccessPruning(NodeTranslator):
@@ -54,6 +55,9 @@ class NoFieldAccessPruning(NodeTranslator):
 
 
 class UnreachableStmtPruning(NodeTranslator):
+    required_analyses = (EXTENTS,)
+    preserved_analyses = (SYMBOL_NAMES,)
+
     def visit_Stencil(self, node: oir.Stencil) -> oir.Stencil:
         block_extents = compute_horizontal_block_extents(node)
         return self.generic_visit(node, block_extents=block_extents)
@@ -68,3 +72,187 @@ class UnreachableStmtPruning(NodeTranslator):
     ) -> Any:
         overlap = mask_overlap_with_extent(node.mask, block_extent)
         return NOTHING if overlap is None else node
+
+
+class DeadCodeElimination(NodeTranslator):
+    """Removes statements, temporaries and computations without effect on the outputs.
+
+    1. Temporaries which do not contribute to the values of the API fields (e.g. which are
+       never read) are removed together with their assignments and caches.
+    2. Assignments to local scalars are removed if the value is not read later in the
+       horizontal execution.
+    3. Unconditional assignments to a field without offset are removed if the field is assigned
+       again later in the same horizontal execution, without any read of the field in between.
+    4. Horizontal executions which become empty are removed, as well as the empty sections at
+       the start and end of vertical loops and the vertical loops which become empty.
+
+    The steps are repeated until no more dead code is found.
+    """
+
+    @staticmethod
+    def _is_unconditional_overwrite(node: oir.AssignStmt) -> bool:
+        return (
+            isinstance(node.left, oir.FieldAccess)
+            and isinstance(node.left.offset, common.CartesianOffset)
+            and node.left.offset.to_dict() == {"i": 0, "j": 0, "k": 0}
+            and not node.left.data_index
+        )
+
+    @staticmethod
+    def _read_scalars(node: oir.Stmt) -> Set[str]:
+        assigned = {id(assign.left) for assign in node.iter_tree().if_isinstance(oir.AssignStmt)}
+        return {
+            access.name
+            for access in node.iter_tree().if_isinstance(oir.ScalarAccess)
+            if id(access) not in assigned
+        }
+
+    @staticmethod
+    def _dead_temporaries(node: oir.Stencil) -> Set[str]:
+        """Temporaries which do not contribute to the values of the API fields."""
+        live_fields = {param.name for param in node.params}
+        accesses = [
+            AccessCollector.apply(horizontal_execution)
+            for horizontal_execution in node.iter_tree().if_isinstance(oir.HorizontalExecution)
+        ]
+        changed = True
+        while changed:
+            changed = False
+            for access in accesses:
+                if access.write_fields() & live_fields:
+                    new_live_fields = access.read_fields() - live_fields
+                    if new_live_fields:
+                        live_fields |= new_live_fields
+                        changed = True
+        return {decl.name for decl in node.declarations} - live_fields
+
+    def _prune_nested(
+        self, stmts: List[oir.Stmt], *, dead_temporaries: Set[str], live_scalars: Set[str]
+    ) -> List[oir.Stmt]:
+        """Remove dead assignments from statements which are executed conditionally."""
+        result: List[oir.Stmt] = []
+        for stmt in stmts:
+            if isinstance(stmt, oir.AssignStmt):
+                if (
+                    isinstance(stmt.left, oir.ScalarAccess)
+                    and stmt.left.name not in live_scalars
+                    or stmt.left.name in dead_temporaries
+                ):
+                    continue
+            elif isinstance(stmt, (oir.MaskStmt, oir.While, oir.HorizontalRestriction)):
+                body = self._prune_nested(
+                    stmt.body, dead_temporaries=dead_temporaries, live_scalars=live_scalars
+                )
+                if not body:
+                    continue
+                stmt = stmt.copy(update={"body": body})
+            result.append(stmt)
+        return result
+
+    def _prune_body(self, stmts: List[oir.Stmt], *, dead_temporaries: Set[str]) -> List[oir.Stmt]:
+        live_scalars: Set[str] = set()
+        overwritten_fields: Set[str] = set()
+        result: List[oir.Stmt] = []
+        for stmt in reversed(stmts):
+            if isinstance(stmt, oir.AssignStmt):
+                is_overwrite = self._is_unconditional_overwrite(stmt)
+                if (
+                    isinstance(stmt.left, oir.ScalarAccess)
+                    and stmt.left.name not in live_scalars
+                    or stmt.left.name in dead_temporaries
+                    or is_overwrite
+                    and stmt.left.name in overwritten_fields
+                ):
+                    continue
+                reads = [stmt.right]
+                if isinstance(stmt.left, oir.ScalarAccess):
+                    live_scalars.discard(stmt.left.name)
+                elif is_overwrite:
+                    overwritten_fields.add(stmt.left.name)
+                else:
+                    reads.append(stmt.left)
+                overwritten_fields -= AccessCollector.apply(reads, is_write=False).fields()
+                live_scalars |= self._read_scalars(stmt)
+            else:
+                # statements in masks and loops are executed conditionally, so their reads
+                # (also by later iterations of loops) keep all assignments alive
+                live_scalars |= self._read_scalars(stmt)
+                stmt = self._prune_nested(
+                    [stmt], dead_temporaries=dead_temporaries, live_scalars=live_scalars
+                )
+                if not stmt:
+                    continue
+                stmt = stmt[0]
+                overwritten_fields -= AccessCollector.apply(stmt).read_fields()
+            result.append(stmt)
+        return result[::-1]
+
+    def visit_HorizontalExecution(
+        self, node: oir.HorizontalExecution, *, dead_temporaries: Set[str]
+    ) -> Any:
+        body = self._prune_body(node.body, dead_temporaries=dead_temporaries)
+        if not body:
+            return NOTHING
+        used_names = (
+            oir.HorizontalExecution(body=body, declarations=[])
+            .iter_tree()
+            .if_isinstance(oir.ScalarAccess)
+            .getattr("name")
+            .to_set()
+        )
+        return oir.HorizontalExecution(
+            body=body,
+            declarations=[decl for decl in node.declarations if decl.name in used_names],
+            loc=node.loc,
+        )
+
+    def visit_VerticalLoop(self, node: oir.VerticalLoop, *, dead_temporaries: Set[str]) -> Any:
+        sections = [
+            oir.VerticalLoopSection(
+                interval=section.interval,
+                horizontal_executions=self.visit(
+                    section.horizontal_executions, dead_temporaries=dead_temporaries
+                ),
+                loc=section.loc,
+            )
+            for section in node.sections
+        ]
+        # empty sections in the middle of the loop are kept to preserve the contiguity
+        # of the loop intervals
+        while sections and not sections[0].horizontal_executions:
+            sections.pop(0)
+        while sections and not sections[-1].horizontal_executions:
+            sections.pop()
+        if not sections:
+            return NOTHING
+        return oir.VerticalLoop(
+            loop_order=node.loop_order,
+            sections=[
+                section
+                if section.horizontal_executions
+                else section.copy(
+                    update={
+                        "horizontal_executions": [oir.HorizontalExecution(body=[], declarations=[])]
+                    }
+                )
+                for section in sections
+            ],
+            caches=[cache for cache in node.caches if cache.name not in dead_temporaries],
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        while True:
+            dead_temporaries = self._dead_temporaries(node)
+            result = oir.Stencil(
+                name=node.name,
+                params=node.params,
+                vertical_loops=self.visit(node.vertical_loops, dead_temporaries=dead_temporaries),
+                declarations=[
+                    decl for decl in node.declarations if decl.name not in dead_temporaries
+                ],
+                loc=node.loc,
+            )
+            if result == node:
+                return result
+            node = result
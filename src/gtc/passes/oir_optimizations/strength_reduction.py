@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+from typing import Any, Optional
+
+import numpy as np
+
+from eve import NodeTranslator
+from gtc import common, oir
+from gtc.passes.pass_manager import SYMBOL_NAMES
+
+
+#: Largest absolute value of the exponents of powers replaced by multiplications.
+MAX_EXPONENT = 4
+
+
+def _float_value(node: oir.Expr) -> Optional[float]:
+    if not isinstance(node, oir.Literal) or isinstance(node.value, common.BuiltInLiteral):
+        return None
+    try:
+        return float(node.value)
+    except ValueError:
+        return None
+
+
+def _is_cheap(node: oir.Expr) -> bool:
+    """Check if an expression can be repeated without significant cost."""
+    if isinstance(node, oir.Cast):
+        return _is_cheap(node.expr)
+    return isinstance(node, (oir.FieldAccess, oir.ScalarAccess, oir.Literal))
+
+
+class StrengthReduction(NodeTranslator):
+    """Replaces powers and divisions by cheaper operations.
+
+    Without `fast_math`, only replacements giving the same results are applied:
+
+    * `x ** 0` and `x ** 1` by `1` and `x`,
+    * `x / c` by `x * (1 / c)` for literals `c` which are powers of two.
+
+    With `fast_math`, the results may differ in the last bits and for special values:
+
+    * `x ** n` by chains of multiplications for integers `n` up to :data:`MAX_EXPONENT`
+      (with a division for negative exponents), as `pow` may round differently even for
+      `x ** 2` and `x ** -1`,
+    * `x ** (n + 0.5)` by the same chains multiplied by `sqrt(x)`,
+    * `x / c` by `x * (1 / c)` for all finite non-zero literals `c`.
+
+    Powers are only reduced for bases which are accesses or literals, as other expressions
+    would be evaluated several times.
+    """
+
+    preserved_analyses = (SYMBOL_NAMES,)
+
+    fast_math = False
+
+    def _power(self, base: oir.Expr, exponent: float) -> Optional[oir.Expr]:
+        exact = exponent in (0.0, 1.0)
+        if not (exact or self.fast_math):
+            return None
+        if (2 * exponent) % 1 != 0 or abs(exponent) > MAX_EXPONENT:
+            return None
+        one = oir.Literal(value="1.0", dtype=base.dtype)
+
+        integral, fractional = divmod(abs(exponent), 1)
+        factors = [base] * int(integral)
+        if fractional:
+            factors.append(oir.NativeFuncCall(func=common.NativeFunction.SQRT, args=[base]))
+        if not factors:
+            return one
+
+        result = factors[0]
+        for factor in factors[1:]:
+            result = oir.BinaryOp(op=common.ArithmeticOperator.MUL, left=result, right=factor)
+        if exponent < 0:
+            result = oir.BinaryOp(op=common.ArithmeticOperator.DIV, left=one, right=result)
+        return result
+
+    def visit_NativeFuncCall(self, node: oir.NativeFuncCall, **kwargs: Any) -> oir.Expr:
+        args = self.visit(node.args, **kwargs)
+        if node.func == common.NativeFunction.POW:
+            base, exponent = args
+            exponent_value = _float_value(exponent)
+            if (
+                exponent_value is not None
+                and base.dtype.isfloat()
+                and base.dtype == node.dtype
+                and _is_cheap(base)
+            ):
+                reduced = self._power(base, exponent_value)
+                if reduced is not None:
+                    return reduced
+        return oir.NativeFuncCall(func=node.func, args=args, loc=node.loc)
+
+    def visit_BinaryOp(self, node: oir.BinaryOp, **kwargs: Any) -> oir.Expr:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        divisor = _float_value(right)
+        if (
+            node.op == common.ArithmeticOperator.DIV
+            and divisor is not None
+            and right.dtype.isfloat()
+            and divisor != 0.0
+            and math.isfinite(divisor)
+            and (self.fast_math or math.frexp(divisor)[0] in (0.5, -0.5))
+        ):
+            scalar_type = np.dtype(common.data_type_to_typestr(right.dtype)).type
+            reciprocal = scalar_type(1) / scalar_type(divisor)
+            if np.isfinite(reciprocal):
+                return oir.BinaryOp(
+                    op=common.ArithmeticOperator.MUL,
+                    left=left,
+                    right=oir.Literal(value=repr(float(reciprocal)), dtype=right.dtype),
+                    loc=node.loc,
+                )
+        return oir.BinaryOp(op=node.op, left=left, right=right, loc=node.loc)
+
+
+class FastMathStrengthReduction(StrengthReduction):
+    """Strength reduction which may change results (see :class:`StrengthReduction`)."""
+
+    fast_math = True
@@ -15,16 +15,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import collections
-from typing import Any, Callable, Dict, Set, Union
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
 
 from eve import NodeTranslator, SymbolTableTrait
-from gtc import oir
+from gtc import common, oir
+from gtc.passes.pass_manager import ALL_ANALYSES, SYMBOL_NAMES
 
-from .utils import AccessCollector, collect_symbol_names, symbol_name_creator
+from .utils import (
+    AccessCollector,
+    collect_symbol_names,
+    compute_ordered_extents,
+    symbol_name_creator,
+)
 
 
 class TemporariesToScalarsBase(NodeTranslator):
     contexts = (SymbolTableTrait.symtable_merger,)
+    required_analyses = (SYMBOL_NAMES,)
 
     def visit_FieldAccess(
         self, node: oir.FieldAccess, *, tmps_name_map: Dict[str, str], **kwargs: Any
@@ -160,3 +167,227 @@ class WriteBeforeReadTemporariesToScalars(TemporariesToScalarsBase):
             }
 
         return super().visit_Stencil(node, tmps_to_replace=write_before_read_tmps, **kwargs)
+
+
+class TemporaryDimensionReduction(NodeTranslator):
+    """Reduces the dimensions of temporaries which do not need a full IJK storage.
+
+    Temporaries whose values cannot vary horizontally are demoted to K-columns: all their
+    assignments are top-level statements of horizontal executions (not in masks, loops or
+    horizontal regions) reading only literals, scalar parameters, fields without horizontal
+    dimensions and other horizontally invariant temporaries or local scalars.
+
+    Temporaries accessed in a single sequential vertical loop and only at the current level
+    are demoted to IJ-planes, as only the plane of the current level is alive.
+
+    The GridTools and CUDA backends allocate all temporaries as 3D fields, so they skip
+    this pass.
+    """
+
+    preserved_analyses = ALL_ANALYSES
+
+    def visit_Temporary(
+        self,
+        node: oir.Temporary,
+        *,
+        dimensions: Dict[str, Tuple[bool, bool, bool]],
+        **kwargs: Any,
+    ) -> oir.Temporary:
+        if node.name not in dimensions:
+            return node
+        return oir.Temporary(
+            name=node.name,
+            dtype=node.dtype,
+            dimensions=dimensions[node.name],
+            data_dims=node.data_dims,
+            loc=node.loc,
+        )
+
+    @staticmethod
+    def _horizontally_invariant(node: oir.Stencil) -> Set[str]:
+        """Written temporaries whose values cannot vary horizontally."""
+        assignments: List[Tuple[str, Set[str]]] = []
+        varying = {
+            decl.name
+            for decl in node.params
+            if isinstance(decl, oir.FieldDecl) and (decl.dimensions[0] or decl.dimensions[1])
+        }
+        for horizontal_execution in node.iter_tree().if_isinstance(oir.HorizontalExecution):
+            for stmt in horizontal_execution.body:
+                for assign in stmt.iter_tree().if_isinstance(oir.AssignStmt):
+                    exprs = [assign.right]
+                    if isinstance(assign.left, oir.FieldAccess):
+                        exprs += assign.left.data_index
+                    reads = {
+                        name
+                        for expr in exprs
+                        for name in expr.iter_tree()
+                        .if_isinstance(oir.FieldAccess, oir.ScalarAccess)
+                        .getattr("name")
+                    }
+                    if assign is not stmt:
+                        varying.add(assign.left.name)
+                    assignments.append((assign.left.name, reads))
+
+        changed = True
+        while changed:
+            changed = False
+            for left, reads in assignments:
+                if left not in varying and reads & varying:
+                    varying.add(left)
+                    changed = True
+
+        written = {left for left, _ in assignments}
+        return {decl.name for decl in node.declarations} & written - varying
+
+    @staticmethod
+    def _level_local(node: oir.Stencil) -> Set[str]:
+        """Temporaries accessed in a single sequential loop and only at the current level."""
+        loops: Dict[str, List[oir.VerticalLoop]] = collections.defaultdict(list)
+        temporaries = {decl.name for decl in node.declarations}
+        for vertical_loop in node.vertical_loops:
+            for name in (
+                vertical_loop.iter_tree()
+                .if_isinstance(oir.FieldAccess)
+                .getattr("name")
+                .if_in(temporaries)
+                .to_set()
+            ):
+                loops[name].append(vertical_loop)
+
+        level_local = set()
+        for name, vertical_loops in loops.items():
+            if len(vertical_loops) != 1:
+                continue
+            vertical_loop = vertical_loops[0]
+            if vertical_loop.loop_order == common.LoopOrder.PARALLEL or any(
+                cache.name == name for cache in vertical_loop.caches
+            ):
+                continue
+            offsets = (
+                vertical_loop.iter_tree()
+                .if_isinstance(oir.FieldAccess)
+                .filter(lambda access: access.name == name)
+                .getattr("offset")
+            )
+            if all(
+                isinstance(offset, common.CartesianOffset) and offset.k == 0 for offset in offsets
+            ):
+                level_local.add(name)
+        return level_local
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        dimensions = {name: (True, True, False) for name in self._level_local(node)}
+        # a column is smaller than a plane on typical domains
+        dimensions.update(
+            {name: (False, False, True) for name in self._horizontally_invariant(node)}
+        )
+        dimensions = {
+            decl.name: dimensions[decl.name]
+            for decl in node.declarations
+            if decl.name in dimensions and decl.dimensions == (True, True, True)
+        }
+        if not dimensions:
+            return node
+        return self.generic_visit(node, dimensions=dimensions, **kwargs)
+
+
+class TemporaryBufferSharing(NodeTranslator):
+    """Lets temporaries with disjoint lifetimes share their buffers.
+
+    The lifetime of a temporary spans all vertical loops from the first to the last one
+    accessing it (a whole loop, as the levels of different horizontal executions of a loop are
+    interleaved). Temporaries with the same dtype, dimensions and data dimensions, whose
+    lifetimes do not overlap, are renamed to the first temporary of a shared buffer. Only the
+    declarations of the buffers are kept, so backends only allocate those.
+
+    As extents are computed per field name, a temporary only joins a buffer if the extents of
+    all horizontal executions (and thus of all fields) stay the same.
+
+    Backends fusing vertical loops (e.g. into a single CUDA kernel) must synchronize before a
+    loop overwrites a field which the previous loops access on other points.
+    """
+
+    def visit_FieldAccess(
+        self, node: oir.FieldAccess, *, name_map: Dict[str, str], **kwargs: Any
+    ) -> oir.FieldAccess:
+        node = self.generic_visit(node, name_map=name_map, **kwargs)
+        if node.name in name_map:
+            return oir.FieldAccess(
+                name=name_map[node.name],
+                offset=node.offset,
+                data_index=node.data_index,
+                dtype=node.dtype,
+                loc=node.loc,
+            )
+        return node
+
+    def visit_IJCache(
+        self, node: oir.IJCache, *, name_map: Dict[str, str], **kwargs: Any
+    ) -> oir.IJCache:
+        return oir.IJCache(name=name_map.get(node.name, node.name), loc=node.loc)
+
+    def visit_KCache(
+        self, node: oir.KCache, *, name_map: Dict[str, str], **kwargs: Any
+    ) -> oir.KCache:
+        return oir.KCache(
+            name=name_map.get(node.name, node.name), fill=node.fill, flush=node.flush, loc=node.loc
+        )
+
+    @staticmethod
+    def _lifetimes(node: oir.Stencil) -> Dict[str, Tuple[int, int]]:
+        """First and last vertical loop accessing each temporary."""
+        temporaries = {decl.name for decl in node.declarations}
+        lifetimes: Dict[str, Tuple[int, int]] = {}
+        for index, vertical_loop in enumerate(node.vertical_loops):
+            for name in (
+                vertical_loop.iter_tree()
+                .if_isinstance(oir.FieldAccess)
+                .getattr("name")
+                .if_in(temporaries)
+                .to_set()
+            ):
+                lifetimes[name] = (lifetimes.get(name, (index, index))[0], index)
+        return lifetimes
+
+    def _renamed(self, node: oir.Stencil, name_map: Dict[str, str], **kwargs: Any) -> oir.Stencil:
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=self.visit(node.vertical_loops, name_map=name_map, **kwargs),
+            declarations=[decl for decl in node.declarations if decl.name not in name_map],
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        declarations = {decl.name: decl for decl in node.declarations}
+        lifetimes = self._lifetimes(node)
+        _, block_extents = compute_ordered_extents(node)
+
+        def buffer_class(decl: oir.Temporary) -> Any:
+            return decl.dtype, decl.dimensions, decl.data_dims
+
+        def keeps_extents(name_map: Dict[str, str]) -> bool:
+            renamed = self._renamed(node, name_map, **kwargs)
+            return compute_ordered_extents(renamed)[1] == block_extents
+
+        # greedy interval coloring: reuse any buffer which is no longer alive
+        name_map: Dict[str, str] = {}
+        buffers: List[Tuple[str, int]] = []
+        for name in sorted(lifetimes, key=lambda name: lifetimes[name][0]):
+            first, last = lifetimes[name]
+            for index, (buffer, buffer_last) in enumerate(buffers):
+                if (
+                    buffer_last < first
+                    and buffer_class(declarations[buffer]) == buffer_class(declarations[name])
+                    and keeps_extents({**name_map, name: buffer})
+                ):
+                    name_map[name] = buffer
+                    buffers[index] = (buffer, last)
+                    break
+            else:
+                buffers.append((name, last))
+
+        if not name_map:
+            return node
+        return self._renamed(node, name_map, **kwargs)
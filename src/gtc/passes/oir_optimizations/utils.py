@@ -16,10 +16,11 @@
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar, cast
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Set, Tuple, TypeVar, cast
 
 from eve import NodeVisitor
 from eve.concepts import TreeNode
+from eve.memoization import memoized_analysis
 from eve.traits import SymbolTableTrait
 from eve.utils import XIterable, xiter
 from gt4py.definitions import Extent
@@ -215,6 +216,7 @@ def symbol_name_creator(used_names: Set[str]) -> Callable[[str], str]:
     return new_symbol_name
 
 
+@memoized_analysis
 def collect_symbol_names(node: TreeNode) -> Set[str]:
     return (
         node.iter_tree()
@@ -268,18 +270,38 @@ class StencilExtentComputer(NodeVisitor):
                 ctx.fields[access.field] = extent
 
 
-def compute_horizontal_block_extents(node: oir.Stencil, **kwargs: Any) -> Dict[int, Extent]:
+def _iter_horizontal_executions(node: oir.Stencil) -> Iterator[oir.HorizontalExecution]:
+    for vloop in node.vertical_loops:
+        for section in vloop.sections:
+            yield from section.horizontal_executions
+
+
+@memoized_analysis(copy_result=None)
+def compute_ordered_extents(
+    node: oir.Stencil, **kwargs: Any
+) -> Tuple[Dict[str, Extent], Tuple[Extent, ...]]:
+    """Compute field extents and horizontal block extents in program order.
+
+    Unlike :func:`compute_extents`, block extents are not keyed by `id()`,
+    so results stay valid for structurally equal trees. The returned value
+    is shared and must not be modified.
+    """
     ctx = StencilExtentComputer(**kwargs).visit(node)
-    return ctx.blocks
+    return ctx.fields, tuple(ctx.blocks[id(hexec)] for hexec in _iter_horizontal_executions(node))
+
+
+def compute_horizontal_block_extents(node: oir.Stencil, **kwargs: Any) -> Dict[int, Extent]:
+    return compute_extents(node, **kwargs)[1]
 
 
 def compute_fields_extents(node: oir.Stencil, **kwargs: Any) -> Dict[str, Extent]:
-    ctx = StencilExtentComputer(**kwargs).visit(node)
-    return ctx.fields
+    return compute_extents(node, **kwargs)[0]
 
 
 def compute_extents(
     node: oir.Stencil, **kwargs: Any
 ) -> Tuple[Dict[str, Extent], Dict[int, Extent]]:
-    ctx = StencilExtentComputer(**kwargs).visit(node)
-    return ctx.fields, ctx.blocks
+    fields, blocks = compute_ordered_extents(node, **kwargs)
+    return dict(fields), {
+        id(hexec): extent for hexec, extent in zip(_iter_horizontal_executions(node), blocks)
+    }
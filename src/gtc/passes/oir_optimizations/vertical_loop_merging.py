@@ -14,14 +14,57 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import warnings
-from typing import Any
+from typing import Any, List, Optional, Set
 
 from eve import NodeTranslator
 from gtc import common, oir
+from gtc.passes.pass_manager import ALL_ANALYSES, SYMBOL_NAMES
+
+from .utils import AccessCollector, GeneralOffsetTuple
+
+
+def _merge_caches(a: oir.VerticalLoop, b: oir.VerticalLoop) -> List[oir.CacheDesc]:
+    """Caches of the loop merged from `a` and `b`.
+
+    Caches of fields accessed by only one of the loops are kept and k-caches of fields cached
+    in both loops are merged. A k-cache of a field that is also accessed (but not cached) in the
+    other loop becomes a filling and flushing k-cache, unneeded fills and flushes are pruned by
+    later passes. All other caches are dropped.
+    """
+    a_caches = {c.name: c for c in a.caches}
+    b_caches = {c.name: c for c in b.caches}
+    a_fields = AccessCollector.apply(a).fields()
+    b_fields = AccessCollector.apply(b).fields()
+
+    caches: List[oir.CacheDesc] = []
+    for name in list(a_caches) + [name for name in b_caches if name not in a_caches]:
+        a_cache, b_cache = a_caches.get(name), b_caches.get(name)
+        if a_cache is not None and b_cache is not None:
+            if isinstance(a_cache, oir.KCache) and isinstance(b_cache, oir.KCache):
+                caches.append(
+                    oir.KCache(
+                        name=name,
+                        fill=a_cache.fill or b_cache.fill,
+                        flush=a_cache.flush or b_cache.flush,
+                        loc=a_cache.loc,
+                    )
+                )
+            elif isinstance(a_cache, oir.IJCache) and isinstance(b_cache, oir.IJCache):
+                caches.append(a_cache)
+            continue
+
+        cache = a_cache or b_cache
+        accessed_by_other = name in (b_fields if a_cache is not None else a_fields)
+        if not accessed_by_other:
+            caches.append(cache)
+        elif isinstance(cache, oir.KCache):
+            caches.append(oir.KCache(name=name, fill=True, flush=True, loc=cache.loc))
+    return caches
 
 
 class AdjacentLoopMerging(NodeTranslator):
+    preserved_analyses = ALL_ANALYSES
+
     @staticmethod
     def _mergeable(a: oir.VerticalLoop, b: oir.VerticalLoop) -> bool:
         if a.loop_order != b.loop_order:
@@ -38,13 +81,10 @@ class AdjacentLoopMerging(NodeTranslator):
 
     @staticmethod
     def _merge(a: oir.VerticalLoop, b: oir.VerticalLoop) -> oir.VerticalLoop:
-        sections = a.sections + b.sections
-        if a.caches or b.caches:
-            warnings.warn("AdjacentLoopMerging pass removed previously declared caches")
         return oir.VerticalLoop(
             loop_order=a.loop_order,
-            sections=sections,
-            caches=[],
+            sections=a.sections + b.sections,
+            caches=_merge_caches(a, b),
         )
 
     def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
@@ -66,3 +106,138 @@ class AdjacentLoopMerging(NodeTranslator):
             declarations=node.declarations,
             loc=node.loc,
         )
+
+
+class DependencyAwareLoopMerging(NodeTranslator):
+    """Merges vertical loops that are not adjacent in program order.
+
+    Each loop is moved before all preceding loops it is independent of (i.e. neither loop
+    writes a field accessed by the other one) and merged into the last loop it can be merged
+    with, either by concatenating their sections (see :class:`AdjacentLoopMerging`) or, for
+    loops with the same loop order and section intervals, by executing the horizontal
+    executions of both loops on each level. The latter requires that the accesses of each loop
+    to fields written by the other one are not affected, i.e. that the second loop only reads
+    values of the first one from the current or already computed levels and that the first
+    loop only reads values overwritten by the second one from levels not yet computed (or,
+    without horizontal offset, from the current level).
+
+    Caches of merged loops are merged (see :func:`_merge_caches`).
+    """
+
+    preserved_analyses = (SYMBOL_NAMES,)
+
+    @staticmethod
+    def _dependent(
+        a: AccessCollector.GeneralAccessCollection, b: AccessCollector.GeneralAccessCollection
+    ) -> bool:
+        return bool(a.write_fields() & b.fields() or b.write_fields() & a.fields())
+
+    @staticmethod
+    def _same_intervals(a: oir.VerticalLoop, b: oir.VerticalLoop) -> bool:
+        def bounds(loop: oir.VerticalLoop) -> List[Any]:
+            return [
+                (bound.level, bound.offset)
+                for section in loop.sections
+                for bound in (section.interval.start, section.interval.end)
+            ]
+
+        return bounds(a) == bounds(b)
+
+    @classmethod
+    def _levelwise_mergeable(
+        cls,
+        a: oir.VerticalLoop,
+        b: oir.VerticalLoop,
+        a_accesses: AccessCollector.GeneralAccessCollection,
+        b_accesses: AccessCollector.GeneralAccessCollection,
+    ) -> bool:
+        if a.loop_order != b.loop_order or not cls._same_intervals(a, b):
+            return False
+        direction = {
+            common.LoopOrder.PARALLEL: 0,
+            common.LoopOrder.FORWARD: 1,
+            common.LoopOrder.BACKWARD: -1,
+        }[a.loop_order]
+
+        def computed(offset: GeneralOffsetTuple) -> bool:
+            """Level written by `a` before it is read by `b`."""
+            k = offset[2]
+            return k is not None and (k == 0 or k * direction < 0)
+
+        def not_yet_overwritten(offset: GeneralOffsetTuple) -> bool:
+            """Level read by `a` before it is written by `b`."""
+            k = offset[2]
+            return k is not None and (offset == (0, 0, 0) or k * direction > 0)
+
+        def only(offsets: Set[GeneralOffsetTuple], condition: Any) -> bool:
+            return all(condition(offset) for offset in offsets)
+
+        a_reads, b_reads = a_accesses.read_offsets(), b_accesses.read_offsets()
+        return all(
+            only(b_reads[field], computed) for field in a_accesses.write_fields() & b_reads.keys()
+        ) and all(
+            only(a_reads[field], not_yet_overwritten)
+            for field in b_accesses.write_fields() & a_reads.keys()
+        )
+
+    @staticmethod
+    def _merge_levelwise(a: oir.VerticalLoop, b: oir.VerticalLoop) -> oir.VerticalLoop:
+        return oir.VerticalLoop(
+            loop_order=a.loop_order,
+            sections=[
+                oir.VerticalLoopSection(
+                    interval=a_section.interval,
+                    horizontal_executions=a_section.horizontal_executions
+                    + b_section.horizontal_executions,
+                    loc=a_section.loc,
+                )
+                for a_section, b_section in zip(a.sections, b.sections)
+            ],
+            caches=_merge_caches(a, b),
+            loc=a.loc,
+        )
+
+    @classmethod
+    def _merge(
+        cls,
+        a: oir.VerticalLoop,
+        b: oir.VerticalLoop,
+        a_accesses: AccessCollector.GeneralAccessCollection,
+        b_accesses: AccessCollector.GeneralAccessCollection,
+    ) -> Optional[oir.VerticalLoop]:
+        if AdjacentLoopMerging._mergeable(a, b):
+            return AdjacentLoopMerging._merge(a, b)
+        if cls._levelwise_mergeable(a, b, a_accesses, b_accesses):
+            return cls._merge_levelwise(a, b)
+        return None
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        vertical_loops: List[oir.VerticalLoop] = []
+        accesses: List[AccessCollector.GeneralAccessCollection] = []
+        for vertical_loop in node.vertical_loops:
+            loop_accesses = AccessCollector.apply(vertical_loop)
+            for index in reversed(range(len(vertical_loops))):
+                merged = self._merge(
+                    vertical_loops[index], vertical_loop, accesses[index], loop_accesses
+                )
+                if merged is not None:
+                    vertical_loops[index] = merged
+                    accesses[index] = AccessCollector.GeneralAccessCollection(
+                        accesses[index].ordered_accesses() + loop_accesses.ordered_accesses()
+                    )
+                    break
+                if self._dependent(accesses[index], loop_accesses):
+                    vertical_loops.append(vertical_loop)
+                    accesses.append(loop_accesses)
+                    break
+            else:
+                vertical_loops.append(vertical_loop)
+                accesses.append(loop_accesses)
+
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=vertical_loops,
+            declarations=node.declarations,
+            loc=node.loc,
+        )
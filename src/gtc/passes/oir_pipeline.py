@@ -15,9 +15,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from abc import abstractmethod
-from typing import Callable, Optional, Protocol, Sequence, Type, Union
+from typing import Any, Dict, Optional, Protocol, Sequence
 
-from eve.visitors import NodeVisitor
 from gtc import oir
 from gtc.passes.oir_optimizations.caches import (
     IJCacheDetection,
@@ -25,21 +24,35 @@ from gtc.passes.oir_optimizations.caches import (
     PruneKCacheFills,
     PruneKCacheFlushes,
 )
+from gtc.passes.oir_optimizations.constant_folding import ConstantFolding
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
 from gtc.passes.oir_optimizations.horizontal_execution_merging import (
     HorizontalExecutionMerging,
+    MergeCostModel,
     OnTheFlyMerging,
 )
 from gtc.passes.oir_optimizations.inlining import MaskInlining
 from gtc.passes.oir_optimizations.mask_stmt_merging import MaskStmtMerging
-from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning, UnreachableStmtPruning
+from gtc.passes.oir_optimizations.pruning import (
+    DeadCodeElimination,
+    NoFieldAccessPruning,
+    UnreachableStmtPruning,
+)
+from gtc.passes.oir_optimizations.strength_reduction import (
+    FastMathStrengthReduction,
+    StrengthReduction,
+)
 from gtc.passes.oir_optimizations.temporaries import (
     LocalTemporariesToScalars,
+    TemporaryBufferSharing,
+    TemporaryDimensionReduction,
     WriteBeforeReadTemporariesToScalars,
 )
-from gtc.passes.oir_optimizations.vertical_loop_merging import AdjacentLoopMerging
-
-
-PassT = Union[Callable[[oir.Stencil], oir.Stencil], Type[NodeVisitor]]
+from gtc.passes.oir_optimizations.vertical_loop_merging import (
+    AdjacentLoopMerging,
+    DependencyAwareLoopMerging,
+)
+from gtc.passes.pass_manager import PassManager, PassT
 
 
 class OirPipeline(Protocol):
@@ -52,7 +65,7 @@ class OirPipeline(Protocol):
         raise NotImplementedError("Missing implementation of __repr__")
 
     @abstractmethod
-    def run(self, oir: oir.Stencil) -> oir.Stencil:
+    def run(self, oir: oir.Stencil, *, build_info: Optional[Dict[str, Any]] = None) -> oir.Stencil:
         raise NotImplementedError("Missing implementation of run")
 
 
@@ -61,15 +74,32 @@ class DefaultPipeline(OirPipeline):
     OIR passes pipeline runs passes in order and allows skipping.
 
     May only call existing passes and may not contain any pass logic itself.
+    Passes are run by a :class:`gtc.passes.pass_manager.PassManager`, which
+    shares analysis results between passes and records per-pass statistics
+    in `build_info` (if provided). With `fast_math`, strength reduction also
+    applies transformations which may change the results in the last bits.
+    On-the-fly merging uses `merge_cost_model` if given.
     """
 
-    def __init__(self, *, skip: Optional[Sequence[PassT]] = None):
+    def __init__(
+        self,
+        *,
+        skip: Optional[Sequence[PassT]] = None,
+        fast_math: bool = False,
+        merge_cost_model: Optional[MergeCostModel] = None,
+    ):
         self.skip = skip or []
+        self.fast_math = fast_math
+        self.merge_cost_model = merge_cost_model
 
     @staticmethod
     def all_steps() -> Sequence[PassT]:
         return [
+            ConstantFolding,
+            StrengthReduction,
+            KInvariantHoisting,
             AdjacentLoopMerging,
+            DependencyAwareLoopMerging,
             HorizontalExecutionMerging,
             OnTheFlyMerging,
             LocalTemporariesToScalars,
@@ -77,30 +107,41 @@ class DefaultPipeline(OirPipeline):
             MaskStmtMerging,
             MaskInlining,
             UnreachableStmtPruning,
+            DeadCodeElimination,
             NoFieldAccessPruning,
             IJCacheDetection,
             KCacheDetection,
             PruneKCacheFills,
             PruneKCacheFlushes,
+            TemporaryDimensionReduction,
+            TemporaryBufferSharing,
         ]
 
     @property
     def steps(self) -> Sequence[PassT]:
-        return [step for step in self.all_steps() if step not in self.skip]
+        steps = [step for step in self.all_steps() if step not in self.skip]
+        if self.fast_math:
+            steps = [FastMathStrengthReduction if s is StrengthReduction else s for s in steps]
+        if self.merge_cost_model is not None:
+            steps = [
+                OnTheFlyMerging(cost_model=self.merge_cost_model) if s is OnTheFlyMerging else s
+                for s in steps
+            ]
+        return steps
 
     def __hash__(self) -> int:
         return hash(repr(self))
 
     def __repr__(self) -> str:
-        return str([step.__name__ for step in self.steps])
+        return str([getattr(step, "__name__", repr(step)) for step in self.steps])
 
     def __eq__(self, other):
-        return isinstance(other, DefaultPipeline) and self.skip == other.skip
-
-    def run(self, oir: oir.Stencil) -> oir.Stencil:
-        for step in self.steps:
-            if isinstance(step, type) and issubclass(step, NodeVisitor):
-                oir = step().visit(oir)
-            else:
-                oir = step(oir)
-        return oir
+        return (
+            isinstance(other, DefaultPipeline)
+            and self.skip == other.skip
+            and self.fast_math == other.fast_math
+            and self.merge_cost_model == other.merge_cost_model
+        )
+
+    def run(self, oir: oir.Stencil, *, build_info: Optional[Dict[str, Any]] = None) -> oir.Stencil:
+        return PassManager(self.steps).run(oir, build_info=build_info)
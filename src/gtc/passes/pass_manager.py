@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Pass manager for OIR pipelines with analysis caching and invalidation.
+
+Passes declare the stencil-level analyses they use in a ``required_analyses``
+class attribute and the analyses whose results are still valid after the
+pass has run in a ``preserved_analyses`` class attribute (both default to
+empty). Analyses are memoized functions (see :mod:`eve.memoization`), so
+passes simply call them as usual and get cached results. The analysis cache
+is scoped to one run of the pipeline and dropped afterwards. After each pass,
+results of preserved analyses are rebound to the transformed stencil and
+all the other results are dropped.
+
+Pass classes are instantiated without arguments, configured passes can be
+given as instances instead.
+"""
+
+import collections
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type, Union
+
+import eve
+from eve.memoization import analysis_scope
+from eve.visitors import NodeVisitor
+from gtc import oir
+from gtc.passes.oir_access_kinds import compute_access_kinds
+from gtc.passes.oir_optimizations.utils import collect_symbol_names, compute_ordered_extents
+
+
+PassT = Union[Callable[[oir.Stencil], oir.Stencil], Type[NodeVisitor], NodeVisitor]
+
+
+@dataclass(frozen=True)
+class OirAnalysis:
+    """Stencil-level analysis managed by the pass manager.
+
+    `compute` must be a memoized analysis function, i.e. decorated with
+    :func:`eve.memoization.memoized_analysis`.
+    """
+
+    name: str
+    compute: Callable[[oir.Stencil], Any]
+
+    def __call__(self, stencil: oir.Stencil) -> Any:
+        return self.compute(stencil)
+
+    def seed(self, result: Any, stencil: oir.Stencil) -> None:
+        self.compute.seed(result, stencil)  # type: ignore[attr-defined]
+
+
+EXTENTS = OirAnalysis("extents", compute_ordered_extents)
+ACCESS_KINDS = OirAnalysis("access_kinds", compute_access_kinds)
+SYMBOL_NAMES = OirAnalysis("symbol_names", collect_symbol_names)
+
+ALL_ANALYSES = (EXTENTS, ACCESS_KINDS, SYMBOL_NAMES)
+
+
+class AnalysisManager:
+    """Cache of the analysis results of the current stencil in a pipeline."""
+
+    def __init__(self) -> None:
+        self._results: Dict[OirAnalysis, Any] = {}
+        self.computed: collections.Counter = collections.Counter()
+        self.reused: collections.Counter = collections.Counter()
+
+    def get(self, analysis: OirAnalysis, stencil: oir.Stencil) -> Any:
+        if analysis in self._results:
+            self.reused[analysis.name] += 1
+        else:
+            self._results[analysis] = analysis(stencil)
+            self.computed[analysis.name] += 1
+        return self._results[analysis]
+
+    def invalidate(self, stencil: oir.Stencil, preserved: Iterable[OirAnalysis] = ()) -> None:
+        """Drop all results except the `preserved` ones, which are rebound to `stencil`."""
+        preserved = set(preserved)
+        self._results = {
+            analysis: result for analysis, result in self._results.items() if analysis in preserved
+        }
+        for analysis, result in self._results.items():
+            analysis.seed(result, stencil)
+
+
+def _count_nodes(stencil: oir.Stencil) -> int:
+    return sum(1 for _ in stencil.iter_tree().if_isinstance(eve.Node))
+
+
+def _pass_name(step: PassT) -> str:
+    return getattr(step, "__name__", type(step).__name__)
+
+
+class PassManager:
+    """Run a sequence of OIR passes sharing analysis results between them.
+
+    If a `build_info` dictionary is passed to :meth:`run`, per-pass statistics
+    (run and analysis times, node counts before and after each pass) and
+    analysis cache statistics are stored under its ``"oir_pipeline"`` key.
+    """
+
+    def __init__(self, passes: Sequence[PassT]):
+        self.passes = list(passes)
+
+    def run(
+        self, stencil: oir.Stencil, *, build_info: Optional[Dict[str, Any]] = None
+    ) -> oir.Stencil:
+        with analysis_scope():
+            return self._run(stencil, build_info=build_info)
+
+    def _run(self, stencil: oir.Stencil, *, build_info: Optional[Dict[str, Any]]) -> oir.Stencil:
+        analyses = AnalysisManager()
+        statistics: List[Dict[str, Any]] = []
+        # Each tree is counted once, as the result of a pass is the input of the next one
+        node_count = _count_nodes(stencil) if build_info is not None else 0
+
+        for step in self.passes:
+            start_time = time.perf_counter()
+            for analysis in getattr(step, "required_analyses", ()):
+                analyses.get(analysis, stencil)
+            analysis_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            if isinstance(step, type) and issubclass(step, NodeVisitor):
+                result = step().visit(stencil)
+            elif isinstance(step, NodeVisitor):
+                result = step.visit(stencil)
+            else:
+                result = step(stencil)
+            run_time = time.perf_counter() - start_time
+
+            if build_info is not None:
+                nodes_before, node_count = node_count, _count_nodes(result)
+                statistics.append(
+                    {
+                        "name": _pass_name(step),
+                        "run_time": run_time,
+                        "analysis_time": analysis_time,
+                        "nodes_before": nodes_before,
+                        "nodes_after": node_count,
+                    }
+                )
+
+            if result is not stencil:
+                analyses.invalidate(result, getattr(step, "preserved_analyses", ()))
+            stencil = result
+
+        if build_info is not None:
+            build_info["oir_pipeline"] = {
+                "passes": statistics,
+                "analyses": {"computed": dict(analyses.computed), "reused": dict(analyses.reused)},
+            }
+
+        return stencil
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark of the read and write throughput of storage checkpoints.
+
+A model state of several smooth fields is written and read back with a loop
+of ``np.save``/``np.load`` calls and with checkpoint files using different
+compressions and numbers of threads. Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_checkpoint [--fields N] [--shape I J K] [--dir DIR]
+
+"""
+
+import argparse
+import pathlib
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+from gt4py import config as gt_config
+
+
+BACKEND = "gtc:numpy"
+DEFAULT_ORIGIN = (3, 3, 0)
+
+
+def make_state(num_fields: int, shape: Tuple[int, ...]) -> Dict[str, gt_storage.Storage]:
+    rng = np.random.default_rng(0)
+    i, j, k = np.meshgrid(*(np.linspace(0.0, 1.0, size) for size in shape), indexing="ij")
+    state = {}
+    for n in range(num_fields):
+        data = np.sin(2 * np.pi * (n + 1) * i) * np.cos(np.pi * j) + k
+        data += 1e-3 * rng.standard_normal(shape)
+        state[f"field_{n}"] = gt_storage.from_array(data, BACKEND, DEFAULT_ORIGIN)
+    return state
+
+
+def np_save(path: pathlib.Path, state: Dict[str, gt_storage.Storage]) -> None:
+    path.mkdir(exist_ok=True)
+    for name, storage in state.items():
+        np.save(path / f"{name}.npy", storage.data)
+
+
+def np_load(path: pathlib.Path, names: List[str]) -> Dict[str, gt_storage.Storage]:
+    return {
+        name: gt_storage.from_array(np.load(path / f"{name}.npy"), BACKEND, DEFAULT_ORIGIN)
+        for name in names
+    }
+
+
+def checkpoint_methods(
+    num_threads: int,
+) -> Dict[str, Tuple[Callable[..., None], Callable[..., Dict[str, gt_storage.Storage]]]]:
+    def checkpoint(compression: Optional[str], threads: int):
+        def save(path, state):
+            gt_storage.save_checkpoint(path, state, compression=compression, num_threads=threads)
+
+        def load(path, names):
+            return gt_storage.load_checkpoint(path, num_threads=threads)
+
+        return save, load
+
+    methods = {"np.save": (np_save, np_load)}
+    for compression in (None, "zlib"):
+        for threads in sorted({1, num_threads}):
+            methods[f"{compression or 'raw'} ({threads} threads)"] = checkpoint(
+                compression, threads
+            )
+    return methods
+
+
+def file_size(path: pathlib.Path) -> int:
+    if path.is_dir():
+        return sum(item.stat().st_size for item in path.iterdir())
+    return path.stat().st_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--fields", type=int, default=16, help="number of fields in the state")
+    parser.add_argument(
+        "--shape", type=int, nargs=3, default=(128, 128, 64), help="shape of the fields"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs")
+    parser.add_argument("--dir", default=None, help="directory of the checkpoint files")
+    args = parser.parse_args()
+
+    state = make_state(args.fields, tuple(args.shape))
+    names = list(state)
+    total_bytes = sum(storage.nbytes for storage in state.values())
+    num_threads = gt_config.storage_settings["num_threads"]
+    print(f"state: {args.fields} fields, {total_bytes / 1024**2:.1f} MiB")
+    print(f"{'method':<24}{'write':>12}{'read':>12}{'ratio':>8}")
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for method_name, (save, load) in checkpoint_methods(num_threads).items():
+            path = pathlib.Path(directory) / method_name.replace(" ", "_")
+            write_times, read_times = [], []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                save(path, state)
+                write_times.append(time.perf_counter() - start_time)
+
+                start_time = time.perf_counter()
+                loaded = load(path, names)
+                read_times.append(time.perf_counter() - start_time)
+            assert all((loaded[name] == state[name]).all() for name in names)
+
+            write = total_bytes / statistics.median(write_times) / 1024 ** 2
+            read = total_bytes / statistics.median(read_times) / 1024 ** 2
+            ratio = total_bytes / file_size(path)
+            print(f"{method_name:<24}{write:>8.0f}MB/s{read:>8.0f}MB/s{ratio:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
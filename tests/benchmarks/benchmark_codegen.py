@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark of the code generators of the gtc backends.
+
+The stencils registered in the integration tests are lowered to optimized OIR
+once, and then the time spent in each backend code generator (lowering from
+OIR and source code generation, without formatting) is measured. Run from
+the repository root with::
+
+    python -m tests.benchmarks.benchmark_codegen [--repeat N] [--replicate N] [STENCIL ...]
+
+"""
+
+import argparse
+import copy
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import gt4py  # noqa: F401  # required before importing gtc passes
+from gt4py.stencil_builder import StencilBuilder
+from gtc import gtir_to_oir, oir
+from gtc.cuir import cuir_codegen, extent_analysis, kernel_fusion, oir_to_cuir
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+from gtc.numpy import npir_codegen, oir_to_npir
+from gtc.passes.oir_optimizations.caches import FillFlushToLocalKCaches
+from gtc.passes.oir_pipeline import DefaultPipeline
+
+from ..test_integration.stencil_definitions import EXTERNALS_REGISTRY, REGISTRY
+
+
+def make_oir(name: str, replicate: int = 1) -> oir.Stencil:
+    builder = StencilBuilder(REGISTRY[name], backend="gtc:numpy").with_externals(
+        EXTERNALS_REGISTRY[name]
+    )
+    stencil = DefaultPipeline().run(gtir_to_oir.GTIRToOIR().visit(builder.gtir))
+    if replicate > 1:
+        stencil = oir.Stencil(
+            name=stencil.name,
+            params=stencil.params,
+            vertical_loops=[
+                copy.deepcopy(loop) for _ in range(replicate) for loop in stencil.vertical_loops
+            ],
+            declarations=stencil.declarations,
+        )
+    return stencil
+
+
+def npir_generator(stencil: oir.Stencil) -> str:
+    return npir_codegen.NpirCodegen.apply(oir_to_npir.OirToNpir().visit(stencil))
+
+
+def gtcpp_generator(stencil: oir.Stencil) -> str:
+    return gtcpp_codegen.GTCppCodegen.apply(
+        oir_to_gtcpp.OIRToGTCpp().visit(stencil), gt_backend_t="cpu_ifirst", format_source=False
+    )
+
+
+def cuir_generator(stencil: oir.Stencil) -> str:
+    program = oir_to_cuir.OIRToCUIR().visit(FillFlushToLocalKCaches().visit(stencil))
+    program = extent_analysis.CacheExtents().visit(kernel_fusion.FuseKernels().visit(program))
+    return cuir_codegen.CUIRCodegen.apply(program, format_source=False)
+
+
+GENERATORS: Dict[str, Callable[[oir.Stencil], str]] = {
+    "npir": npir_generator,
+    "gtcpp": gtcpp_generator,
+    "cuir": cuir_generator,
+}
+
+
+def benchmark(
+    stencil: oir.Stencil, generator: Callable[[oir.Stencil], str], repeat: int
+) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        generator(stencil)
+        timings.append(time.perf_counter() - start_time)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("stencils", nargs="*", default=list(REGISTRY.names))
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    parser.add_argument(
+        "--replicate", type=int, default=1, help="replicate the vertical loops to grow stencils"
+    )
+    args = parser.parse_args()
+
+    print(f"{'stencil':<32}" + "".join(f"{name:>12}" for name in GENERATORS))
+    totals = {name: 0.0 for name in GENERATORS}
+    for stencil_name in args.stencils:
+        stencil = make_oir(stencil_name, args.replicate)
+        row = f"{stencil_name:<32}"
+        for name, generator in GENERATORS.items():
+            timing = statistics.median(benchmark(stencil, generator, args.repeat))
+            totals[name] += timing
+            row += f"{timing * 1e3:>10.2f}ms"
+        print(row)
+    print(f"{'total':<32}" + "".join(f"{totals[name] * 1e3:>10.2f}ms" for name in GENERATORS))
+
+
+if __name__ == "__main__":
+    main()
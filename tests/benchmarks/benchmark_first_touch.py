@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark of the stencil memory bandwidth with each storage first touch policy.
+
+Storages are allocated with each policy and a copy stencil is run on them.
+The bandwidth of the first run (which also places the pages of lazily
+allocated storages) and of the following runs is reported. On NUMA systems,
+use a multithreaded backend and set ``OMP_NUM_THREADS`` to the number of
+cores. Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_first_touch [--backend NAME] [--size NI NJ NK]
+
+"""
+
+import argparse
+import statistics
+import time
+from typing import Tuple
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+from gt4py import gtscript
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.storage import utils as storage_utils
+
+
+def copy_stencil_definition(in_field: Field[np.float64], out_field: Field[np.float64]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_field = in_field  # type: ignore  # noqa
+
+
+def benchmark(
+    backend: str, size: Tuple[int, int, int], first_touch: str, repeat: int
+) -> Tuple[float, float]:
+    copy_stencil = gtscript.stencil(backend=backend, definition=copy_stencil_definition)
+    in_field = gt_storage.ones(backend, (0, 0, 0), size, np.float64, first_touch=first_touch)
+    out_field = gt_storage.empty(backend, (0, 0, 0), size, np.float64, first_touch=first_touch)
+    nbytes = 2 * in_field.nbytes
+
+    timings = []
+    for _ in range(repeat + 1):
+        start_time = time.perf_counter()
+        copy_stencil(in_field, out_field)
+        timings.append(time.perf_counter() - start_time)
+    return nbytes / timings[0], nbytes / statistics.median(timings[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--backend", default="gtc:gt:cpu_kfirst")
+    parser.add_argument("--size", type=int, nargs=3, default=(256, 256, 80))
+    parser.add_argument("--repeat", type=int, default=10, help="number of timed runs")
+    args = parser.parse_args()
+
+    print(f"{'first touch':<16}{'first run':>14}{'next runs':>14}")
+    for first_touch in storage_utils.FIRST_TOUCH_POLICIES:
+        first, steady = benchmark(args.backend, tuple(args.size), first_touch, args.repeat)
+        print(f"{str(first_touch):<16}{first / 1e9:>10.2f}GB/s{steady / 1e9:>10.2f}GB/s")
+
+
+if __name__ == "__main__":
+    main()
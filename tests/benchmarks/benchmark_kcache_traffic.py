@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Count of the global memory accesses of vertical sweeps with k-caches.
+
+The stencils are lowered to OIR as for the ``gtc:cuda`` backend, without
+k-caches, with k-caches of fields accessed without horizontal offsets only and
+with k-caches of read-only fields with horizontal offsets. For each variant,
+the number of loads and stores of fields which are not cached is counted per
+column of a domain with the given number of levels (repeated accesses within a
+horizontal execution are counted once). Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_kcache_traffic [--levels N] [STENCIL ...]
+
+"""
+
+import argparse
+from typing import Callable, Dict
+
+import gt4py  # noqa: F401  # required before importing gtc passes
+from gt4py import gtscript
+from gt4py.gtscript import FORWARD, PARALLEL, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+from gtc import common, gtir_to_oir, oir
+from gtc.passes.oir_optimizations.caches import (
+    FillFlushToLocalKCaches,
+    KCacheDetection,
+    PruneKCacheFills,
+    PruneKCacheFlushes,
+)
+from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning
+from gtc.passes.oir_optimizations.utils import AccessCollector
+from gtc.passes.oir_pipeline import DefaultPipeline
+
+from ..test_integration.stencil_definitions import EXTERNALS_REGISTRY, REGISTRY
+
+
+Field3D = gtscript.Field[float]
+
+
+def sweep_with_halo(a: Field3D, b: Field3D, c: Field3D, d: Field3D):
+    # `s` is computed on a larger extent than `c`, so the sections of the
+    # forward loop have two horizontal executions
+    with computation(FORWARD):
+        with interval(0, 1):
+            s = a
+            c = b[1, 0, 0]
+        with interval(1, -1):
+            s = s[0, 0, -1] + a
+            c = c[0, 0, -1] + b[1, 0, 0] * b[1, 0, -1] + b[1, 0, 1]
+        with interval(-1, None):
+            s = s[0, 0, -1] + a
+            c = c[0, 0, -1] + b[1, 0, 0] * b[1, 0, -1]
+    with computation(PARALLEL), interval(...):
+        d = s[-1, 0, 0] + s[1, 0, 0]
+
+
+STENCILS: Dict[str, Callable] = {
+    "vertical_advection_dycore": REGISTRY["vertical_advection_dycore"],
+    "tridiagonal_solver": REGISTRY["tridiagonal_solver"],
+    "sweep_with_halo": sweep_with_halo,
+}
+
+K_CACHE_PASSES = [KCacheDetection, PruneKCacheFills, PruneKCacheFlushes]
+
+
+def no_k_caches(stencil: oir.Stencil) -> oir.Stencil:
+    return DefaultPipeline(skip=[NoFieldAccessPruning] + K_CACHE_PASSES).run(stencil)
+
+
+def k_caches(stencil: oir.Stencil) -> oir.Stencil:
+    stencil = DefaultPipeline(skip=[NoFieldAccessPruning]).run(stencil)
+    return FillFlushToLocalKCaches().visit(stencil)
+
+
+def ij_extended_k_caches(stencil: oir.Stencil) -> oir.Stencil:
+    stencil = DefaultPipeline(skip=[NoFieldAccessPruning]).run(stencil)
+    stencil = KCacheDetection(allow_ij_offsets=True).visit(stencil)
+    return FillFlushToLocalKCaches().visit(stencil)
+
+
+VARIANTS: Dict[str, Callable[[oir.Stencil], oir.Stencil]] = {
+    "no k-caches": no_k_caches,
+    "k-caches": k_caches,
+    "ij k-caches": ij_extended_k_caches,
+}
+
+
+def make_oir(name: str) -> oir.Stencil:
+    builder = StencilBuilder(STENCILS[name], backend="gtc:numpy").with_externals(
+        EXTERNALS_REGISTRY.get(name, {})
+    )
+    return gtir_to_oir.GTIRToOIR().visit(builder.gtir)
+
+
+def count_levels(interval: oir.Interval, levels: int) -> int:
+    def index(bound: common.AxisBound) -> int:
+        return bound.offset + (levels if bound.level == common.LevelMarker.END else 0)
+
+    return index(interval.end) - index(interval.start)
+
+
+def memory_accesses(stencil: oir.Stencil, levels: int) -> int:
+    """Number of loads and stores of non-cached fields per column."""
+    total = 0
+    for vertical_loop in stencil.vertical_loops:
+        cached = {cache.name for cache in vertical_loop.caches}
+        for section in vertical_loop.sections:
+            section_levels = count_levels(section.interval, levels)
+            for horizontal_execution in section.horizontal_executions:
+                accesses = {
+                    (access.field, access.offset, access.is_write)
+                    for access in AccessCollector.apply(horizontal_execution).ordered_accesses()
+                    if access.field not in cached
+                }
+                total += section_levels * len(accesses)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--levels", type=int, default=80, help="number of vertical levels")
+    parser.add_argument("stencils", nargs="*", default=list(STENCILS), help="stencil names")
+    args = parser.parse_args()
+
+    print(f"{'stencil':<28}" + "".join(f"{variant:>14}" for variant in VARIANTS))
+    for name in args.stencils:
+        stencil = make_oir(name)
+        row = f"{name:<28}"
+        for variant in VARIANTS.values():
+            row += f"{memory_accesses(variant(stencil), args.levels):>14}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
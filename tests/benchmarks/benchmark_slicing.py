@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Micro-benchmark of the creation of storage views.
+
+Times common slicing patterns of user code (e.g. per-level diagnostics) on
+storages and on plain NumPy arrays with the same data. Run from the
+repository root with::
+
+    python -m tests.benchmarks.benchmark_slicing [--backend NAME] [--number N]
+
+"""
+
+import argparse
+import timeit
+from typing import Dict
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+
+
+SHAPE = (64, 64, 80)
+
+STATEMENTS: Dict[str, str] = {
+    "level": "field[:, :, 5]",
+    "column": "field[10, 10, :]",
+    "compute domain": "field[3:-3, 3:-3, :]",
+    "ellipsis": "field[...]",
+    "view": "field.view()",
+    "per-level loop": "for k in range(field.shape[2]): field[:, :, k]",
+    "stencil view check": "field[:, :, :].is_stencil_view",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--backend", default="gtc:numpy", help="backend of the storage")
+    parser.add_argument("--number", type=int, default=10000, help="executions per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timings")
+    args = parser.parse_args()
+
+    storage = gt_storage.ones(args.backend, (3, 3, 0), SHAPE, np.float64)
+    arrays = {"storage": storage, "ndarray": storage.data}
+    print(f"{'statement':<24}{'storage':>12}{'ndarray':>12}")
+    for name, statement in STATEMENTS.items():
+        row = f"{name:<24}"
+        for kind, field in arrays.items():
+            if kind == "ndarray" and "is_stencil_view" in statement:
+                row += f"{'-':>12}"
+                continue
+            timer = timeit.Timer(statement, globals={"field": field})
+            timing = min(timer.repeat(repeat=args.repeat, number=args.number)) / args.number
+            row += f"{timing * 1e6:>10.2f}us"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
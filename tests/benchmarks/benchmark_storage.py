@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark of allocation-heavy loops of CPU storages.
+
+Each loop iteration creates a few scratch storages (as model code creating
+temporary storages in every time step), with and without the CPU memory pool.
+Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_storage [--repeat N] [--iterations N]
+
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+from gt4py.storage import utils as storage_utils
+
+
+BACKEND = "gtc:numpy"
+SHAPES: Dict[str, Tuple[int, ...]] = {
+    "small": (16, 16, 16),
+    "medium": (64, 64, 64),
+    "large": (192, 192, 80),
+}
+
+
+def empty_loop(shape: Tuple[int, ...], iterations: int) -> None:
+    for _ in range(iterations):
+        gt_storage.empty(BACKEND, (3, 3, 0), shape, np.float64)
+
+
+def zeros_loop(shape: Tuple[int, ...], iterations: int) -> None:
+    for _ in range(iterations):
+        gt_storage.zeros(BACKEND, (3, 3, 0), shape, np.float64)
+
+
+def time_step_loop(shape: Tuple[int, ...], iterations: int) -> None:
+    data = gt_storage.ones(BACKEND, (3, 3, 0), shape, np.float64)
+    for _ in range(iterations):
+        scratch = [gt_storage.empty(BACKEND, (3, 3, 0), shape, np.float64) for _ in range(4)]
+        for field in scratch:
+            field[...] = data
+
+
+LOOPS: Dict[str, Callable[[Tuple[int, ...], int], None]] = {
+    "empty": empty_loop,
+    "zeros": zeros_loop,
+    "time_step": time_step_loop,
+}
+
+
+def benchmark(
+    loop: Callable[[Tuple[int, ...], int], None],
+    shape: Tuple[int, ...],
+    iterations: int,
+    repeat: int,
+) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        loop(shape, iterations)
+        timings.append((time.perf_counter() - start_time) / iterations)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    parser.add_argument("--iterations", type=int, default=100, help="loop iterations per run")
+    args = parser.parse_args()
+
+    pool = storage_utils.cpu_memory_pool
+    max_bytes = pool.max_bytes or 512 * 1024 ** 2
+    print(f"{'loop':<24}{'no pool':>12}{'pool':>12}")
+    for shape_name, shape in SHAPES.items():
+        for loop_name, loop in LOOPS.items():
+            row = f"{loop_name + ' (' + shape_name + ')':<24}"
+            for pool_size in (0, max_bytes):
+                pool.max_bytes = pool_size
+                pool.clear()
+                timing = statistics.median(benchmark(loop, shape, args.iterations, args.repeat))
+                row += f"{timing * 1e6:>10.1f}us"
+            print(row)
+    pool.max_bytes = max_bytes
+    print(pool.info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Memory of the temporaries allocated by stencils with and without reductions.
+
+The stencils are lowered to OIR and optimized by the default pipeline, without
+:class:`TemporaryDimensionReduction` and :class:`TemporaryBufferSharing`, with
+the former only and with both. For each variant, the number of temporary
+buffers and the memory they need on a domain of the given shape (including the
+halos of their extents) are reported. Run from the repository root with::
+
+    python -m tests.benchmarks.benchmark_temporary_memory [--domain I J K] [STENCIL ...]
+
+"""
+
+import argparse
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+import gt4py  # noqa: F401  # required before importing gtc passes
+from gt4py import gtscript
+from gt4py.gtscript import BACKWARD, FORWARD, PARALLEL, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+from gtc import common, gtir_to_oir, oir
+from gtc.passes.oir_optimizations.temporaries import (
+    TemporaryBufferSharing,
+    TemporaryDimensionReduction,
+)
+from gtc.passes.oir_optimizations.utils import compute_fields_extents
+from gtc.passes.oir_pipeline import DefaultPipeline
+
+from ..test_integration.stencil_definitions import EXTERNALS_REGISTRY, REGISTRY
+
+
+Field3D = gtscript.Field[float]
+FieldK = gtscript.Field[gtscript.K, float]
+
+
+def column_physics(
+    t: Field3D, q: Field3D, u: Field3D, v: Field3D, tend_t: Field3D, tend_q: Field3D
+):
+    # sequence of processes, each with its own temporaries which are dead afterwards
+    with computation(PARALLEL), interval(...):
+        shear = (u[1, 0, 0] - u[-1, 0, 0]) ** 2 + (v[0, 1, 0] - v[0, -1, 0]) ** 2
+    with computation(FORWARD):
+        with interval(0, 1):
+            heat = t * q
+        with interval(1, None):
+            heat = heat[0, 0, -1] + t * q
+    with computation(PARALLEL), interval(...):
+        tend_t = 0.5 * (shear[1, 0, 0] + shear[-1, 0, 0]) * heat
+    with computation(BACKWARD):
+        with interval(-1, None):
+            flux = q
+        with interval(0, -1):
+            flux = flux[0, 0, 1] + q - tend_t
+    with computation(PARALLEL), interval(...):
+        gradient = flux[1, 0, 0] - flux[-1, 0, 0]
+    with computation(FORWARD):
+        with interval(0, 1):
+            moisture = gradient
+        with interval(1, None):
+            moisture = moisture[0, 0, -1] + gradient
+    with computation(PARALLEL), interval(...):
+        tend_q = moisture[1, 0, 0] - moisture[-1, 0, 0]
+
+
+def vertical_coordinate(
+    t: Field3D, ak: FieldK, bk: FieldK, p_surface: Field3D, theta: Field3D, flux: Field3D
+):
+    # coefficients of the vertical coordinate only vary along the columns, the pressure is
+    # only needed at the current level of the sweep
+    with computation(PARALLEL), interval(...):
+        thickness = ak[1] - ak + (bk[1] - bk) * 1e5
+    with computation(FORWARD):
+        with interval(0, 1):
+            pressure = ak + bk * p_surface
+            theta = t * (1e5 / pressure) ** 0.286
+            flux = thickness * pressure
+        with interval(1, None):
+            pressure = ak + bk * p_surface + flux[0, 0, -1]
+            theta = t * (1e5 / pressure) ** 0.286
+            flux = thickness * pressure
+    with computation(PARALLEL), interval(...):
+        flux = (theta[1, 0, 0] - theta[-1, 0, 0]) * thickness
+
+
+STENCILS: Dict[str, Callable] = {
+    **{name: REGISTRY[name] for name in REGISTRY.names},
+    "column_physics": column_physics,
+    "vertical_coordinate": vertical_coordinate,
+}
+
+VARIANTS: Dict[str, Callable[[oir.Stencil], oir.Stencil]] = {
+    "3D": DefaultPipeline(skip=[TemporaryDimensionReduction, TemporaryBufferSharing]).run,
+    "reduced": DefaultPipeline(skip=[TemporaryBufferSharing]).run,
+    "shared": DefaultPipeline().run,
+}
+
+
+def make_oir(name: str) -> oir.Stencil:
+    builder = StencilBuilder(STENCILS[name], backend="gtc:numpy").with_externals(
+        EXTERNALS_REGISTRY.get(name, {})
+    )
+    return gtir_to_oir.GTIRToOIR().visit(builder.gtir)
+
+
+def temporary_memory(stencil: oir.Stencil, domain: Tuple[int, int, int]) -> Tuple[int, int]:
+    """Number of temporary buffers and their total size in bytes."""
+    extents = compute_fields_extents(stencil)
+    total = 0
+    for decl in stencil.declarations:
+        boundary = extents[decl.name].to_boundary()
+        shape = [size + sum(boundary[axis]) for axis, size in enumerate(domain[:2])] + [domain[2]]
+        shape = [size for size, has_dim in zip(shape, decl.dimensions) if has_dim]
+        itemsize = np.dtype(common.data_type_to_typestr(decl.dtype)).itemsize
+        total += int(np.prod(shape + list(decl.data_dims))) * itemsize
+    return len(stencil.declarations), total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--domain", type=int, nargs=3, default=(128, 128, 80), help="shape of the domain"
+    )
+    parser.add_argument("stencils", nargs="*", default=list(STENCILS), help="stencil names")
+    args = parser.parse_args()
+
+    print(f"{'stencil':<32}" + "".join(f"{variant:>20}" for variant in VARIANTS))
+    totals = {variant: 0 for variant in VARIANTS}
+    for name in args.stencils:
+        stencil = make_oir(name)
+        row = f"{name:<32}"
+        for variant, pipeline in VARIANTS.items():
+            count, nbytes = temporary_memory(pipeline(stencil), tuple(args.domain))
+            totals[variant] += nbytes
+            row += f"{count:>6} {nbytes / 1024**2:>10.2f} MiB"
+        print(row)
+    print(f"{'total':<32}" + "".join(f"{totals[v] / 1024**2:>17.2f} MiB" for v in VARIANTS))
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,50 @@ def test_name(name_with_cases):  # noqa: F811  # pytest fixture not detected
                 assert other_name.as_case(case) == cased_string
 
 
+# -- Formatting tests --
+@pytest.fixture
+def formatting_cache_dir(tmp_path):
+    eve.codegen.clear_formatting_cache()
+    with eve.codegen.formatting_settings(production=False, cache_dir=str(tmp_path)):
+        yield tmp_path
+    eve.codegen.clear_formatting_cache()
+
+
+def test_format_source_cached(formatting_cache_dir, monkeypatch):
+    source = "def f( a ):\n  return a"
+    formatted = eve.codegen.format_source("python", source)
+    assert formatted == "def f(a):\n    return a\n"
+    assert len(list(formatting_cache_dir.glob("*/*"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Formatter should not be called")
+
+    # Served from the persistent cache after dropping the in-memory one
+    eve.codegen.clear_formatting_cache()
+    monkeypatch.setitem(eve.codegen.SOURCE_FORMATTERS, "python", fail)
+    assert eve.codegen.format_source("python", source, skip_errors=False) == formatted
+
+    # Different options are different cache entries
+    with pytest.raises(eve.codegen.FormattingError):
+        eve.codegen.format_source("python", source, skip_errors=False, line_length=20)
+
+
+def test_format_sources(formatting_cache_dir):
+    sources = ["x = ( 1 )", "y = [ 2 ]", "x = ( 1 )"]
+    assert eve.codegen.format_sources("python", sources) == ["x = 1\n", "y = [2]\n", "x = 1\n"]
+
+
+def test_format_source_production(formatting_cache_dir):
+    source = "x = ( 1 )"
+    with eve.codegen.formatting_settings(production=True):
+        assert eve.codegen.format_source("python", source, skip_errors=False) == source
+    assert not list(formatting_cache_dir.glob("*/*"))
+
+    with pytest.raises(TypeError, match="Unknown formatting settings"):
+        with eve.codegen.formatting_settings(foo=True):
+            pass
+
+
 # -- Template tests --
 def fmt_tpl_maker(skeleton, keys, valid=True):
     if valid:
@@ -100,6 +144,12 @@ def test_template_rendering(template_maker):
         template.render()
 
 
+def test_template_referenced_names(template_maker):
+    skeleton = "aaa {s} bbbb {i} cccc"
+    template = template_maker(skeleton, {"s", "i"})
+    assert template.referenced_names == {"s", "i"}
+
+
 # -- TemplatedGenerator tests --
 class _BaseTestGenerator(eve.codegen.TemplatedGenerator):
     KEYWORDS = ("BASE", "ONE")
@@ -218,6 +268,33 @@ def test_templated_generator(templated_generator, fixed_compound_node):
         assert rendered_code.find(keyword) >= 0
 
 
+def test_templated_generator_template_lookup_cache(templated_generator, fixed_compound_node):
+    templated_generator._template_lookup_cache.clear()
+    generator = templated_generator()
+    template, key = generator.get_template(fixed_compound_node)
+    assert key == "CompoundNode"
+    assert templated_generator._template_lookup_cache[type(fixed_compound_node)] == (template, key)
+    assert generator.get_template(fixed_compound_node) == (template, key)
+
+
+def test_templated_generator_referenced_values(fixed_compound_node):
+    class _RecordingTemplate(eve.codegen.FormatTemplate):
+        def render_values(self, **kwargs):
+            self.rendered_keys = set(kwargs)
+            return super().render_values(**kwargs)
+
+    class _Generator(eve.codegen.TemplatedGenerator):
+        CompoundNode = _RecordingTemplate("{location}|{_this_node.int_value}")
+
+    rendered_code = _Generator.apply(fixed_compound_node, unused_arg=1)
+    assert rendered_code.endswith(f"|{fixed_compound_node.int_value}")
+    # Attribute names may also be reported as referenced names
+    assert {"location", "_this_node"} <= _Generator.CompoundNode.rendered_keys
+    assert (
+        not {"unused_arg", "_children", "_this_generator"} & _Generator.CompoundNode.rendered_keys
+    )
+
+
 def test_templated_generator_exceptions(faulty_templated_generator, fixed_compound_node):
     with pytest.raises(eve.codegen.TemplateRenderingError, match="when rendering node"):
         faulty_templated_generator.apply(fixed_compound_node)
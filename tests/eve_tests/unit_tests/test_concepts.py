@@ -82,3 +82,18 @@ class TestNode:
 
     def test_serialization_roundtrip(self, sample_node):
         assert type(sample_node).parse_raw(sample_node.json()) == sample_node
+
+    def test_structural_equality(self, sample_node):
+        other = sample_node.copy(deep=True)
+
+        assert other is not sample_node
+        assert other == sample_node
+        assert hash(other) == hash(sample_node)
+
+    def test_hash_reset_on_assignment(self, simple_node):
+        other = simple_node.copy(deep=True)
+        assert hash(other) == hash(simple_node)
+
+        other.int_value = simple_node.int_value + 1
+        assert other != simple_node
+        assert hash(other) == hash(simple_node.copy(update={"int_value": other.int_value}))
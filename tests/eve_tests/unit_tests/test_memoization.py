@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import pytest
+
+from eve import memoization
+
+
+@pytest.fixture
+def cache():
+    yield memoization.AnalysisCache(maxsize=4)
+
+
+def test_memoized_analysis(cache, compound_node):
+    calls = []
+
+    @memoization.memoized_analysis(cache=cache)
+    def analysis(node, *, flag=False):
+        calls.append(node)
+        return [node.int_value, flag]
+
+    first = analysis(compound_node)
+    assert analysis(compound_node) == first
+    assert analysis(compound_node.copy(deep=True)) == first
+    assert len(calls) == 1
+
+    analysis(compound_node, flag=True)
+    analysis(compound_node.copy(update={"int_value": compound_node.int_value + 1}))
+    assert len(calls) == 3
+    assert cache.info()["hits"] == 2
+
+    # Results are copied
+    analysis(compound_node).append(None)
+    assert analysis(compound_node) == first
+
+
+def test_memoized_analysis_in_place_modification(cache, compound_node):
+    @memoization.memoized_analysis(cache=cache)
+    def analysis(node):
+        return node.simple.int_value
+
+    hash(compound_node)
+    assert analysis(compound_node) == compound_node.simple.int_value
+    # modifications of nested nodes do not reset the hash value cached on the root
+    compound_node.simple.int_value += 1
+    assert analysis(compound_node) == compound_node.simple.int_value
+    assert cache.info()["hits"] == 0
+
+
+def test_analysis_scope(simple_node):
+    calls = []
+
+    @memoization.memoized_analysis
+    def analysis(node):
+        calls.append(node)
+        return node.int_value
+
+    analysis(simple_node)
+    analysis(simple_node)
+    assert len(calls) == 2
+
+    with memoization.analysis_scope() as cache:
+        analysis(simple_node)
+        analysis(simple_node)
+    assert len(calls) == 3
+    assert cache.info()["hits"] == 1
+
+    with memoization.analysis_scope():
+        analysis(simple_node)
+    assert len(calls) == 4
+
+
+def test_memoized_analysis_seed(cache, simple_node):
+    @memoization.memoized_analysis(cache=cache)
+    def analysis(node):
+        return "computed"
+
+    analysis.seed("seeded", simple_node)
+    assert analysis(simple_node) == "seeded"
+
+
+def test_memoized_analysis_maxsize(cache, simple_node):
+    @memoization.memoized_analysis(cache=cache)
+    def analysis(node, value):
+        return value
+
+    for i in range(10):
+        analysis(simple_node, i)
+    assert cache.info()["currsize"] == cache.maxsize
+
+
+def test_memoized_analysis_unhashable(cache, simple_node):
+    calls = []
+
+    @memoization.memoized_analysis(cache=cache)
+    def analysis(node, unhashable):
+        calls.append(node)
+        return node
+
+    analysis(simple_node, [bytearray()])
+    analysis(simple_node, [bytearray()])
+    assert len(calls) == 2
+    assert cache.info()["currsize"] == 0
+
+
+def test_hash_cons(frozen_simple_node, simple_node):
+    other = frozen_simple_node.copy(deep=True)
+    assert other is not frozen_simple_node
+
+    canonical = memoization.hash_cons(frozen_simple_node)
+    assert canonical is frozen_simple_node
+    assert memoization.hash_cons(other) is frozen_simple_node
+
+    with pytest.raises(TypeError, match="immutable"):
+        memoization.hash_cons(simple_node)
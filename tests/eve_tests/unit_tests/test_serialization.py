@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import io
+import marshal
+import pathlib
+
+import pytest
+
+from eve import serialization
+
+from .. import definitions
+
+
+def test_round_trip(sample_node):
+    loaded = serialization.loads(serialization.dumps(sample_node))
+    assert loaded == sample_node
+    assert type(loaded) is type(sample_node)
+    assert loaded.__fields_set__ == set(sample_node.__fields__)
+
+
+def test_round_trip_values():
+    values = [
+        1,
+        2.5,
+        "text",
+        b"bytes",
+        None,
+        (1, "text"),
+        {"key": [definitions.IntKind.PLUS, definitions.StrKind.FOO]},
+        {1, 2},
+        frozenset(["a"]),
+        pathlib.Path("/path"),
+    ]
+    assert serialization.loads(serialization.dumps(values)) == values
+
+
+def test_shared_nodes(node_with_symbol_table):
+    loaded = serialization.loads(serialization.dumps(node_with_symbol_table))
+    assert loaded == node_with_symbol_table
+    assert loaded.symtable_[loaded.node_with_name.name] is loaded.node_with_name
+    for node in loaded.list_with_name:
+        assert loaded.symtable_[node.name] is node
+
+
+def test_enums(simple_node):
+    loaded = serialization.loads(serialization.dumps([simple_node, simple_node.copy()]))
+    assert loaded[0].int_kind is simple_node.int_kind
+    assert loaded[0].str_kind is simple_node.str_kind
+    assert loaded[1].str_kind is simple_node.str_kind
+
+
+def test_file_round_trip(compound_node):
+    buffer = io.BytesIO()
+    serialization.dump(compound_node, buffer)
+    buffer.seek(0)
+    assert serialization.load(buffer) == compound_node
+
+
+def test_unimportable_type():
+    class LocalNode(definitions.SimpleNode):
+        pass
+
+    node = LocalNode(**definitions.make_simple_node().dict())
+    with pytest.raises(serialization.SerializationError, match="cannot be serialized"):
+        serialization.dumps(node)
+
+
+def test_invalid_data(simple_node):
+    with pytest.raises(serialization.SerializationError, match="Invalid"):
+        serialization.loads(b"invalid")
+
+    _, *contents = marshal.loads(serialization.dumps(simple_node))
+    data = marshal.dumps((serialization.FORMAT_VERSION + 1, *contents))
+    with pytest.raises(serialization.SerializationError, match="version"):
+        serialization.loads(data)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from eve import NodeVisitor
+
+from .. import definitions
+
+
+class NodeCounter(NodeVisitor):
+    def __init__(self):
+        self.counts = {"simple": 0, "other": 0}
+
+    def visit_SimpleNode(self, node):
+        self.counts["simple"] += 1
+
+    def visit_Node(self, node):
+        self.counts["other"] += 1
+        self.generic_visit(node)
+
+
+class LocationCounter(NodeCounter):
+    def visit_LocationNode(self, node):
+        self.counts["location"] = self.counts.get("location", 0) + 1
+
+
+def test_visitor_dispatch_is_cached_per_class(compound_node):
+    counter = NodeCounter()
+    counter.visit(compound_node)
+    assert counter.counts["simple"] == 1
+    assert NodeCounter._visitor_method_names[definitions.SimpleNode] == "visit_SimpleNode"
+    assert NodeCounter._visitor_method_names[definitions.LocationNode] == "visit_Node"
+    assert NodeVisitor._visitor_method_names == {}
+
+    # subclasses do not reuse the dispatch of their base classes
+    counter = LocationCounter()
+    counter.visit(compound_node)
+    assert counter.counts["location"] == 1
+    assert LocationCounter._visitor_method_names[definitions.LocationNode] == "visit_LocationNode"
+    assert NodeCounter._visitor_method_names[definitions.LocationNode] == "visit_Node"
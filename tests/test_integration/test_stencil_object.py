@@ -18,11 +18,13 @@
 
 from typing import Any, Dict
 
+import numpy as np
 import pytest
 
 from gt4py import gtscript
 from gt4py import storage as gt_storage
 from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_object import StencilObject
 
 
 @pytest.mark.parametrize("backend", ["gtc:numpy"])
@@ -66,3 +68,135 @@ def test_stencil_object_cache(backend: str):
     assert len(stencil._domain_origin_cache) == 0
     cleaned_cache_time = runit(in_storage, out_storage, offset=1.0)
     assert cleaned_cache_time > fast_time
+
+
+@pytest.mark.parametrize("backend", ["gtc:numpy"])
+def test_batched(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, scale: float):
+        with computation(PARALLEL), interval(...):
+            out_field = scale * in_field[1, 0, 0]  # noqa: F841
+
+    shape = (4, 4, 4)
+    in_storages = [
+        gt_storage.from_array(np.random.randn(*shape), backend, (0, 0, 0)) for _ in range(3)
+    ]
+    out_storages = [gt_storage.zeros(backend, (0, 0, 0), shape, float) for _ in range(3)]
+    exec_info: Dict[str, Any] = {}
+    stencil.batched(
+        in_storages, out_storages, scale=[1.0, 2.0, 3.0], domain=(3, 4, 4), exec_info=exec_info
+    )
+    assert exec_info["batch_size"] == 3
+    for scale, in_storage, out_storage in zip([1.0, 2.0, 3.0], in_storages, out_storages):
+        assert np.allclose(out_storage[:3], scale * in_storage[1:])
+
+    # shared arguments
+    stencil.batched(in_storages[0], out_storages, scale=2.0, domain=(3, 4, 4))
+    for out_storage in out_storages:
+        assert np.allclose(out_storage[:3], 2.0 * in_storages[0][1:])
+
+    with pytest.raises(ValueError, match="numbers of members"):
+        stencil.batched(in_storages[:2], out_storages, scale=1.0)
+    with pytest.raises(ValueError, match="member 1"):
+        other_storage = gt_storage.zeros(backend, (1, 0, 0), shape, float)
+        stencil.batched(in_storages, [out_storages[0], other_storage, out_storages[2]], scale=1.0)
+    with pytest.raises(TypeError, match="member 2"):
+        stencil.batched(in_storages, out_storages, scale=[1.0, 2.0, 3])
+
+    # the data of all members must have the same alignment
+    buffer = np.zeros(2 * 8 * 4 ** 3 + 8, dtype=np.uint8)
+    arrays = [
+        np.ndarray(shape, dtype=float, buffer=buffer, offset=offset)
+        for offset in (0, 8 * 4 ** 3, 8 * 4 ** 3 + 4)
+    ]
+    assert all(array.strides == arrays[0].strides for array in arrays)
+    stencil.batched(in_storages[0], arrays[:2], scale=1.0, domain=(3, 4, 4))
+    with pytest.raises(ValueError, match="alignment"):
+        stencil.batched(in_storages[0], [arrays[0], arrays[2]], scale=1.0, domain=(3, 4, 4))
+
+
+@pytest.mark.parametrize("backend", ["gtc:numpy"])
+def test_generic_batched(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, scale: float):
+        with computation(PARALLEL), interval(...):
+            out_field = scale * in_field[1, 0, 0]  # noqa: F841
+
+    shape = (4, 4, 4)
+    in_storages = [
+        gt_storage.from_array(np.random.randn(*shape), backend, (0, 0, 0)) for _ in range(3)
+    ]
+    out_storages = [gt_storage.zeros(backend, (0, 0, 0), shape, float) for _ in range(3)]
+    exec_info: Dict[str, Any] = {}
+    StencilObject.batched(
+        stencil,
+        in_storages,
+        out_storages,
+        scale=[1.0, 2.0, 3.0],
+        domain=(3, 4, 4),
+        exec_info=exec_info,
+    )
+    assert exec_info["batch_size"] == 3
+    for scale, in_storage, out_storage in zip([1.0, 2.0, 3.0], in_storages, out_storages):
+        assert np.allclose(out_storage[:3], scale * in_storage[1:])
+
+    with pytest.raises(ValueError, match="numbers of members"):
+        StencilObject.batched(stencil, in_storages[:2], out_storages, scale=1.0)
+
+
+@pytest.mark.parametrize("backend", ["gtc:numpy"])
+def test_submit(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, scale: float):
+        with computation(PARALLEL), interval(...):
+            out_field = scale * in_field  # noqa: F841
+
+    shape = (8, 8, 8)
+    in_storage = gt_storage.from_array(np.random.randn(*shape), backend, (0, 0, 0))
+    out_storages = [gt_storage.zeros(backend, (0, 0, 0), shape, float) for _ in range(4)]
+    futures = [
+        stencil.submit(in_storage, out_storage, scale=float(n))
+        for n, out_storage in enumerate(out_storages)
+    ]
+    futures.append(
+        stencil.freeze(origin={"in_field": (0, 0, 0), "out_field": (0, 0, 0)}, domain=shape).submit(
+            in_field=in_storage, out_field=out_storages[0], scale=0.0
+        )
+    )
+    assert all(future.result() is None for future in futures)
+    for n, out_storage in enumerate(out_storages):
+        assert np.allclose(out_storage, n * in_storage)
+
+    future = stencil.submit(in_storage, out_storages[0], scale=1.0, domain=(9, 8, 8))
+    with pytest.raises(ValueError):
+        future.result()
+
+
+@pytest.mark.parametrize("backend", ["gtc:numpy"])
+def test_bind(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, scale: float):
+        with computation(PARALLEL), interval(...):
+            out_field = scale * in_field[1, 0, 0]  # noqa: F841
+
+    shape = (4, 4, 4)
+    in_storage = gt_storage.from_array(np.random.randn(*shape), backend, (0, 0, 0))
+    out_storage = gt_storage.zeros(backend, (0, 0, 0), shape, float)
+    bound = stencil.bind(in_field=in_storage, out_field=out_storage, domain=(3, 4, 4))
+    assert bound.domain == (3, 4, 4)
+    assert bound.origin == {"in_field": (0, 0, 0), "out_field": (0, 0, 0)}
+
+    exec_info: Dict[str, Any] = {}
+    for scale in (1.0, 2.0):
+        bound(scale=scale, exec_info=exec_info)
+        assert np.allclose(out_storage[:3], scale * in_storage[1:])
+    assert exec_info["domain"] == (3, 4, 4)
+
+    with pytest.raises(TypeError):
+        bound(scale=1)
+    with pytest.raises(ValueError, match="Missing value"):
+        bound()
+    with pytest.raises(ValueError, match="too large"):
+        stencil.bind(in_field=in_storage, out_field=out_storage, domain=(4, 4, 4))
+    with pytest.raises(TypeError, match="Invalid field names"):
+        stencil.bind(in_field=in_storage, out=out_storage)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+import gt4py
+from gt4py import autotuning
+from gt4py.gtscript import IJ, PARALLEL, Field, computation, interval, sin
+from gt4py.stencil_builder import StencilBuilder
+from gtc.passes.oir_optimizations.caches import KCacheDetection
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
+from gtc.passes.oir_optimizations.horizontal_execution_merging import (
+    MergeCostModel,
+    OnTheFlyMerging,
+)
+from gtc.passes.oir_pipeline import DefaultPipeline
+
+
+# type ignores in stencils are because mypy does not yet
+# deal with gtscript types well
+
+
+def coriolis_stencil(
+    u: Field[float], v: Field[float], lat: Field[IJ, float], omega: float  # type: ignore
+):
+    with computation(PARALLEL), interval(...):  # type: ignore
+        tmp = u * omega + u * u  # type: ignore
+        v = tmp[1, 0, 0] + tmp[-1, 0, 0] + tmp[0, 1, 0] + sin(lat)  # type: ignore # noqa
+
+
+@pytest.fixture
+def small_domains(monkeypatch):
+    monkeypatch.setitem(gt4py.config.autotuning_settings, "domains", [(8, 8, 4)])
+    monkeypatch.setitem(gt4py.config.autotuning_settings, "repetitions", 1)
+
+
+def make_builder(**backend_opts):
+    return StencilBuilder(
+        coriolis_stencil,
+        backend=gt4py.backend.from_name("gtc:numpy"),
+        options=gt4py.definitions.BuildOptions(
+            name="coriolis", module=__name__, backend_opts=backend_opts, build_info={}
+        ),
+    )
+
+
+def test_pipeline_variants():
+    pipeline = DefaultPipeline(
+        skip=[KInvariantHoisting], merge_cost_model=MergeCostModel(memory_access_cost=2.0)
+    )
+    variants = autotuning.pipeline_variants(pipeline)
+
+    assert variants["default"] is pipeline
+    assert "no_hoisting" not in variants
+    assert KCacheDetection not in variants["no_caches"].steps
+    assert OnTheFlyMerging not in variants["no_on_the_fly_merging"].steps
+    assert all(KInvariantHoisting not in variant.steps for variant in variants.values())
+    assert variants["eager_merging"].merge_cost_model.memory_access_cost == 8.0
+    assert variants["conservative_merging"].merge_cost_model.memory_access_cost == 0.5
+
+    variants = autotuning.pipeline_variants(DefaultPipeline(skip=[OnTheFlyMerging]))
+    assert "eager_merging" not in variants and "no_on_the_fly_merging" not in variants
+
+
+def test_tuning_info_is_reused(small_domains, monkeypatch):
+    builder = make_builder(autotune=True)
+    builder.build()
+    tuning_info = builder.options.build_info["autotuning"]
+    assert not tuning_info["reused"]
+    assert tuning_info["variant"] in tuning_info["timings"]
+    assert builder.caching.tuning_info_path.exists()
+    assert builder.caching.tuning_info_path.parent == builder.caching.cache_info_path.parent
+
+    def tune(builder):
+        raise AssertionError("Stencil tuned again")
+
+    monkeypatch.setattr(autotuning, "tune", tune)
+    builder = make_builder(autotune=True)
+    builder.options.rebuild = True
+    builder.build()
+    assert builder.options.build_info["autotuning"] == {**tuning_info, "reused": True}
+
+
+def test_explicit_pipeline_precedence(monkeypatch):
+    def tune(builder):
+        raise AssertionError("Stencil tuned despite an explicit pipeline")
+
+    monkeypatch.setattr(autotuning, "tune", tune)
+    builder = make_builder(autotune=True, oir_pipeline=DefaultPipeline())
+    builder.build()
+    assert "autotuning" not in builder.options.build_info
@@ -19,6 +19,7 @@ from gtc.cuir import kernel_fusion
 
 from .cuir_utils import (
     AssignStmtFactory,
+    HorizontalExecutionFactory,
     KernelFactory,
     ProgramFactory,
     VerticalLoopFactory,
@@ -118,3 +119,61 @@ def test_no_fusion_with_parallel_offsets():
     )
     transformed = kernel_fusion.FuseKernels().visit(testee)
     assert len(transformed.kernels) == 2
+
+
+def test_no_fusion_with_write_after_offset_read():
+    testee = ProgramFactory(
+        kernels=[
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out", right__name="tmp", right__offset__i=1
+                )
+            ),
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp", right__name="inp"
+                )
+            ),
+        ],
+    )
+    transformed = kernel_fusion.FuseKernels().visit(testee)
+    assert len(transformed.kernels) == 2
+
+
+def test_no_fusion_with_write_after_extended_access():
+    testee = ProgramFactory(
+        kernels=[
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0=HorizontalExecutionFactory(
+                    body__0=AssignStmtFactory(left__name="out", right__name="tmp"),
+                    extent__i=(-1, 1),
+                )
+            ),
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp", right__name="inp"
+                )
+            ),
+        ],
+    )
+    transformed = kernel_fusion.FuseKernels().visit(testee)
+    assert len(transformed.kernels) == 2
+
+
+def test_fusion_with_pointwise_write_after_read():
+    testee = ProgramFactory(
+        kernels=[
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out", right__name="tmp"
+                )
+            ),
+            KernelFactory(
+                vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp", right__name="inp"
+                )
+            ),
+        ],
+    )
+    transformed = kernel_fusion.FuseKernels().visit(testee)
+    assert len(transformed.kernels) == 1
@@ -218,6 +218,16 @@ def test_temp_definition() -> None:
     assert result == "a = Field.empty((_dI_ + 3, _dJ_ + 4, _dK_), (1, 2, 0))"
 
 
+def test_reduced_temp_definition() -> None:
+    result = NpirCodegen().visit(
+        TemporaryDeclFactory(
+            name="a", offset=(1, 2), padding=(3, 4), dimensions=(True, True, False)
+        )
+    )
+    print(result)
+    assert result == "a = Field.empty((_dI_ + 3, _dJ_ + 4, _dK_), (1, 2, 0), (True, True, False))"
+
+
 def test_vector_arithmetic() -> None:
     result = NpirCodegen().visit(
         npir.VectorArithmetic(
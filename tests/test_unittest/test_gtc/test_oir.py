@@ -26,6 +26,7 @@ from .oir_utils import (
     HorizontalExecutionFactory,
     MaskStmtFactory,
     StencilFactory,
+    TemporaryFactory,
     VerticalLoopFactory,
     VerticalLoopSectionFactory,
 )
@@ -288,3 +289,23 @@ def test_assign_to_ik_fwd():
                 ],
             ),
         )
+
+
+def test_assign_to_k_temporary():
+    StencilFactory(
+        params=[FieldDeclFactory(name="k_field", dimensions=(False, False, True))],
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="k_tmp", right__name="k_field")
+        ],
+        declarations=[TemporaryFactory(name="k_tmp", dimensions=(False, False, True))],
+    )
+    with pytest.raises(ValidationError, match=r"Not allowed to assign to k-field"):
+        StencilFactory(
+            params=[
+                FieldDeclFactory(name="k_field", dimensions=(False, False, True)),
+                FieldDeclFactory(name="other_k_field", dimensions=(False, False, True)),
+            ],
+            vertical_loops__0__sections__0__horizontal_executions__0__body=[
+                AssignStmtFactory(left__name="k_field", right__name="other_k_field")
+            ],
+        )
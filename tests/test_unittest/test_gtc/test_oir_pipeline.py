@@ -14,8 +14,15 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import ast
+
+from gtc.passes.oir_optimizations.horizontal_execution_merging import (
+    MergeCostModel,
+    OnTheFlyMerging,
+)
 from gtc.passes.oir_optimizations.vertical_loop_merging import AdjacentLoopMerging
 from gtc.passes.oir_pipeline import DefaultPipeline
+from gtc.passes.pass_manager import EXTENTS, SYMBOL_NAMES, AnalysisManager, PassManager
 
 from .oir_utils import StencilFactory
 
@@ -31,3 +38,63 @@ def test_skip():
     pipeline = DefaultPipeline(skip=skip)
     pipeline.run(StencilFactory())
     assert all(s not in pipeline.steps for s in skip)
+
+
+def test_merge_cost_model():
+    cost_model = MergeCostModel(memory_access_cost=1.0)
+    pipeline = DefaultPipeline(merge_cost_model=cost_model)
+    build_info = {}
+    pipeline.run(StencilFactory(), build_info=build_info)
+    assert OnTheFlyMerging(cost_model=cost_model) in pipeline.steps
+    assert OnTheFlyMerging not in pipeline.steps
+    assert "OnTheFlyMerging" in [s["name"] for s in build_info["oir_pipeline"]["passes"]]
+    assert pipeline != DefaultPipeline()
+    assert hash(pipeline) != hash(DefaultPipeline())
+    assert pipeline == DefaultPipeline(merge_cost_model=MergeCostModel(memory_access_cost=1.0))
+    # the representation is embedded in the generated stencil modules
+    assert all(isinstance(step, str) for step in ast.literal_eval(repr(pipeline)))
+
+
+def test_build_info_statistics():
+    build_info = {}
+    DefaultPipeline().run(StencilFactory(), build_info=build_info)
+
+    statistics = build_info["oir_pipeline"]
+    assert [s["name"] for s in statistics["passes"]] == [
+        step.__name__ for step in DefaultPipeline.all_steps()
+    ]
+    assert all(s["run_time"] >= 0.0 and s["nodes_after"] > 0 for s in statistics["passes"])
+    passes = statistics["passes"]
+    assert all(a["nodes_after"] == b["nodes_before"] for a, b in zip(passes, passes[1:]))
+    assert statistics["analyses"]["computed"]["extents"] >= 1
+
+
+def test_preserved_analyses_are_reused():
+    def first_pass(stencil):
+        return stencil.copy(update={"name": "renamed"})
+
+    first_pass.required_analyses = (EXTENTS,)
+    first_pass.preserved_analyses = (EXTENTS,)
+
+    def second_pass(stencil):
+        return stencil
+
+    second_pass.required_analyses = (EXTENTS, SYMBOL_NAMES)
+
+    build_info = {}
+    PassManager([first_pass, second_pass]).run(StencilFactory(), build_info=build_info)
+
+    assert build_info["oir_pipeline"]["analyses"] == {
+        "computed": {"extents": 1, "symbol_names": 1},
+        "reused": {"extents": 1},
+    }
+
+
+def test_invalidated_analysis_is_recomputed():
+    testee = StencilFactory()
+    analyses = AnalysisManager()
+    extents = analyses.get(EXTENTS, testee)
+
+    analyses.invalidate(testee.copy(), preserved=())
+    assert analyses.get(EXTENTS, testee) == extents
+    assert analyses.computed["extents"] == 2
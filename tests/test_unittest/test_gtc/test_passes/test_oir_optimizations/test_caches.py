@@ -702,3 +702,131 @@ def test_fill_flush_to_local_k_caches_basic_forward():
     assert body[2].left.name == "foo", "wrong flush destination"
     assert body[2].right.name == cache_name, "wrong flush source"
     assert body[2].left.offset.k == body[2].right.offset.k == 0, "wrong flush offset"
+
+
+def test_k_cache_detection_multiple_horizontal_executions():
+    testee = VerticalLoopFactory(
+        loop_order=LoopOrder.FORWARD,
+        sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="foo", right__name="foo", right__offset__k=-1)]
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="bar", right__name="foo")]
+            ),
+        ],
+    )
+    transformed = KCacheDetection().visit(testee)
+    assert {c.name for c in transformed.caches} == {"foo"}
+
+
+def test_k_cache_detection_ij_offsets():
+    testee = VerticalLoopFactory(
+        loop_order=LoopOrder.FORWARD,
+        sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="foo", right__name="bar", right__offset__i=1),
+            AssignStmtFactory(
+                left__name="foo", right__name="bar", right__offset__i=1, right__offset__k=1
+            ),
+            AssignStmtFactory(left__name="foo", right__name="baz", right__offset__j=-2),
+            AssignStmtFactory(
+                left__name="foo", right__name="baz", right__offset__j=-2, right__offset__k=1
+            ),
+            AssignStmtFactory(left__name="foo", right__name="foo", right__offset__j=1),
+            AssignStmtFactory(left__name="foo", right__name="foo", right__offset__k=-1),
+        ],
+    )
+    assert not KCacheDetection().visit(testee).caches
+
+    transformed = KCacheDetection(allow_ij_offsets=True).visit(testee)
+    assert len(transformed.caches) == 1
+    assert transformed.caches[0].name == "bar"
+    assert transformed.caches[0].fill and not transformed.caches[0].flush
+
+
+def test_prune_k_cache_fills_ij_offsets():
+    testee = VerticalLoopFactory(
+        loop_order=LoopOrder.BACKWARD,
+        sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="foo", right__name="bar", right__offset__i=1),
+            AssignStmtFactory(
+                left__name="foo", right__name="bar", right__offset__i=1, right__offset__k=1
+            ),
+        ],
+        caches=[KCacheFactory(name="bar", fill=True, flush=False)],
+    )
+    transformed = PruneKCacheFills().visit(testee)
+    assert transformed.caches[0].fill
+
+
+def test_fill_flush_to_local_k_caches_multiple_horizontal_executions():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="foo", right__name="bar")]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="bar", right__name="foo")]
+                    ),
+                ],
+                caches=[KCacheFactory(name="foo", fill=True, flush=True)],
+            )
+        ]
+    )
+    transformed = FillFlushToLocalKCaches().visit(testee)
+    vertical_loop = transformed.vertical_loops[0]
+    cache_name = vertical_loop.caches[0].name
+
+    horizontal_executions = vertical_loop.sections[0].horizontal_executions
+    assert len(horizontal_executions) == 4, "fills and flushes must be separate executions"
+    fill, first, second, flush = (he.body for he in horizontal_executions)
+    assert len(fill) == 1 and fill[0].left.name == cache_name and fill[0].right.name == "foo"
+    assert first[0].left.name == cache_name and first[0].right.name == "bar"
+    assert second[0].left.name == "bar" and second[0].right.name == cache_name
+    assert len(flush) == 1 and flush[0].left.name == "foo" and flush[0].right.name == cache_name
+
+
+def test_fill_to_local_k_caches_ij_offsets():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="bar", right__offset__i=1),
+                    AssignStmtFactory(
+                        left__name="foo",
+                        right__name="bar",
+                        right__offset__i=1,
+                        right__offset__k=1,
+                    ),
+                    AssignStmtFactory(left__name="foo", right__name="bar"),
+                ],
+                caches=[KCacheFactory(name="bar", fill=True, flush=False)],
+            )
+        ]
+    )
+    transformed = FillFlushToLocalKCaches().visit(testee)
+    vertical_loop = transformed.vertical_loops[0]
+
+    assert len(vertical_loop.caches) == 1, "wrong number of caches"
+    cache_name = vertical_loop.caches[0].name
+    assert cache_name != "bar"
+
+    assert len(vertical_loop.sections) == 2, "entry level requiring two fills was not split"
+    entry_body = vertical_loop.sections[0].horizontal_executions[0].body
+    body = vertical_loop.sections[1].horizontal_executions[0].body
+    assert len(entry_body) == 5 and len(body) == 4, "no or too many fill stmts introduced?"
+
+    for fill, k in zip(entry_body[:2], (0, 1)):
+        assert fill.left.name == cache_name and fill.right.name == "bar", "wrong fill"
+        assert (fill.left.offset.i, fill.left.offset.k) == (0, k), "wrong fill destination offset"
+        assert (fill.right.offset.i, fill.right.offset.k) == (1, k), "wrong fill source offset"
+    assert (body[0].right.offset.i, body[0].right.offset.k) == (1, 1), "wrong fill source offset"
+
+    for stmt, k in zip(body[1:3], (0, 1)):
+        assert stmt.right.name == cache_name, "wrong field name in cache access"
+        assert (stmt.right.offset.i, stmt.right.offset.k) == (0, k), "wrong offset in cache access"
+    assert body[3].right.name == "bar", "single-level column must not be cached"
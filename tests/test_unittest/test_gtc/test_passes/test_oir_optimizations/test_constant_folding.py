@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from gt4py import gtscript
+from gt4py.gtscript import PARALLEL, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+from gtc import common, oir
+from gtc.passes.oir_optimizations.constant_folding import ConstantFolding
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    FieldAccessFactory,
+    HorizontalExecutionFactory,
+    KCacheFactory,
+    LiteralFactory,
+    LocalScalarFactory,
+    MaskStmtFactory,
+    ScalarAccessFactory,
+    StencilFactory,
+    TemporaryFactory,
+    VerticalLoopFactory,
+    WhileFactory,
+)
+
+
+def fold(right: oir.Expr) -> oir.Expr:
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left=FieldAccessFactory(name="out", dtype=right.dtype), right=right)
+        ]
+    )
+    transformed = ConstantFolding().visit(testee)
+    return transformed.vertical_loops[0].sections[0].horizontal_executions[0].body[0].right
+
+
+def literal(value, dtype=common.DataType.FLOAT32):
+    return LiteralFactory(value=value, dtype=dtype)
+
+
+TRUE = literal(common.BuiltInLiteral.TRUE, common.DataType.BOOL)
+FALSE = literal(common.BuiltInLiteral.FALSE, common.DataType.BOOL)
+
+
+@pytest.mark.parametrize(
+    ["expr", "expected"],
+    [
+        (
+            oir.BinaryOp(
+                op=common.ArithmeticOperator.MUL,
+                left=literal("2"),
+                right=oir.BinaryOp(
+                    op=common.ArithmeticOperator.ADD, left=literal("1"), right=literal("0.5")
+                ),
+            ),
+            literal("3.0"),
+        ),
+        (
+            oir.BinaryOp(
+                op=common.ArithmeticOperator.DIV,
+                left=literal("1", common.DataType.FLOAT64),
+                right=literal("3", common.DataType.FLOAT64),
+            ),
+            literal(repr(1 / 3), common.DataType.FLOAT64),
+        ),
+        (
+            oir.UnaryOp(op=common.UnaryOperator.NEG, expr=literal("1.5")),
+            literal("-1.5"),
+        ),
+        (
+            oir.Cast(dtype=common.DataType.INT32, expr=literal("2.5")),
+            literal("2", common.DataType.INT32),
+        ),
+        (
+            oir.BinaryOp(
+                op=common.ArithmeticOperator.ADD,
+                left=literal("2147483647", common.DataType.INT32),
+                right=literal("1", common.DataType.INT32),
+            ),
+            literal("-2147483648", common.DataType.INT32),
+        ),
+        (
+            oir.BinaryOp(op=common.ComparisonOperator.GT, left=literal("2"), right=literal("1")),
+            TRUE,
+        ),
+        (
+            oir.UnaryOp(op=common.UnaryOperator.NOT, expr=literal("True", common.DataType.BOOL)),
+            FALSE,
+        ),
+        (
+            oir.TernaryOp(
+                cond=FALSE, true_expr=literal("1"), false_expr=FieldAccessFactory(name="in")
+            ),
+            FieldAccessFactory(name="in"),
+        ),
+    ],
+)
+def test_expression_folding(expr, expected):
+    assert fold(expr) == expected
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        oir.BinaryOp(
+            op=common.ArithmeticOperator.DIV,
+            left=literal("1", common.DataType.INT32),
+            right=literal("2", common.DataType.INT32),
+        ),
+        oir.BinaryOp(op=common.ArithmeticOperator.DIV, left=literal("1"), right=literal("0")),
+        oir.BinaryOp(
+            op=common.ArithmeticOperator.ADD, left=literal("1"), right=FieldAccessFactory()
+        ),
+    ],
+)
+def test_expression_not_folded(expr):
+    assert fold(expr) == expr
+
+
+def test_logical_identities():
+    mask = FieldAccessFactory(name="mask", dtype=common.DataType.BOOL)
+    assert fold(oir.BinaryOp(op=common.LogicalOperator.AND, left=mask, right=TRUE)) == mask
+    assert fold(oir.BinaryOp(op=common.LogicalOperator.AND, left=FALSE, right=mask)) == FALSE
+    assert fold(oir.BinaryOp(op=common.LogicalOperator.OR, left=mask, right=TRUE)) == TRUE
+    assert fold(oir.BinaryOp(op=common.LogicalOperator.OR, left=FALSE, right=mask)) == mask
+
+
+def test_statically_decided_masks():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            MaskStmtFactory(mask=TRUE, body=[AssignStmtFactory(left__name="a")]),
+            MaskStmtFactory(mask=FALSE, body=[AssignStmtFactory(left__name="b")]),
+            MaskStmtFactory(
+                mask=oir.BinaryOp(
+                    op=common.ComparisonOperator.LT, left=literal("0"), right=literal("1")
+                ),
+                body=[
+                    MaskStmtFactory(mask=FALSE),
+                    AssignStmtFactory(left__name="c"),
+                ],
+            ),
+            WhileFactory(cond=FALSE),
+        ]
+    )
+    transformed = ConstantFolding().visit(testee)
+    body = transformed.vertical_loops[0].sections[0].horizontal_executions[0].body
+    assert [stmt.left.name for stmt in body] == ["a", "c"]
+
+
+def test_local_scalar_propagation():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[
+                    AssignStmtFactory(left=ScalarAccessFactory(name="a"), right=literal("2")),
+                    AssignStmtFactory(
+                        left=ScalarAccessFactory(name="b"),
+                        right=oir.BinaryOp(
+                            op=common.ArithmeticOperator.MUL,
+                            left=ScalarAccessFactory(name="a"),
+                            right=literal("3"),
+                        ),
+                    ),
+                    AssignStmtFactory(
+                        left__name="out",
+                        right=oir.BinaryOp(
+                            op=common.ArithmeticOperator.ADD,
+                            left=ScalarAccessFactory(name="b"),
+                            right=FieldAccessFactory(name="in"),
+                        ),
+                    ),
+                ],
+                declarations=[LocalScalarFactory(name="a"), LocalScalarFactory(name="b")],
+            )
+        ]
+    )
+    transformed = ConstantFolding().visit(testee)
+    horizontal_execution = transformed.vertical_loops[0].sections[0].horizontal_executions[0]
+    assert not horizontal_execution.declarations
+    assert len(horizontal_execution.body) == 1
+    assert horizontal_execution.body[0].right.left == literal("6.0")
+
+
+def test_conditionally_assigned_local_scalar_not_propagated():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[
+                    AssignStmtFactory(left=ScalarAccessFactory(name="a"), right=literal("2")),
+                    MaskStmtFactory(
+                        body=[
+                            AssignStmtFactory(
+                                left=ScalarAccessFactory(name="a"), right=literal("3")
+                            )
+                        ]
+                    ),
+                    AssignStmtFactory(left__name="out", right=ScalarAccessFactory(name="a")),
+                ],
+                declarations=[LocalScalarFactory(name="a")],
+            )
+        ]
+    )
+    transformed = ConstantFolding().visit(testee)
+    assert transformed == testee
+
+
+def test_temporary_propagation():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp", right=literal("1")),
+                    AssignStmtFactory(left__name="other", right=literal("1")),
+                ],
+            ),
+            VerticalLoopFactory(
+                loop_order=common.LoopOrder.FORWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="other", right=literal("2")),
+                    AssignStmtFactory(
+                        left__name="out",
+                        right=oir.BinaryOp(
+                            op=common.ArithmeticOperator.ADD,
+                            left=FieldAccessFactory(name="tmp", offset__k=-1),
+                            right=FieldAccessFactory(name="other"),
+                        ),
+                    ),
+                ],
+                caches=[KCacheFactory(name="tmp")],
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp"), TemporaryFactory(name="other")],
+    )
+    transformed = ConstantFolding().visit(testee)
+    assert {decl.name for decl in transformed.declarations} == {"other"}
+    assert not transformed.vertical_loops[1].caches
+    assert len(transformed.vertical_loops[0].sections[0].horizontal_executions[0].body) == 1
+    out = transformed.vertical_loops[1].sections[0].horizontal_executions[0].body[-1]
+    assert out.right.left == literal("1")
+    assert out.right.right == FieldAccessFactory(name="other")
+
+
+def test_numpy_generated_code(tmp_path):
+    def stencil(in_field: gtscript.Field[float], out_field: gtscript.Field[float]):
+        from __externals__ import SCALE, USE_OFFSET
+
+        with computation(PARALLEL), interval(...):
+            factor = 2.0 * SCALE + 1.0
+            if USE_OFFSET:
+                out_field = in_field * factor + 1.0
+            else:
+                out_field = in_field * factor
+
+    builder = (
+        StencilBuilder(stencil)
+        .with_backend("gtc:numpy")
+        .with_externals({"SCALE": 0.25, "USE_OFFSET": False})
+        .with_caching("nocaching", output_path=tmp_path)
+        .with_options(name="stencil", module="")
+    )
+    computation_src = builder.generate_computation()["computation.py"]
+
+    assert "in_field[i:I, j:J, k:K] * np.float64(1.5)" in computation_src
+    assert "SCALE" not in computation_src
+    assert "factor" not in computation_src
+    assert "mask" not in computation_src
+    assert "+ np.float64(1.0)" not in computation_src
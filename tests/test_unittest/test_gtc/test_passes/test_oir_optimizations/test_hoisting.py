@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from gtc import common, oir
+from gtc.common import HorizontalInterval, HorizontalMask, LevelMarker
+from gtc.passes.oir_optimizations.hoisting import KInvariantHoisting
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    BinaryOpFactory,
+    FieldAccessFactory,
+    FieldDeclFactory,
+    HorizontalExecutionFactory,
+    HorizontalRestrictionFactory,
+    IntervalFactory,
+    LiteralFactory,
+    MaskStmtFactory,
+    NativeFuncCallFactory,
+    StencilFactory,
+    VerticalLoopFactory,
+    WhileFactory,
+)
+
+
+PARAMS = [
+    FieldDeclFactory(name="lat", dimensions=(True, True, False)),
+    FieldDeclFactory(name="u"),
+    FieldDeclFactory(name="out"),
+    oir.ScalarDecl(name="omega", dtype=common.DataType.FLOAT32),
+]
+
+
+def sin_lat(i_offset: int = 0) -> oir.NativeFuncCall:
+    return NativeFuncCallFactory(
+        func=common.NativeFunction.SIN, args=[FieldAccessFactory(name="lat", offset__i=i_offset)]
+    )
+
+
+def coriolis_assignment(**kwargs) -> oir.AssignStmt:
+    return AssignStmtFactory(
+        left__name="out",
+        right=BinaryOpFactory(
+            left=FieldAccessFactory(name="u"),
+            right=BinaryOpFactory(
+                op=common.ArithmeticOperator.MUL,
+                left=oir.ScalarAccess(name="omega", dtype=common.DataType.FLOAT32),
+                right=sin_lat(**kwargs),
+            ),
+        ),
+    )
+
+
+def test_hoisting():
+    testee = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            coriolis_assignment(i_offset=1),
+            AssignStmtFactory(left__name="out", right=sin_lat(i_offset=1)),
+        ],
+    )
+    transformed = KInvariantHoisting().visit(testee)
+
+    assert len(transformed.vertical_loops) == 2
+    hoisted_loop, vertical_loop = transformed.vertical_loops
+    assert hoisted_loop.loop_order == common.LoopOrder.FORWARD
+    assert hoisted_loop.sections[0].interval == IntervalFactory(end=common.AxisBound.from_start(1))
+
+    # single native function calls are hoisted as well
+    assert len(transformed.declarations) == 2
+    assert all(decl.dimensions == (True, True, False) for decl in transformed.declarations)
+    hoisted_body = hoisted_loop.sections[0].horizontal_executions[0].body
+    assert [stmt.left.name for stmt in hoisted_body] == [
+        decl.name for decl in transformed.declarations
+    ]
+    assert hoisted_body[0].right == coriolis_assignment(i_offset=1).right.right
+    assert hoisted_body[1].right == sin_lat(i_offset=1)
+
+    body = vertical_loop.sections[0].horizontal_executions[0].body
+    assert body[0].right.right == FieldAccessFactory(name=hoisted_body[0].left.name)
+    assert body[1].right == FieldAccessFactory(name=hoisted_body[1].left.name)
+
+
+def test_identical_expressions_share_temporaries():
+    testee = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(body=[coriolis_assignment()]),
+            HorizontalExecutionFactory(body=[coriolis_assignment()]),
+        ],
+    )
+    transformed = KInvariantHoisting().visit(testee)
+    assert len(transformed.declarations) == 1
+    hoisted_body = transformed.vertical_loops[0].sections[0].horizontal_executions[0].body
+    assert len(hoisted_body) == 1
+
+
+def test_no_hoisting():
+    written_in_loop = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__loop_order=common.LoopOrder.FORWARD,
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(body=[coriolis_assignment()]),
+            HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="lat", right__name="u")]),
+        ],
+    )
+    single_level = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__sections__0__interval__end=common.AxisBound.from_start(1),
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[coriolis_assignment()],
+    )
+    horizontal_region = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            HorizontalRestrictionFactory(
+                mask=HorizontalMask(
+                    i=HorizontalInterval.at_endpt(LevelMarker.START, 0),
+                    j=HorizontalInterval.full(),
+                ),
+                body=[coriolis_assignment()],
+            )
+        ],
+    )
+    three_dimensional = StencilFactory(
+        params=PARAMS,
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(
+                left__name="out",
+                right=NativeFuncCallFactory(
+                    func=common.NativeFunction.SIN, args=[FieldAccessFactory(name="u")]
+                ),
+            )
+        ],
+    )
+    for testee in (written_in_loop, single_level, horizontal_region, three_dimensional):
+        assert KInvariantHoisting().visit(testee) == testee
+
+
+def test_no_hoisting_from_conditional_bodies():
+    positive_sin_lat = BinaryOpFactory(
+        op=common.ComparisonOperator.GT, left=sin_lat(), right=LiteralFactory(value="0.0")
+    )
+    for statement_factory, condition in ((MaskStmtFactory, "mask"), (WhileFactory, "cond")):
+        testee = StencilFactory(
+            params=PARAMS,
+            vertical_loops__0__sections__0__horizontal_executions__0__body=[
+                statement_factory(**{condition: positive_sin_lat}, body=[coriolis_assignment()])
+            ],
+        )
+        transformed = KInvariantHoisting().visit(testee)
+
+        # the condition is evaluated on all points anyway, the body only where it holds
+        assert len(transformed.declarations) == 1
+        hoisted_body = transformed.vertical_loops[0].sections[0].horizontal_executions[0].body
+        assert [stmt.right for stmt in hoisted_body] == [positive_sin_lat]
+        statement = transformed.vertical_loops[1].sections[0].horizontal_executions[0].body[0]
+        assert getattr(statement, condition) == FieldAccessFactory(
+            name=transformed.declarations[0].name, dtype=common.DataType.BOOL
+        )
+        assert statement.body == [coriolis_assignment()]
+
+
+def test_hoisting_per_loop():
+    testee = StencilFactory(
+        params=PARAMS,
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[coriolis_assignment()]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[coriolis_assignment()]
+            ),
+        ],
+    )
+    transformed = KInvariantHoisting().visit(testee)
+    assert len(transformed.vertical_loops) == 4
+    assert len({decl.name for decl in transformed.declarations}) == 2
@@ -20,6 +20,7 @@ from gt4py.definitions import Extent
 from gtc import common, oir
 from gtc.passes.oir_optimizations.horizontal_execution_merging import (
     HorizontalExecutionMerging,
+    MergeCostModel,
     OnTheFlyMerging,
     compute_horizontal_block_extents,
 )
@@ -212,16 +213,36 @@ def test_on_the_fly_merging_with_expensive_function():
         ],
         declarations=[TemporaryFactory(name="tmp")],
     )
-    transformed = OnTheFlyMerging(allow_expensive_function_duplication=False).visit(testee)
+    transformed = OnTheFlyMerging().visit(testee)
     hexecs = transformed.vertical_loops[0].sections[0].horizontal_executions
     assert len(hexecs) == 2
 
 
-def test_on_the_fly_merging_body_size_limit():
+def test_on_the_fly_merging_with_expensive_function_read_once():
     testee = StencilFactory(
         vertical_loops__0__sections__0__horizontal_executions=[
             HorizontalExecutionFactory(
-                body=[AssignStmtFactory(left__name="tmp", right__name="foo")]
+                body=[
+                    AssignStmtFactory(
+                        left__name="tmp",
+                        right=NativeFuncCallFactory(func=common.NativeFunction.SIN),
+                    )
+                ]
+            ),
+            HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="tmp")]),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = OnTheFlyMerging().visit(testee)
+    hexecs = transformed.vertical_loops[0].sections[0].horizontal_executions
+    assert len(hexecs) == 1
+
+
+def test_on_the_fly_merging_cost_model():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="tmp", right=BinaryOpFactory())]
             ),
             HorizontalExecutionFactory(
                 body=[
@@ -232,10 +253,43 @@ def test_on_the_fly_merging_body_size_limit():
         ],
         declarations=[TemporaryFactory(name="tmp")],
     )
-    transformed = OnTheFlyMerging(max_horizontal_execution_body_size=0).visit(testee)
+    transformed = OnTheFlyMerging(cost_model=MergeCostModel(memory_access_cost=0.0)).visit(testee)
     hexecs = transformed.vertical_loops[0].sections[0].horizontal_executions
     assert len(hexecs) == 2
 
+    transformed = OnTheFlyMerging(cost_model=MergeCostModel(memory_access_cost=0.5)).visit(testee)
+    hexecs = transformed.vertical_loops[0].sections[0].horizontal_executions
+    assert len(hexecs) == 1
+
+
+def test_merge_cost_model():
+    cost_model = MergeCostModel(
+        operation_cost=1.0,
+        function_call_cost=2.0,
+        expensive_function_cost=10.0,
+        memory_access_cost=4.0,
+    )
+    horizontal_execution = HorizontalExecutionFactory(
+        body=[
+            AssignStmtFactory(
+                right=BinaryOpFactory(
+                    left=NativeFuncCallFactory(func=common.NativeFunction.EXP),
+                    right=NativeFuncCallFactory(func=common.NativeFunction.ABS),
+                )
+            )
+        ]
+    )
+    assert cost_model.computation_cost(horizontal_execution) == 13.0
+    # one consumer at three offsets: 26 redundant vs 8 saved
+    assert not cost_model.is_profitable(horizontal_execution, written_fields=1, offset_counts=[3])
+    # three consumers at one offset each: 26 redundant vs 16 saved
+    assert not cost_model.is_profitable(
+        horizontal_execution, written_fields=1, offset_counts=[1, 1, 1]
+    )
+    # two consumers at one offset each: 13 redundant vs 12 saved for each written field
+    assert cost_model.is_profitable(horizontal_execution, written_fields=2, offset_counts=[1, 1])
+    assert cost_model.is_profitable(horizontal_execution, written_fields=1, offset_counts=[1])
+
 
 def test_on_the_fly_merging_api_field():
     testee = StencilFactory(
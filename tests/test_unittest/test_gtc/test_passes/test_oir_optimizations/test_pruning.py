@@ -14,18 +14,28 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from gtc import common
 from gtc.common import HorizontalInterval, HorizontalMask, LevelMarker
-from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning, UnreachableStmtPruning
+from gtc.passes.oir_optimizations.pruning import (
+    DeadCodeElimination,
+    NoFieldAccessPruning,
+    UnreachableStmtPruning,
+)
 
 from ...oir_utils import (
     AssignStmtFactory,
     HorizontalExecutionFactory,
     HorizontalRestrictionFactory,
+    IntervalFactory,
+    KCacheFactory,
     LiteralFactory,
     LocalScalarFactory,
+    MaskStmtFactory,
     ScalarAccessFactory,
     StencilFactory,
+    TemporaryFactory,
     VerticalLoopFactory,
+    VerticalLoopSectionFactory,
 )
 
 
@@ -111,3 +121,127 @@ def test_unreachable_stmt_pruning():
 
     stencil = UnreachableStmtPruning().visit(testee)
     assert len(stencil.vertical_loops[0].sections[0].horizontal_executions[1].body) == 2
+
+
+def test_dead_temporaries_elimination():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="tmp1", right__name="in")]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[
+                            AssignStmtFactory(left__name="tmp2", right__name="tmp1"),
+                            AssignStmtFactory(left__name="out", right__name="in"),
+                        ]
+                    ),
+                ],
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp2", right__name="tmp2", right__offset__k=-1)
+                ],
+                loop_order=common.LoopOrder.FORWARD,
+                caches=[KCacheFactory(name="tmp2")],
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    # `tmp2` is only read by its own assignments and `tmp1` only by the ones of `tmp2`
+    assert not transformed.declarations
+    assert len(transformed.vertical_loops) == 1
+    horizontal_executions = transformed.vertical_loops[0].sections[0].horizontal_executions
+    assert len(horizontal_executions) == 1
+    assert [stmt.left.name for stmt in horizontal_executions[0].body] == ["out"]
+
+
+def test_dead_stores_elimination():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0=HorizontalExecutionFactory(
+            body=[
+                AssignStmtFactory(left=ScalarAccessFactory(name="a"), right=LiteralFactory()),
+                AssignStmtFactory(left=ScalarAccessFactory(name="a"), right__name="in"),
+                AssignStmtFactory(left=ScalarAccessFactory(name="b"), right__name="in"),
+                AssignStmtFactory(left__name="out", right__name="in"),
+                AssignStmtFactory(left__name="out", right=ScalarAccessFactory(name="a")),
+                AssignStmtFactory(left__name="out2", right__name="in"),
+                AssignStmtFactory(left__name="tmp", right__name="out2", right__offset__i=1),
+                AssignStmtFactory(left__name="out2", right__name="tmp"),
+            ],
+            declarations=[LocalScalarFactory(name="a"), LocalScalarFactory(name="b")],
+        ),
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    horizontal_execution = transformed.vertical_loops[0].sections[0].horizontal_executions[0]
+    assert [decl.name for decl in horizontal_execution.declarations] == ["a"]
+    assert [stmt.left.name for stmt in horizontal_execution.body] == [
+        "a",
+        "out",
+        "out2",
+        "tmp",
+        "out2",
+    ]
+    assert horizontal_execution.body[0].right.name == "in"
+
+
+def test_conditional_stores_are_kept():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0=HorizontalExecutionFactory(
+            body=[
+                AssignStmtFactory(left=ScalarAccessFactory(name="a"), right__name="in"),
+                MaskStmtFactory(
+                    body=[
+                        AssignStmtFactory(
+                            left=ScalarAccessFactory(name="a"), right=LiteralFactory()
+                        ),
+                        AssignStmtFactory(
+                            left=ScalarAccessFactory(name="b"), right=LiteralFactory()
+                        ),
+                    ]
+                ),
+                AssignStmtFactory(left__name="out", right=ScalarAccessFactory(name="a")),
+            ],
+            declarations=[LocalScalarFactory(name="a"), LocalScalarFactory(name="b")],
+        ),
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    horizontal_execution = transformed.vertical_loops[0].sections[0].horizontal_executions[0]
+    assert [decl.name for decl in horizontal_execution.declarations] == ["a"]
+    assert len(horizontal_execution.body) == 3
+    assert len(horizontal_execution.body[1].body) == 1
+
+
+def test_empty_sections_elimination():
+    def section(start, end, name):
+        return VerticalLoopSectionFactory(
+            interval=IntervalFactory(
+                start=common.AxisBound(level=LevelMarker.START, offset=start),
+                end=common.AxisBound(level=LevelMarker.START, offset=end),
+            ),
+            horizontal_executions__0__body=[AssignStmtFactory(left__name=name, right__name="in")],
+        )
+
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections=[
+                    section(0, 1, "tmp"),
+                    section(1, 2, "out"),
+                    section(2, 3, "tmp"),
+                    section(3, 4, "out"),
+                    section(4, 5, "tmp"),
+                ]
+            ),
+            VerticalLoopFactory(sections=[section(0, 5, "tmp")]),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    assert len(transformed.vertical_loops) == 1
+    sections = transformed.vertical_loops[0].sections
+    assert [section.interval.start.offset for section in sections] == [1, 2, 3]
+    assert not sections[1].horizontal_executions[0].body
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, computation, interval
+from gtc import common, oir
+from gtc.passes.oir_optimizations.strength_reduction import (
+    FastMathStrengthReduction,
+    StrengthReduction,
+)
+from gtc.passes.oir_pipeline import DefaultPipeline
+from gtc.passes.pass_manager import ACCESS_KINDS, PassManager
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    BinaryOpFactory,
+    FieldAccessFactory,
+    LiteralFactory,
+    NativeFuncCallFactory,
+    StencilFactory,
+)
+
+
+def reduce(right: oir.Expr, *, fast_math: bool = False) -> oir.Expr:
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left=FieldAccessFactory(name="out", dtype=right.dtype), right=right)
+        ]
+    )
+    pass_class = FastMathStrengthReduction if fast_math else StrengthReduction
+    transformed = pass_class().visit(testee)
+    return transformed.vertical_loops[0].sections[0].horizontal_executions[0].body[0].right
+
+
+def power(exponent: str, base: oir.Expr = None) -> oir.NativeFuncCall:
+    return NativeFuncCallFactory(
+        func=common.NativeFunction.POW,
+        args=[base or FieldAccessFactory(name="x"), LiteralFactory(value=exponent)],
+    )
+
+
+def mul(left: oir.Expr, right: oir.Expr) -> oir.BinaryOp:
+    return oir.BinaryOp(op=common.ArithmeticOperator.MUL, left=left, right=right)
+
+
+def test_exact_power_reduction():
+    x = FieldAccessFactory(name="x")
+    assert reduce(power("1")) == x
+    assert reduce(power("0.0")) == LiteralFactory(value="1.0")
+    assert reduce(power("2.0")) == power("2.0")
+    assert reduce(power("-1.0")) == power("-1.0")
+    assert reduce(power("3.0")) == power("3.0")
+    assert reduce(power("0.5")) == power("0.5")
+
+
+def test_fast_math_power_reduction():
+    x = FieldAccessFactory(name="x")
+    sqrt = NativeFuncCallFactory(func=common.NativeFunction.SQRT, args=[x])
+    assert reduce(power("2.0"), fast_math=True) == mul(x, x)
+    assert reduce(power("-1.0"), fast_math=True) == oir.BinaryOp(
+        op=common.ArithmeticOperator.DIV, left=LiteralFactory(value="1.0"), right=x
+    )
+    assert reduce(power("3.0"), fast_math=True) == mul(mul(x, x), x)
+    assert reduce(power("0.5"), fast_math=True) == sqrt
+    assert reduce(power("1.5"), fast_math=True) == mul(x, sqrt)
+    assert reduce(power("-2.0"), fast_math=True) == oir.BinaryOp(
+        op=common.ArithmeticOperator.DIV, left=LiteralFactory(value="1.0"), right=mul(x, x)
+    )
+    assert reduce(power("5.0"), fast_math=True) == power("5.0")
+    assert reduce(power("0.3"), fast_math=True) == power("0.3")
+    expensive_base = BinaryOpFactory(left__name="a", right__name="b")
+    assert reduce(power("2.0", base=expensive_base), fast_math=True) == power(
+        "2.0", base=expensive_base
+    )
+
+
+@pytest.mark.parametrize(
+    ["divisor", "fast_math", "factor"],
+    [("4.0", False, "0.25"), ("0.5", False, "2.0"), ("3.0", False, None), ("0.0", True, None)],
+)
+def test_division_reduction(divisor, fast_math, factor):
+    x = FieldAccessFactory(name="x")
+    division = oir.BinaryOp(
+        op=common.ArithmeticOperator.DIV, left=x, right=LiteralFactory(value=divisor)
+    )
+    expected = mul(x, LiteralFactory(value=factor)) if factor else division
+    assert reduce(division, fast_math=fast_math) == expected
+
+
+def test_fast_math_division_reduction():
+    division = oir.BinaryOp(
+        op=common.ArithmeticOperator.DIV,
+        left=FieldAccessFactory(name="x", dtype=common.DataType.FLOAT64),
+        right=LiteralFactory(value="3.0", dtype=common.DataType.FLOAT64),
+    )
+    assert reduce(division, fast_math=True).right.value == repr(1 / 3)
+
+
+def test_access_kinds_are_recomputed():
+    # x ** 0 is reduced to 1.0, removing the read of x
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left=FieldAccessFactory(name="out"), right=power("0.0"))
+        ]
+    )
+
+    def check_access_kinds(stencil):
+        return stencil
+
+    check_access_kinds.required_analyses = (ACCESS_KINDS,)
+
+    build_info = {}
+    PassManager([check_access_kinds, StrengthReduction, check_access_kinds]).run(
+        testee, build_info=build_info
+    )
+    assert build_info["oir_pipeline"]["analyses"]["computed"]["access_kinds"] == 2
+
+
+def test_fast_math_pipeline():
+    assert StrengthReduction in DefaultPipeline().steps
+    steps = DefaultPipeline(fast_math=True).steps
+    assert FastMathStrengthReduction in steps and StrengthReduction not in steps
+    assert DefaultPipeline(fast_math=True) != DefaultPipeline()
+    assert hash(DefaultPipeline(fast_math=True)) != hash(DefaultPipeline())
+
+
+def test_numerical_equivalence():
+    def definition(
+        x: gtscript.Field[np.float64],
+        exact: gtscript.Field[np.float64],
+        fast: gtscript.Field[np.float64],
+    ):
+        with computation(PARALLEL), interval(...):
+            exact = x ** 1 + x ** 0 + 1.0 / x + x / 8.0
+            fast = x ** 2 + x ** -1 + x ** 3 + x ** 0.5 + x ** 1.5 + x ** -2 + x / 3.0
+
+    def run(oir_pipeline):
+        stencil = gtscript.stencil("gtc:numpy", definition, oir_pipeline=oir_pipeline)
+        shape = (5, 5, 5)
+        x = gt_storage.from_array(
+            np.random.default_rng(0).uniform(0.1, 10.0, shape),
+            backend="gtc:numpy",
+            default_origin=(0, 0, 0),
+        )
+        exact, fast = (
+            gt_storage.zeros(
+                backend="gtc:numpy", default_origin=(0, 0, 0), shape=shape, dtype=np.float64
+            )
+            for _ in range(2)
+        )
+        stencil(x, exact, fast)
+        return np.asarray(exact), np.asarray(fast)
+
+    reference = run(DefaultPipeline(skip=[StrengthReduction]))
+    reduced = run(DefaultPipeline())
+    fast_math = run(DefaultPipeline(fast_math=True))
+
+    np.testing.assert_array_equal(reduced[0], reference[0])
+    np.testing.assert_array_equal(reduced[1], reference[1])
+    np.testing.assert_array_equal(fast_math[0], reference[0])
+    np.testing.assert_allclose(fast_math[1], reference[1], rtol=1e-14)
@@ -14,17 +14,24 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gtc import oir
+from gtc import common, oir
 from gtc.passes.oir_optimizations.temporaries import (
     LocalTemporariesToScalars,
+    TemporaryBufferSharing,
+    TemporaryDimensionReduction,
     WriteBeforeReadTemporariesToScalars,
 )
+from gtc.passes.oir_optimizations.utils import compute_fields_extents
 
 from ...oir_utils import (
     AssignStmtFactory,
+    FieldDeclFactory,
     HorizontalExecutionFactory,
+    LiteralFactory,
+    MaskStmtFactory,
     StencilFactory,
     TemporaryFactory,
+    VerticalLoopFactory,
 )
 
 
@@ -100,3 +107,248 @@ def test_write_before_read_temporaries_to_scalars():
     assert not isinstance(hexec1.body[0].right, oir.ScalarAccess)
     assert isinstance(hexec1.body[1].left, oir.ScalarAccess)
     assert isinstance(hexec1.body[2].right, oir.ScalarAccess)
+
+
+def test_temporary_buffer_sharing():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp1", right__name="inp"
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out1", right__name="tmp1", right__offset__i=1
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp2", right__name="inp"
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out2", right__name="tmp2", right__offset__i=1
+                )
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryBufferSharing().visit(testee)
+    assert [decl.name for decl in transformed.declarations] == ["tmp1"]
+    accesses = transformed.iter_tree().if_isinstance(oir.FieldAccess).getattr("name").to_set()
+    assert "tmp2" not in accesses
+    assert transformed.vertical_loops[3].sections[0].horizontal_executions[0].body[
+        0
+    ].right.offset == common.CartesianOffset(i=1, j=0, k=0)
+
+
+def test_temporary_buffer_sharing_different_extents():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=common.LoopOrder.FORWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp1", right__name="a"),
+                    AssignStmtFactory(left__name="out1", right__name="tmp1"),
+                ],
+            ),
+            VerticalLoopFactory(
+                loop_order=common.LoopOrder.BACKWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp2", right__name="b"),
+                    AssignStmtFactory(left__name="out2", right__name="tmp2", right__offset__i=3),
+                ],
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryBufferSharing().visit(testee)
+    assert len(transformed.declarations) == 2
+    api_fields = {param.name for param in testee.params}
+    fields_extents = compute_fields_extents(testee)
+    transformed_fields_extents = compute_fields_extents(transformed)
+    assert all(transformed_fields_extents[name] == fields_extents[name] for name in api_fields)
+
+
+def test_temporary_buffer_sharing_overlapping_lifetimes():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp1", right__name="inp"
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp2", right__name="inp"
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out", right__name="tmp1"
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="out", right__name="tmp2"
+                )
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryBufferSharing().visit(testee)
+    assert transformed == testee
+
+
+def test_temporary_buffer_sharing_same_loop():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(body__0=AssignStmtFactory(left__name="tmp1")),
+            HorizontalExecutionFactory(body__0=AssignStmtFactory(right__name="tmp1")),
+            HorizontalExecutionFactory(body__0=AssignStmtFactory(left__name="tmp2")),
+            HorizontalExecutionFactory(body__0=AssignStmtFactory(right__name="tmp2")),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryBufferSharing().visit(testee)
+    assert len(transformed.declarations) == 2
+
+
+def test_temporary_buffer_sharing_different_dtypes():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(left__name="tmp1")
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(right__name="tmp1")
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp2",
+                    left__dtype=common.DataType.FLOAT64,
+                    right__dtype=common.DataType.FLOAT64,
+                )
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    right__name="tmp2",
+                    left__dtype=common.DataType.FLOAT64,
+                    right__dtype=common.DataType.FLOAT64,
+                )
+            ),
+        ],
+        declarations=[
+            TemporaryFactory(name="tmp1"),
+            TemporaryFactory(name="tmp2", dtype=common.DataType.FLOAT64),
+        ],
+    )
+    transformed = TemporaryBufferSharing().visit(testee)
+    assert len(transformed.declarations) == 2
+
+
+def test_temporary_dimension_reduction_column():
+    testee = StencilFactory(
+        params=[
+            FieldDeclFactory(name="k_field", dimensions=(False, False, True)),
+            FieldDeclFactory(name="out"),
+        ],
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp", right__name="k_field"),
+                    AssignStmtFactory(left__name="constant", right=LiteralFactory()),
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="out", right__name="tmp", right__offset__i=1),
+                    AssignStmtFactory(left__name="out", right__name="constant"),
+                ]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp"), TemporaryFactory(name="constant")],
+    )
+    transformed = TemporaryDimensionReduction().visit(testee)
+    assert {decl.name: decl.dimensions for decl in transformed.declarations} == {
+        "tmp": (False, False, True),
+        "constant": (False, False, True),
+    }
+
+
+def test_temporary_dimension_reduction_horizontally_varying():
+    testee = StencilFactory(
+        params=[
+            FieldDeclFactory(name="k_field", dimensions=(False, False, True)),
+            FieldDeclFactory(name="ijk_field"),
+            FieldDeclFactory(name="out"),
+        ],
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="varying", right__name="ijk_field"),
+                    AssignStmtFactory(left__name="dependent", right__name="varying"),
+                    MaskStmtFactory(
+                        body=[AssignStmtFactory(left__name="masked", right__name="k_field")]
+                    ),
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="out", right__name="varying"),
+                    AssignStmtFactory(left__name="out", right__name="dependent"),
+                    AssignStmtFactory(left__name="out", right__name="masked"),
+                ]
+            ),
+        ],
+        declarations=[
+            TemporaryFactory(name="varying"),
+            TemporaryFactory(name="dependent"),
+            TemporaryFactory(name="masked"),
+        ],
+    )
+    transformed = TemporaryDimensionReduction().visit(testee)
+    assert transformed == testee
+
+
+def test_temporary_dimension_reduction_plane():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=common.LoopOrder.FORWARD,
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(
+                        body=[
+                            AssignStmtFactory(left__name="plane"),
+                            AssignStmtFactory(left__name="vertical"),
+                        ]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[
+                            AssignStmtFactory(right__name="plane", right__offset__i=1),
+                            AssignStmtFactory(right__name="vertical", right__offset__k=-1),
+                        ]
+                    ),
+                ],
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="parallel")]),
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="parallel")]),
+                ],
+            ),
+        ],
+        declarations=[
+            TemporaryFactory(name="plane"),
+            TemporaryFactory(name="vertical"),
+            TemporaryFactory(name="parallel"),
+        ],
+    )
+    transformed = TemporaryDimensionReduction().visit(testee)
+    assert {decl.name: decl.dimensions for decl in transformed.declarations} == {
+        "plane": (True, True, False),
+        "vertical": (True, True, True),
+        "parallel": (True, True, True),
+    }
@@ -16,6 +16,7 @@
 
 import pytest
 
+from eve.memoization import analysis_scope
 from gt4py.definitions import Extent
 from gtc import common
 from gtc.common import DataType
@@ -24,6 +25,7 @@ from gtc.passes.oir_optimizations.utils import (
     AccessCollector,
     GeneralAccess,
     compute_extents,
+    compute_fields_extents,
     compute_horizontal_block_extents,
 )
 
@@ -117,6 +119,54 @@ def test_stencil_extents_simple():
     assert block_extents[id(hexecs[1])] == Extent((0, 0), (0, 0))
 
 
+def test_stencil_extents_memoized_on_equal_tree():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="tmp", right__name="input", right__offset__i=1)]
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="output", right__name="tmp", right__offset__i=1)]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    other = testee.copy(deep=True)
+    assert other == testee and other is not testee
+
+    with analysis_scope() as cache:
+        compute_horizontal_block_extents(testee)
+        block_extents = compute_horizontal_block_extents(other)
+    assert cache.info()["hits"] == 1
+
+    hexecs = other.vertical_loops[0].sections[0].horizontal_executions
+    assert block_extents[id(hexecs[0])] == Extent((0, 1), (0, 0))
+    assert block_extents[id(hexecs[1])] == Extent((0, 0), (0, 0))
+
+
+def test_access_collector_result_not_shared():
+    testee = HorizontalExecutionFactory(
+        body=[AssignStmtFactory(left__name="output", right__name="input")]
+    )
+    AccessCollector.apply(testee).ordered_accesses().clear()
+
+    assert AccessCollector.apply(testee).fields() == {"input", "output"}
+
+
+def test_analyses_of_modified_tree_are_recomputed():
+    testee = HorizontalExecutionFactory(
+        body=[AssignStmtFactory(left__name="output", right__name="input")]
+    )
+    stencil = StencilFactory(vertical_loops__0__sections__0__horizontal_executions=[testee])
+    with analysis_scope():
+        assert AccessCollector.apply(testee).fields() == {"input", "output"}
+        assert set(compute_fields_extents(stencil)) == {"input", "output"}
+
+        testee.body[0].right.name = "other"
+        assert AccessCollector.apply(testee).fields() == {"other", "output"}
+        assert set(compute_fields_extents(stencil)) == {"other", "output"}
+
+
 def test_access_overlap_along_axis():
     assert _overlap_along_axis((0, 0), common.HorizontalInterval.compute_domain()) == (0, 0)
     assert _overlap_along_axis(
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from gtc.common import AxisBound, LevelMarker, LoopOrder
+from gtc.oir import KCache
+from gtc.passes.oir_optimizations.vertical_loop_merging import (
+    AdjacentLoopMerging,
+    DependencyAwareLoopMerging,
+)
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    IntervalFactory,
+    KCacheFactory,
+    StencilFactory,
+    VerticalLoopFactory,
+)
+
+
+def test_adjacent_loop_merging_merges_caches():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__interval=IntervalFactory(
+                    end=AxisBound(level=LevelMarker.START, offset=1)
+                ),
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="bar")
+                ],
+                caches=[KCacheFactory(name="foo", fill=False, flush=True)],
+            ),
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__interval=IntervalFactory(
+                    start=AxisBound(level=LevelMarker.START, offset=1)
+                ),
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="foo", right__offset__k=-1)
+                ],
+                caches=[KCacheFactory(name="foo", fill=True, flush=False)],
+            ),
+        ]
+    )
+    transformed = AdjacentLoopMerging().visit(testee)
+    assert len(transformed.vertical_loops) == 1
+    caches = transformed.vertical_loops[0].caches
+    assert len(caches) == 1
+    assert isinstance(caches[0], KCache) and caches[0].fill and caches[0].flush
+
+
+def test_dependency_aware_loop_merging_reorders_independent_loops():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="inp")
+                ]
+            ),
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="bar", right__name="bar", right__offset__k=-1)
+                ],
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="baz", right__name="foo", right__offset__i=1)
+                ]
+            ),
+        ]
+    )
+    transformed = DependencyAwareLoopMerging().visit(testee)
+    assert len(transformed.vertical_loops) == 2
+    merged, other = transformed.vertical_loops
+    assert merged.loop_order == LoopOrder.PARALLEL and other.loop_order == LoopOrder.FORWARD
+    horizontal_executions = merged.sections[0].horizontal_executions
+    assert [he.body[0].left.name for he in horizontal_executions] == ["foo", "baz"]
+
+
+def test_dependency_aware_loop_merging_stops_at_dependent_loops():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="inp")
+                ]
+            ),
+            VerticalLoopFactory(
+                loop_order=LoopOrder.FORWARD,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="bar", right__name="foo", right__offset__k=-1)
+                ],
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="baz", right__name="bar")
+                ]
+            ),
+        ]
+    )
+    transformed = DependencyAwareLoopMerging().visit(testee)
+    assert len(transformed.vertical_loops) == 3
+
+
+@pytest.mark.parametrize(
+    ["loop_order", "read_offset", "mergeable"],
+    [
+        (LoopOrder.PARALLEL, (1, 0, 0), True),
+        (LoopOrder.PARALLEL, (0, 0, 1), False),
+        (LoopOrder.FORWARD, (0, 0, -1), True),
+        (LoopOrder.FORWARD, (0, 0, 1), False),
+        (LoopOrder.BACKWARD, (0, 0, 1), True),
+        (LoopOrder.BACKWARD, (0, 0, -1), False),
+    ],
+)
+def test_dependency_aware_loop_merging_read_after_write(loop_order, read_offset, mergeable):
+    i, j, k = read_offset
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=loop_order,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="inp")
+                ],
+            ),
+            VerticalLoopFactory(
+                loop_order=loop_order,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(
+                        left__name="bar",
+                        right__name="foo",
+                        right__offset__i=i,
+                        right__offset__j=j,
+                        right__offset__k=k,
+                    )
+                ],
+            ),
+        ]
+    )
+    transformed = DependencyAwareLoopMerging().visit(testee)
+    assert len(transformed.vertical_loops) == (1 if mergeable else 2)
+
+
+@pytest.mark.parametrize(
+    ["loop_order", "read_offset", "mergeable"],
+    [
+        (LoopOrder.PARALLEL, (0, 0, 0), True),
+        (LoopOrder.PARALLEL, (1, 0, 0), False),
+        (LoopOrder.FORWARD, (0, 0, 1), True),
+        (LoopOrder.FORWARD, (0, 0, -1), False),
+        (LoopOrder.BACKWARD, (0, 0, -1), True),
+        (LoopOrder.BACKWARD, (1, 0, 1), False),
+    ],
+)
+def test_dependency_aware_loop_merging_write_after_read(loop_order, read_offset, mergeable):
+    i, j, k = read_offset
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                loop_order=loop_order,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(
+                        left__name="bar",
+                        right__name="foo",
+                        right__offset__i=i,
+                        right__offset__j=j,
+                        right__offset__k=k,
+                    )
+                ],
+            ),
+            VerticalLoopFactory(
+                loop_order=loop_order,
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="foo", right__name="inp")
+                ],
+            ),
+        ]
+    )
+    transformed = DependencyAwareLoopMerging().visit(testee)
+    assert len(transformed.vertical_loops) == (1 if mergeable else 2)
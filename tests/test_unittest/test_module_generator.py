@@ -17,7 +17,12 @@
 import numpy as np
 import pytest
 
-from gt4py.backend.module_generator import BaseModuleGenerator, ModuleData, make_args_data_from_gtir
+from gt4py.backend.module_generator import (
+    BaseModuleGenerator,
+    ModuleData,
+    PyExtModuleGenerator,
+    make_args_data_from_gtir,
+)
 from gt4py.definitions import AccessKind, Boundary, FieldInfo, ParameterInfo
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
@@ -97,3 +102,27 @@ def test_module_data():
 
     assert module_data.parameter_info["used_scalar"].access == AccessKind.READ
     assert module_data.parameter_info["unused_scalar"].access == AccessKind.NONE
+
+
+def test_pyext_bind_members():
+    builder = StencilBuilder(sample_stencil_with_args, backend="gtc:gt:cpu_ifirst")
+    generator = PyExtModuleGenerator()
+    source = generator(
+        args_data=make_args_data_from_gtir(builder.gtir_pipeline),
+        builder=builder,
+        pyext_module_name="sample_pyext",
+        pyext_file_path="sample_pyext.so",
+    )
+    compile(source, "<generated>", "exec")
+
+    # the fields are passed once when binding, the parameters at every call
+    members = generator.generate_class_members()
+    assert "def _bind(self, _domain_, _origin_, *, used_io_field, used_in_field, unused_field)" in (
+        members
+    )
+    assert (
+        "pyext_module.bind_computation(list(_domain_), used_io_field, "
+        "list(_origin_['used_io_field']), used_in_field, list(_origin_['used_in_field']))"
+    ) in members
+    assert "def run(exec_info, *, used_scalar, unused_scalar)" in members
+    assert "run_bound(used_scalar, exec_info)" in members
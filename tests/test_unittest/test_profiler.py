@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import json
+
+import numpy as np
+import pytest
+
+from gt4py import gtscript
+from gt4py import profiler as gt_profiler
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, computation, interval
+
+
+BACKEND = "gtc:numpy"
+
+
+def scale_def(in_field: gtscript.Field[float], out_field: gtscript.Field[float], *, alpha: float):
+    with computation(PARALLEL), interval(...):
+        out_field = alpha * in_field  # noqa: F841
+
+
+@pytest.fixture
+def scale_args():
+    shape = (4, 4, 4)
+    in_field = gt_storage.ones(BACKEND, (0, 0, 0), shape, float)
+    out_field = gt_storage.zeros(BACKEND, (0, 0, 0), shape, float)
+    yield gtscript.stencil(backend=BACKEND, definition=scale_def), in_field, out_field
+
+
+def test_histogram_bin():
+    assert gt_profiler.histogram_bin(0.0) == 0
+    assert gt_profiler.histogram_bin(gt_profiler.HISTOGRAM_BASE) == 0
+    assert gt_profiler.histogram_bin(1.5 * gt_profiler.HISTOGRAM_BASE) == 1
+    assert gt_profiler.histogram_bin(4 * gt_profiler.HISTOGRAM_BASE) == 2
+    assert gt_profiler.histogram_bin(1e9) == gt_profiler.HISTOGRAM_BINS - 1
+
+    timing = gt_profiler.TimingStats()
+    for seconds in (1e-6, 3e-6, 3e-6, 1e-3):
+        timing.add(seconds)
+    assert timing.count == 4 and sum(timing.histogram) == 4
+    assert timing.min == 1e-6 and timing.max == 1e-3
+    assert timing.quantile(0.5) == 4e-6
+    assert timing.quantile(1.0) == 1e-3
+
+
+def test_profiler(scale_args, tmp_path):
+    stencil, in_field, out_field = scale_args
+    assert gt_profiler.active_profiler is None
+
+    with gt_profiler.profile() as profiler:
+        assert gt_profiler.active_profiler is profiler
+        with profiler.region("step"):
+            for _ in range(3):
+                stencil(in_field, out_field, alpha=2.0)
+        stencil.freeze(origin={"in_field": (0, 0, 0), "out_field": (0, 0, 0)}, domain=(4, 4, 4))(
+            in_field=in_field, out_field=out_field, alpha=1.0
+        )
+        stencil.bind(in_field=in_field, out_field=out_field)(alpha=1.0)
+    assert gt_profiler.active_profiler is None
+
+    # not recorded
+    stencil(in_field, out_field, alpha=2.0)
+
+    stats = profiler.stats[stencil._gt_id_]
+    assert stats.name == "scale_def" and stats.backend == BACKEND
+    assert stats.ncalls == 5
+    assert stats.timings["call"].count == 5
+    assert sum(stats.timings["call"].histogram) == 5
+    assert stats.timings["run"].count == 5
+    assert stats.timings["run"].total <= stats.timings["call"].total
+    assert stats.timings["run_cpp"].count == 0
+
+    summary = profiler.summary()
+    assert "scale_def" in summary.splitlines()[2]
+    with pytest.raises(ValueError):
+        profiler.summary(sort_by="total")
+
+    profiler.save_chrome_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as file:
+        events = json.load(file)["traceEvents"]
+    assert [event["name"] for event in events].count("scale_def") == 5
+    assert [event["name"] for event in events].count("scale_def.run") == 5
+    (step,) = [event for event in events if event["cat"] == "region"]
+    calls = [event for event in events if event["cat"] == "call"][:3]
+    assert all(step["ts"] <= call["ts"] and call["dur"] <= step["dur"] for call in calls)
+
+    profiler.clear()
+    assert not profiler.stats and not profiler.events
+
+
+def test_nested_profilers(scale_args):
+    stencil, in_field, out_field = scale_args
+    exec_info = {}
+    with gt_profiler.Profiler(trace=False, max_events=0) as outer:
+        with gt_profiler.Profiler(max_events=1) as inner:
+            stencil(in_field, out_field, alpha=2.0, exec_info=exec_info)
+            stencil(in_field, out_field, alpha=2.0)
+        stencil(in_field, out_field, alpha=2.0)
+
+    assert "call_end_time" in exec_info
+    assert inner.stats[stencil._gt_id_].ncalls == 2
+    assert len(inner.events) == 1 and inner.dropped_events == 3
+    assert outer.stats[stencil._gt_id_].ncalls == 1
+    assert not outer.events and outer.dropped_events == 0
+    np.testing.assert_array_equal(out_field, 2.0)
+
+
+def test_same_named_stencils(scale_args):
+    stencil, in_field, out_field = scale_args
+
+    def scale_def(in_field: gtscript.Field[float], out_field: gtscript.Field[float]):
+        with computation(PARALLEL), interval(...):
+            out_field = 3.0 * in_field  # noqa: F841
+
+    other_stencil = gtscript.stencil(backend=BACKEND, definition=scale_def)
+    with gt_profiler.Profiler() as profiler:
+        stencil(in_field, out_field, alpha=2.0)
+        other_stencil(in_field, out_field)
+        other_stencil(in_field, out_field)
+
+    assert len(profiler.stats) == 2
+    assert profiler.stats[stencil._gt_id_].ncalls == 1
+    assert profiler.stats[other_stencil._gt_id_].ncalls == 2
+    assert all(stats.name == "scale_def" for stats in profiler.stats.values())
+    assert len([line for line in profiler.summary().splitlines() if "scale_def" in line]) == 2
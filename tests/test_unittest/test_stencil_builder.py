@@ -15,7 +15,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import numpy
+import pytest
 
+import gt4py.config
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 from gt4py.stencil_object import StencilObject
@@ -122,3 +124,48 @@ def test_regression_run_analysis_twice(tmp_path):
     ir = builder.implementation_ir
     # this raises an error if the analysis pipeline is reevaluated:
     assert ir is builder.implementation_ir
+
+
+def test_ir_cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(gt4py.config.cache_settings, "dir_name", str(tmp_path))
+    monkeypatch.setitem(gt4py.config.cache_settings, "ir_cache", True)
+
+    def make_builder():
+        return (
+            StencilBuilder(simple_stencil)
+            .with_backend("gtc:numpy")
+            .with_externals({"a": 1.0})
+            .with_options(name="simple_stencil", module="test_ir_cache", build_info={})
+        )
+
+    builder = make_builder()
+    gtir = builder.gtir
+    npir = builder.backend.npir
+    ir_dir = builder.caching.root_path / gt4py.config.cache_settings["ir_dir_name"]
+    assert len(list(ir_dir.iterdir())) == 4
+    build_info = builder.options.build_info
+    assert build_info["ir_cache_hit"] is False
+    oir_pipeline_info = build_info["oir_pipeline"]
+
+    # a new build of the same stencil should load the cached IRs
+    builder = make_builder()
+    monkeypatch.setattr(builder.backend, "_make_npir", lambda: pytest.fail("npir regenerated"))
+    assert builder.gtir == gtir
+    assert builder.gtir_pipeline.full() is builder.gtir
+    assert builder.backend.npir == npir
+    # with the build info of the cached IRs
+    build_info = builder.options.build_info
+    assert build_info["ir_cache_hit"] is True
+    assert build_info["oir_pipeline"] == oir_pipeline_info
+
+    # unreadable cache entries should be regenerated
+    for path in ir_dir.iterdir():
+        path.write_bytes(b"invalid")
+    builder = make_builder()
+    assert builder.gtir == gtir
+    assert builder.backend.npir == npir
+
+    # a modified stencil should not use the cached IRs
+    builder = make_builder().with_externals({"a": 2.0})
+    assert builder.gtir != gtir
+    assert len(list(ir_dir.iterdir())) == 7
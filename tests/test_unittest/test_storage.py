@@ -13,6 +13,8 @@
 # distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
+import warnings
+
 import hypothesis as hyp
 import hypothesis.strategies as hyp_st
 import numpy as np
@@ -170,6 +172,320 @@ def test_allocate_cpu(param_dict):
     assert field.shape == shape
 
 
+def test_cpu_memory_pool():
+    pool = gt_storage_utils.CPUMemoryPool(max_bytes=4096, min_bytes=1024)
+    assert not pool.accepts(512)
+    assert pool.accepts(2000)
+
+    memory = pool.allocate(2000, 64)
+    assert memory.dtype == np.uint8 and memory.nbytes >= 2000
+    address = memory.ctypes.data
+
+    # buffers are not reused while any array is using them
+    view = memory[:1600].view(np.float64)[10:]
+    del memory
+    assert pool.info()["in_use_buffers"] == 1
+    assert pool.allocate(2000, 64).ctypes.data != address
+
+    del view
+    assert pool.info()["in_use_buffers"] == 0
+    assert pool.info()["free_buffers"] == 2
+    assert pool.allocate(1990, 64).ctypes.data == address
+    assert pool.info()["hits"] == 1
+
+    # different size classes and alignments are not mixed
+    pool.allocate(2000, 32)
+    pool.allocate(4000, 64)
+    assert pool.info()["hits"] == 1
+
+    # unused buffers are discarded above the size limit
+    pool.allocate(4000, 64)
+    pool.allocate(4000, 64)
+    assert pool.info()["free_bytes"] <= pool.max_bytes
+    assert pool.info()["discarded"] > 0
+    pool.max_bytes = 0
+    assert pool.info()["free_buffers"] == 0
+
+
+def test_storage_memory_pool(monkeypatch):
+    pool = gt_storage_utils.CPUMemoryPool(max_bytes=1024 ** 2, min_bytes=0)
+    monkeypatch.setattr(gt_storage_utils, "cpu_memory_pool", pool)
+
+    storage = gt_store.ones("gtc:numpy", (1, 1, 0), (10, 10, 10), np.float64)
+    address = storage.ctypes.data
+    view = storage[1:, 1:, :]
+    del storage
+    assert pool.info()["free_buffers"] == 0
+    assert (view == 1).all()
+
+    del view
+    assert pool.info()["free_buffers"] == 1
+    storage = gt_store.zeros("gtc:numpy", (1, 1, 0), (10, 10, 10), np.float64)
+    assert storage.ctypes.data == address
+    assert (storage == 0).all()
+    assert pool.info()["hits"] == 1
+
+
+def test_storage_memory_pool_no_aliasing(monkeypatch):
+    pool = gt_storage_utils.CPUMemoryPool(max_bytes=64 * 1024 ** 2)
+    monkeypatch.setattr(gt_storage_utils, "cpu_memory_pool", pool)
+
+    storages = [gt_store.empty("gtc:numpy", (0, 0, 0), (64, 64, 64), np.float64) for _ in range(3)]
+    for value, storage in enumerate(storages):
+        storage[...] = value
+    storages.append(gt_store.zeros("gtc:numpy", (0, 0, 0), (64, 64, 64), np.float64))
+    assert pool.info()["in_use_buffers"] == len(storages)
+    for i, storage in enumerate(storages):
+        assert all(not np.shares_memory(storage, other) for other in storages[i + 1 :])
+    assert [storage[0, 0, 0] for storage in storages] == [0, 1, 2, 0]
+
+    del storages[1:]
+    storage = gt_store.ones("gtc:numpy", (0, 0, 0), (64, 64, 64), np.float64)
+    assert pool.info()["hits"] == 1
+    assert not np.shares_memory(storage, storages[0])
+    assert (storages[0] == 0).all() and (storage == 1).all()
+
+
+@pytest.mark.parametrize("num_threads", [1, 3, 16])
+def test_parallel_fill(num_threads):
+    array = np.empty(10000, dtype=np.float32)
+    gt_storage_utils.parallel_fill(array, 2.0, num_threads=num_threads)
+    assert (array == 2.0).all()
+
+    array = np.empty((5, 7, 9))
+    data = np.random.randn(5, 7, 9)
+    for axis in (None, 0, 1, 2):
+        gt_storage_utils.parallel_fill(array, data, num_threads=num_threads, axis=axis)
+        assert (array == data).all()
+        gt_storage_utils.parallel_fill(array, data[:1, :, :1], num_threads, axis=axis)
+        assert (array == data[:1, :, :1]).all()
+
+
+def test_static_blocks():
+    blocks = gt_storage_utils.static_blocks(10, 4)
+    assert blocks == [slice(0, 3), slice(3, 6), slice(6, 8), slice(8, 10)]
+    assert gt_storage_utils.static_blocks(2, 4) == [slice(0, 1), slice(1, 2)]
+    assert gt_storage_utils.static_blocks(0, 4) == []
+
+
+def test_outer_domain_axis():
+    from gt4py.backend.gt_backends import make_mc_layout_map, make_x86_layout_map
+
+    outer_domain_axis = gt_storage_utils.outer_domain_axis
+    assert outer_domain_axis(make_x86_layout_map((True, True, True))) == 0
+    assert outer_domain_axis(make_mc_layout_map((True, True, True))) == 1
+    assert outer_domain_axis(make_x86_layout_map((False, True, True))) == 0
+    assert outer_domain_axis(make_x86_layout_map((True, True, True, True))) == 0
+    assert outer_domain_axis(make_x86_layout_map((False, False, False, True))) is None
+
+
+@pytest.mark.parametrize("first_touch", ["lazy", "parallel"])
+@pytest.mark.parametrize("backend", CPU_BACKENDS)
+def test_first_touch(first_touch, backend):
+    args = (backend, (1, 2, 0), (64, 64, 32), np.float64)
+
+    storage = gt_store.zeros(*args, first_touch=first_touch)
+    assert (storage == 0).all()
+    storage = gt_store.ones(*args, first_touch=first_touch)
+    assert (storage == 1).all()
+    assert storage.is_stencil_view
+
+    data = np.random.randn(64, 64, 32)
+    storage = gt_store.from_array(data, *args, first_touch=first_touch)
+    assert (storage == data).all()
+    data = np.random.randn(64, 32)
+    storage = gt_store.from_array(data, *args[:3], mask="IK", first_touch=first_touch)
+    assert (storage == data).all()
+
+    with pytest.raises(ValueError, match="first touch"):
+        gt_store.empty(*args, first_touch="serial")
+
+
+def test_from_array_zero_copy():
+    data = np.random.randn(8, 9, 10)
+    storage = gt_store.from_array(data, "gtc:numpy", (1, 1, 0), copy=False)
+    assert np.shares_memory(storage, data)
+    assert storage.is_stencil_view
+    assert storage.default_origin == (1, 1, 0)
+    storage[1, 1, 1] = 42.0
+    assert data[1, 1, 1] == 42.0
+
+    # masked storages
+    data_2d = np.random.randn(8, 9)
+    storage = gt_store.from_array(data_2d, "gtc:numpy", (0, 0), mask="IJ", copy=False)
+    assert np.shares_memory(storage, data_2d)
+    assert storage.mask == (True, True, False)
+
+    # the data is copied if the layout does not match
+    with pytest.raises(ValueError, match="strides"):
+        gt_store.from_array(np.asfortranarray(data), "gtc:numpy", (0, 0, 0), copy=False)
+    with pytest.warns(RuntimeWarning, match="strides"):
+        storage = gt_store.from_array(np.asfortranarray(data), "gtc:numpy", (0, 0, 0), copy=None)
+    assert not np.shares_memory(storage, data)
+    assert (storage == data).all()
+
+    with pytest.raises(ValueError, match="data type"):
+        gt_store.from_array(data, "gtc:numpy", (0, 0, 0), dtype=np.float32, copy=False)
+    with pytest.raises(ValueError, match="read-only"):
+        data.flags.writeable = False
+        gt_store.from_array(data, "gtc:numpy", (0, 0, 0), copy=False)
+
+
+def test_from_array_copy_if_needed():
+    data = np.random.randn(8, 9, 10)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        storage = gt_store.from_array(data, "gtc:numpy", (0, 0, 0), copy=None)
+    assert np.shares_memory(storage, data)
+
+    with pytest.warns(RuntimeWarning, match="Copying the data.*first touch policy"):
+        storage = gt_store.from_array(
+            data, "gtc:numpy", (0, 0, 0), first_touch="parallel", copy=None
+        )
+    assert not np.shares_memory(storage, data)
+    assert (storage == data).all()
+
+
+def test_find_zero_copy_incompatibility():
+    buffer = np.empty(8 * 16 + 16, dtype=np.float64)
+    offset = (-buffer.ctypes.data % 64) // 8
+    array = buffer[offset : offset + 8 * 16].reshape(8, 16)[:, :10]
+
+    check = gt_storage_utils.find_zero_copy_incompatibility
+    assert check(array, (0, 0), (0, 1), 64) is None
+    assert "not aligned" in check(array, (0, 1), (0, 1), 64)
+    assert "not aligned" in check(array[:, 1:], (0, 0), (0, 1), 64)
+    assert "layout map" in check(array, (0, 0), (1, 0), 64)
+    assert "strides" in check(array[::3, :], (0, 0), (0, 1), 256)
+
+
+@pytest.mark.parametrize("backend", CPU_BACKENDS)
+def test_memmap(tmp_path, backend):
+    filename = tmp_path / "storage.gt4py"
+    args = (backend, (1, 2, 0), (8, 9, 10), np.float64)
+    reference = gt_store.empty(*args)
+
+    storage = gt_store.memmap(filename, *args)
+    assert isinstance(storage._raw_buffer, np.memmap)
+    assert storage.strides == reference.strides
+    assert storage._is_consistent(reference)
+    data = np.random.randn(8, 9, 10)
+    storage[...] = data
+    storage._raw_buffer.flush()
+    del storage
+
+    loaded = gt_store.load(filename)
+    assert loaded.backend == backend
+    assert loaded.default_origin == (1, 2, 0)
+    assert loaded.mask == (True, True, True)
+    assert loaded._is_consistent(reference)
+    assert (loaded == data).all()
+
+
+def test_memmap_stencil(tmp_path):
+    @stencil(backend="gtc:numpy")
+    def copy_stencil(inp: Field[float], out: Field[float]):  # type: ignore
+        with computation(PARALLEL), interval(...):
+            out = inp  # noqa: F841
+
+    inp = gt_store.memmap(tmp_path / "inp.gt4py", "gtc:numpy", (0, 0, 0), (6, 7, 8), float)
+    out = gt_store.memmap(tmp_path / "out.gt4py", "gtc:numpy", (0, 0, 0), (6, 7, 8), float)
+    inp[...] = np.random.randn(6, 7, 8)
+    copy_stencil(inp, out)
+    assert (out == inp).all()
+
+
+def test_save_load(tmp_path):
+    filename = tmp_path / "storage.gt4py"
+    storage = gt_store.from_array(
+        np.random.randn(8, 9), "gtc:numpy", (1, 1), dtype=np.float32, mask="IK"
+    )
+    gt_store.save(filename, storage)
+
+    loaded = gt_store.load(filename)
+    assert loaded.dtype == np.float32
+    assert loaded.mask == (True, False, True)
+    assert loaded.strides == storage.strides
+    assert loaded._is_consistent(storage)
+    assert (loaded == storage).all()
+
+    # read-only and copy-on-write modes
+    with pytest.raises(ValueError):
+        gt_store.load(filename, mode="r")[0, 0] = 1.0
+    loaded = gt_store.load(filename, mode="c")
+    loaded[...] = 0.0
+    assert (gt_store.load(filename) == storage).all()
+
+    # views and storages wrapping other arrays are saved with a new buffer
+    data = np.random.randn(8, 9, 10)
+    gt_store.save(filename, gt_store.from_array(data, "gtc:numpy", (0, 0, 0), copy=False))
+    assert (gt_store.load(filename) == data).all()
+    gt_store.save(filename, storage[1:, :])
+    assert (gt_store.load(filename) == storage[1:, :]).all()
+
+    with pytest.raises(ValueError, match="not a storage file"):
+        filename.write_bytes(b"invalid")
+        gt_store.load(filename)
+
+
+@pytest.mark.parametrize("compression", list(gt_store.checkpoint.COMPRESSIONS))
+def test_checkpoint(tmp_path, compression):
+    filename = tmp_path / "checkpoint.gt4py"
+    storages = {
+        "field": gt_store.from_array(np.random.randn(10, 11, 12), "gtc:numpy", (1, 2, 0)),
+        "surface": gt_store.from_array(
+            np.arange(110, dtype=np.int32).reshape(10, 11), "gtc:numpy", (0, 0), mask="IJ"
+        ),
+    }
+    gt_store.save_checkpoint(
+        filename, storages, compression=compression, chunk_size=1000, num_threads=3
+    )
+    index = gt_store.checkpoint.read_checkpoint_index(filename)
+    assert len(index["storages"]["field"]["chunks"]) == 10
+
+    loaded = gt_store.load_checkpoint(filename)
+    assert set(loaded) == set(storages)
+    for name, storage in storages.items():
+        assert loaded[name].backend == storage.backend
+        assert loaded[name].default_origin == storage.default_origin
+        assert loaded[name].mask == storage.mask
+        assert loaded[name].dtype == storage.dtype
+        assert (loaded[name] == storage).all()
+
+    # restore into storages of another backend
+    loaded = gt_store.load_checkpoint(filename, "gtc:gt:cpu_ifirst", names=["field"])
+    assert list(loaded) == ["field"]
+    assert loaded["field"].backend == "gtc:gt:cpu_ifirst"
+    assert loaded["field"]._is_consistent(
+        gt_store.empty("gtc:gt:cpu_ifirst", (1, 2, 0), (10, 11, 12), np.float64)
+    )
+    assert (loaded["field"] == storages["field"]).all()
+
+    with pytest.raises(KeyError, match="missing"):
+        gt_store.load_checkpoint(filename, names=["missing"])
+
+
+def test_checkpoint_distinct_storages(tmp_path, monkeypatch):
+    pool = gt_storage_utils.CPUMemoryPool(max_bytes=64 * 1024 ** 2)
+    monkeypatch.setattr(gt_storage_utils, "cpu_memory_pool", pool)
+    filename = tmp_path / "checkpoint.gt4py"
+    values = {name: np.full((64, 64, 8), value) for value, name in enumerate("abc")}
+    storages = {
+        name: gt_store.from_array(array, "gtc:numpy", (0, 0, 0)) for name, array in values.items()
+    }
+    gt_store.save_checkpoint(filename, storages)
+    # the buffers of the saved storages are reused by the loaded ones
+    del storages
+
+    loaded = gt_store.load_checkpoint(filename)
+    assert pool.info()["hits"] == len(values)
+    for name, array in values.items():
+        np.testing.assert_array_equal(loaded[name], array)
+        assert all(
+            not np.shares_memory(loaded[name], loaded[other]) for other in values if other != name
+        )
+
+
 @pytest.mark.requires_gpu
 @hyp.given(param_dict=allocation_strategy())
 def test_allocate_gpu(param_dict):
@@ -639,6 +955,22 @@ def test_transpose(backend="gtc:numpy"):
     assert transposed.is_stencil_view
     transposed = np.transpose(stor, axes=(2, 1, 0))
     assert not transposed.is_stencil_view
+    assert not stor.T.is_stencil_view
+
+
+def test_view_stencil_view(backend="gtc:gt:cpu_ifirst"):
+    stor = gt_store.ones(backend, (1, 1, 0), (10, 10, 10), np.float64)
+    assert stor[:, :, :].is_stencil_view
+    assert stor.view().is_stencil_view
+    assert not stor[1:, :, :].is_stencil_view
+    assert not stor[:, :, :][1:].is_stencil_view
+    assert not stor[:, :, 3].is_stencil_view
+    assert stor[:, :, 3].mask == (True, True, False)
+    assert stor[:, :, 3].layout_map == gt_backend.from_name(backend).storage_info["layout_map"](
+        (True, True, False)
+    )
+    # views of views with the parent layout
+    assert stor.view()[:, :, :].view().is_stencil_view
 
 
 @pytest.mark.parametrize("backend", CPU_BACKENDS)